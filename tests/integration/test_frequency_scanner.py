@@ -87,8 +87,8 @@ class TestTetraSignalDetector:
                 mock_sdr.get_device_serial_addresses.return_value = ["00000001"]
 
                 # Mock sample reading
-                mock_samples = np.random.randn(10000) + 1j * np.random.randn(10000)
-                mock_sdr.read_samples.return_value = mock_samples
+                mock_samples = np.random.randint(0, 256, size=20000, dtype=np.uint8)
+                mock_sdr.read_bytes.return_value = mock_samples.tobytes()
 
                 capture = RTLCapture()
                 assert capture.open() is True
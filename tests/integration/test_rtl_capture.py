@@ -8,7 +8,7 @@ from unittest.mock import Mock, MagicMock, patch, PropertyMock
 
 # Import RTLCapture - it handles missing rtlsdr gracefully
 try:
-    from tetraear.signal.capture import RTLCapture
+    from tetraear.signal.capture import RTLCapture, RingCapture
 except ImportError:
     pytest.skip("RTLCapture not available", allow_module_level=True)
 
@@ -85,14 +85,34 @@ class TestRTLCapture:
         """Test reading samples successfully."""
         capture = RTLCapture()
         mock_sdr = MagicMock()
-        mock_samples = np.random.randn(1000) + 1j * np.random.randn(1000)
-        mock_sdr.read_samples.return_value = mock_samples
+        raw = np.random.randint(0, 256, size=2000, dtype=np.uint8)
+        mock_sdr.read_bytes.return_value = raw.tobytes()
         capture.sdr = mock_sdr
         
         result = capture.read_samples(1000)
         assert len(result) == 1000
-        assert np.array_equal(result, mock_samples)
-        mock_sdr.read_samples.assert_called_once_with(1000)
+        assert result.dtype == np.complex64
+        # Same scaling as pyrtlsdr's read_samples
+        expected = (raw[0::2] + 1j * raw[1::2]) / 127.5 - (1 + 1j)
+        assert np.array_equal(result, expected.astype(np.complex64))
+        mock_sdr.read_bytes.assert_called_once_with(2000)
+    
+    def test_read_samples_reuses_buffer(self):
+        """Test reads share one preallocated buffer instead of allocating."""
+        capture = RTLCapture()
+        mock_sdr = MagicMock()
+        mock_sdr.read_bytes.side_effect = [bytes(2000), bytes([255]) * 1000]
+        capture.sdr = mock_sdr
+        
+        first = capture.read_samples(1000)
+        kept = first.copy()
+        second = capture.read_samples(500)
+        assert len(second) == 500
+        assert np.shares_memory(first, second)
+        # The second read overwrote the start of the first; the copy is intact
+        assert np.all(first[:500] == second)
+        assert np.all(first[:500] != kept[:500])
+        assert np.array_equal(first[500:], kept[500:])
     
     def test_read_samples_not_opened(self):
         """Test reading samples when device not opened."""
@@ -104,7 +124,7 @@ class TestRTLCapture:
         """Test handling device errors during read."""
         capture = RTLCapture()
         mock_sdr = MagicMock()
-        mock_sdr.read_samples.side_effect = OSError("access violation")
+        mock_sdr.read_bytes.side_effect = OSError("access violation")
         capture.sdr = mock_sdr
         
         with pytest.raises(RuntimeError):
@@ -177,3 +197,125 @@ class TestRTLCapture:
                 assert capture.sample_rate in [2.4e6, 2.56e6]
         finally:
             capture_module.RTL_SDR_AVAILABLE = original_available
+
+
+@pytest.mark.integration
+class TestRingCapture:
+    """Test RingCapture with a mocked async RTL-SDR stream."""
+
+    def _open(self, capture, buffers, error=None):
+        """Open capture against a mock that streams buffers until cancelled."""
+        import threading
+        import tetraear.signal.capture as capture_module
+        cancelled = threading.Event()
+        streamed = threading.Event()
+
+        def read_bytes_async(callback, num_bytes):
+            if error is not None:
+                raise error
+            for buffer in buffers:
+                callback(buffer, None)
+            streamed.set()
+            cancelled.wait(5)
+
+        original_available = capture_module.RTL_SDR_AVAILABLE
+        try:
+            capture_module.RTL_SDR_AVAILABLE = True
+            with patch.object(capture_module, 'RtlSdr') as mock_rtl:
+                mock_sdr = MagicMock()
+                mock_rtl.return_value = mock_sdr
+                mock_sdr.read_bytes_async.side_effect = read_bytes_async
+                mock_sdr.cancel_read_async.side_effect = cancelled.set
+                assert capture.open() is True
+        finally:
+            capture_module.RTL_SDR_AVAILABLE = original_available
+        if error is None:
+            assert streamed.wait(5)
+        return mock_sdr
+
+    def test_read_samples_in_order(self):
+        """Test buffered chunks are returned in arrival order as complex64."""
+        buffers = [bytes([i * 100]) * 200 for i in range(3)]
+        capture = RingCapture(num_samples=100, num_buffers=4)
+        mock_sdr = self._open(capture, buffers)
+        for i in range(3):
+            result = capture.read_samples()
+            assert len(result) == 100
+            assert result.dtype == np.complex64
+            assert np.all(result == np.complex64((1 + 1j) * (i * 100 / 127.5 - 1)))
+        capture.close()
+        mock_sdr.cancel_read_async.assert_called_once()
+        assert capture.sdr is None
+
+    def test_full_ring_drops_buffers(self):
+        """Test transfers arriving with no free slot are dropped and counted."""
+        buffers = [bytes([i]) * 20 for i in range(5)]
+        capture = RingCapture(num_samples=10, num_buffers=2)
+        self._open(capture, buffers)
+        assert capture.read_samples()[0].real == np.float32(0 / 127.5 - 1)
+        assert capture.read_samples()[0].real == np.float32(1 / 127.5 - 1)
+        assert capture.dropped_buffers == 3
+        capture.close()
+
+    def test_transfers_packed_into_slots(self):
+        """Test USB transfers of any size are packed contiguously into slots."""
+        data = bytes(range(200))
+        buffers = [data[i:i + 30] for i in range(0, 180, 30)]
+        capture = RingCapture(num_samples=40, num_buffers=4, buffer_size=1024)
+        mock_sdr = self._open(capture, buffers)
+        assert mock_sdr.read_bytes_async.call_args[0][1] == 1024
+        lut = (np.arange(256) / 127.5 - 1).astype(np.float32)
+        for start in (0, 80):
+            result = capture.read_samples()
+            assert len(result) == 40
+            assert np.array_equal(result.real, lut[start:start + 80:2])
+            assert np.array_equal(result.imag, lut[start + 1:start + 80:2])
+        # The trailing 10 samples wait for the next transfer
+        with pytest.raises(RuntimeError, match="Timed out"):
+            capture.read_samples(timeout=0.1)
+        assert capture.dropped_buffers == 0
+        capture.close()
+
+    def test_retune_discards_queued_transfers(self):
+        """Test transfers still queued in librtlsdr at a retune are never returned."""
+        from tetraear.signal.capture import ASYNC_TRANSFER_COUNT
+        capture = RingCapture(num_samples=10, num_buffers=4, buffer_size=512)
+        # Two full slots and half of a third before the retune
+        self._open(capture, [bytes([1]) * 10] * 5)
+        capture.set_frequency(392.24e6)
+        # The async callback keeps delivering the queued pre-retune transfers
+        for _ in range(ASYNC_TRANSFER_COUNT):
+            capture._on_bytes(bytes([1]) * 10)
+        for _ in range(4):
+            capture._on_bytes(bytes([2]) * 10)
+        expected = np.float32(2 / 127.5 - 1)
+        for _ in range(2):
+            result = capture.read_samples(timeout=1.0)
+            assert np.all(result.real == expected)
+        with pytest.raises(RuntimeError, match="Timed out"):
+            capture.read_samples(timeout=0.1)
+        capture.close()
+
+    def test_read_samples_chunk_size_mismatch(self):
+        """Test asking for a chunk size other than the ring's is rejected."""
+        capture = RingCapture(num_samples=10, num_buffers=2)
+        self._open(capture, [bytes(20)])
+        with pytest.raises(ValueError, match="10-sample chunks"):
+            capture.read_samples(20)
+        assert len(capture.read_samples(10, timeout=1.0)) == 10
+        capture.close()
+
+    def test_invalid_buffer_size(self):
+        """Test USB transfer sizes librtlsdr cannot use are rejected."""
+        for size in (0, 1000):
+            with pytest.raises(ValueError, match="Invalid USB buffer size"):
+                RingCapture(buffer_size=size)
+
+    def test_stream_error_raises(self):
+        """Test a failed async read surfaces on the next read."""
+        capture = RingCapture(num_samples=10)
+        self._open(capture, [], error=OSError("device lost"))
+        with pytest.raises(RuntimeError, match="stream stopped"):
+            capture.read_samples(timeout=1.0)
+        capture.close()
+
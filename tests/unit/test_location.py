@@ -0,0 +1,185 @@
+"""
+Unit tests for GPS / LIP location parser.
+"""
+
+import pytest
+import numpy as np
+from tetraear.core.location import LocationParser, LIP_BATCH_DTYPE
+
+
+def _lip_message(pdu_type, lat_raw, lon_raw, altitude=0, speed=0, heading=0, length=16):
+    """Build a LIP message with 24-bit signed position fields and a long-report tail."""
+    data = bytes([pdu_type])
+    data += lat_raw.to_bytes(3, 'big', signed=True) + lon_raw.to_bytes(3, 'big', signed=True)
+    data += altitude.to_bytes(2, 'big', signed=True) + speed.to_bytes(2, 'big') + heading.to_bytes(2, 'big')
+    return data.ljust(length, b'\x00')[:length]
+
+
+@pytest.mark.unit
+class TestLocationParser:
+    """Test LocationParser class."""
+
+    def _assert_batch_matches(self, rows):
+        """Check parse_lip_batch against parse_lip_message row by row."""
+        result = LocationParser.parse_lip_batch(np.frombuffer(b''.join(rows), dtype=np.uint8)
+                                                .reshape(len(rows), -1))
+        assert result.dtype == LIP_BATCH_DTYPE
+        assert len(result) == len(rows)
+        for row, record in zip(rows, result):
+            report = LocationParser.parse_lip_message(row)
+            assert record['pdu_type'] == row[0]
+            if report is None:
+                assert not record['valid']
+                continue
+            assert record['valid']
+            assert record['latitude'] == report.latitude
+            assert record['longitude'] == report.longitude
+            assert record['altitude'] == (report.altitude or 0)
+            assert record['speed'] == (report.speed or 0.0)
+            assert record['heading'] == (report.heading or 0)
+        return result
+
+    def test_parse_lip_batch_matches_parse_lip_message(self):
+        """Test batch LIP decoding matches per-message decoding on a mixed batch."""
+        rows = [
+            _lip_message(0x00, 1221360, 489120),                       # short report
+            _lip_message(0x00, -(1 << 22), -(1 << 23)),                # short, range limits
+            _lip_message(0x01, 2000000, -3000000, altitude=-120,
+                         speed=655, heading=359),                      # long report
+            _lip_message(0x01, -5, 7, altitude=32767, speed=65535, heading=65535),
+            _lip_message(0x05, 1221360, 489120),                       # unknown PDU type
+            _lip_message(0x00, (1 << 22) + 1, 0),                      # latitude beyond 90°
+            _lip_message(0x01, -(1 << 22) - 1, 0, altitude=10),        # long, latitude beyond 90°
+        ]
+        result = self._assert_batch_matches(rows)
+        assert result['valid'].tolist() == [True, True, True, True, False, False, False]
+
+    def test_parse_lip_batch_short_rows(self):
+        """Test 10-byte rows decode short reports and reject long ones."""
+        rows = [
+            _lip_message(0x00, 1221360, 489120, length=10),
+            _lip_message(0x01, 1221360, 489120, length=10),
+        ]
+        result = self._assert_batch_matches(rows)
+        assert result['valid'].tolist() == [True, False]
+
+    def test_parse_lip_batch_invalid_shape(self):
+        """Test rows too short for a LIP message are rejected."""
+        with pytest.raises(ValueError, match="Expected"):
+            LocationParser.parse_lip_batch(np.zeros((2, 9), dtype=np.uint8))
+
+    def test_parse_lip_batch_jit_matches_numpy(self):
+        """Test the Numba LIP kernel matches the NumPy fallback on random messages."""
+        pytest.importorskip("numba")
+        from tetraear.core.location import _parse_lip_batch, _parse_lip_batch_numpy
+        rng = np.random.default_rng(0)
+        for length in (10, 16, 20):
+            arr = rng.integers(0, 256, size=(2000, length), dtype=np.uint8)
+            arr[:, 0] = rng.choice([0x00, 0x01, 0x02, 0xFF], size=len(arr))
+            # Latitudes right at and just past the ±90° limit
+            arr[:8, 1:4] = [[0x40, 0, 0], [0xC0, 0, 0], [0x40, 0, 1], [0xBF, 0xFF, 0xFF]] * 2
+            expected = np.zeros(len(arr), dtype=LIP_BATCH_DTYPE)
+            result = np.zeros(len(arr), dtype=LIP_BATCH_DTYPE)
+            _parse_lip_batch_numpy(arr, expected)
+            _parse_lip_batch(arr, result)
+            assert np.array_equal(result, expected)
+
+    @pytest.mark.parametrize("text", [
+        "Lat: 52.2417 Lon: 21.0083",
+        "lat:-33.86 lon 151.2",
+        "52°14'30\"N 21°00'30\"E",
+        "52°14′30.5″S 21°00′30″W",
+        "N52.2417 E021.0083",
+        "S33.86 E151.2",
+        "N٥٢.٢ E٢١.٠",
+        "[GPS] N52.2 E21.0 then Lat: 1.0 Lon: 2.0",
+        "unit 7 at 52°14'30\"N 21°00'30\"E, last N10 E20",
+        "Lat 12 Lon N1 E2 " + "9" * 300,
+        "no coordinates here N-1 E2",
+    ])
+    def test_coordinate_scan_re2_matches_re(self, text):
+        """Test the RE2 coordinate scan finds the same format and span as re."""
+        pytest.importorskip("re2")
+        from tetraear.core.location import _COORD_RE, _COORD_RE2
+        expected = _COORD_RE.search(text)
+        found = _COORD_RE2.search(text)
+        if expected is None:
+            assert found is None
+        else:
+            assert (found.lastgroup, found.span()) == (expected.lastgroup, expected.span())
+
+    @pytest.mark.parametrize("text, expected", [
+        ("Lat: 52.5 Lon: 21.25", (52.5, 21.25)),
+        ("52°30'0\"N 21°15'0\"E", (52.5, 21.25)),
+        ("N52.5 E21.25", (52.5, 21.25)),
+        ("S52.5 W21.25", (-52.5, -21.25)),
+        # Decimal beats DMS and compact, DMS beats compact, wherever they appear
+        ("N10 E20 then Lat: 1.5 Lon: 2.5", (1.5, 2.5)),
+        ("10°0'0\"N 20°0'0\"E Lat: 1.5 Lon: 2.5", (1.5, 2.5)),
+        ("N1 E2 then 10°30'0\"S 20°0'0\"W", (-10.5, -20.0)),
+        # The first match of a format is used
+        ("Lat: 1 Lon: 2 Lat: 3 Lon: 4", (1.0, 2.0)),
+        # An out-of-range match falls through to the next format
+        ("Lat: 95 Lon: 10 and N10 E20", (10.0, 20.0)),
+        ("95°0'0\"N 1°0'0\"E N10 E20", (10.0, 20.0)),
+        ("N95 E20", None),
+    ])
+    def test_parse_coordinates_format_priority(self, text, expected):
+        """Test coordinate formats are tried in a fixed order, not by position."""
+        assert LocationParser.parse_coordinates(text) == expected
+
+    @pytest.mark.parametrize("text", [
+        "lat: 52.1 lon: 21.0",
+        "LAT 52 LON 21",
+        "LaT:-1.5 lOn:2",
+        "52°14'30\"N 21°00'30\"E",
+        "52°14′30″S 21°0′0″W",
+        "N52 E21",
+        "S0 W0",
+        "N٥٢.٢ E٢١.٠",
+        "pos:N52.2417\tE021.0083",
+        "n52.1 e21.0",
+        "N52.2E21.0",
+    ])
+    def test_coordinate_marker_accepts_all_formats(self, text):
+        """Test the prefilter never rejects text one of the formats matches."""
+        from tetraear.core.location import (
+            _has_coordinate_marker, _DECIMAL_RE, _DMS_RE, _COMPACT_RE
+        )
+        if any(pattern.search(text) for pattern in (_DECIMAL_RE, _DMS_RE, _COMPACT_RE)):
+            assert _has_coordinate_marker(text)
+
+    def test_coordinate_marker_random_text(self):
+        """Test the prefilter on random coordinates of every format inside noise."""
+        from tetraear.core.location import (
+            _has_coordinate_marker, _DECIMAL_RE, _DMS_RE, _COMPACT_RE
+        )
+        rng = np.random.default_rng(0)
+
+        def pick(*options):
+            return options[int(rng.integers(len(options)))]
+
+        def number():
+            digits = pick("0123456789", "٠١٢٣٤٥٦٧٨٩")
+            text = ''.join(pick(*digits) for _ in range(int(rng.integers(1, 4))))
+            return text + pick("", ".", "." + pick(*digits))
+
+        def cased(word):
+            return ''.join(c.upper() if rng.integers(2) else c for c in word)
+
+        space = lambda: pick(" ", "\t", "  ", "\u00a0")
+        formats = [
+            lambda: (cased("lat") + pick("", ":") + pick("", space()) + pick("", "-") + number()
+                     + space() + cased("lon") + pick("", ":") + pick("", space()) + number()),
+            lambda: (f"{number()}°{number()}{pick(chr(39), '′')}{number()}{pick(chr(34), '″')}"
+                     f"{pick('N', 'S')}{space()}{number()}°{number()}{pick(chr(39), '′')}"
+                     f"{number()}{pick(chr(34), '″')}{pick('E', 'W')}"),
+            lambda: pick("N", "S") + number() + space() + pick("E", "W") + number(),
+        ]
+        matched = 0
+        for _ in range(3000):
+            text = pick("", "pos ", "[GPS] ", "x1 ") + pick(*formats)() + pick("", " ok", ".")
+            if any(pattern.search(text) for pattern in (_DECIMAL_RE, _DMS_RE, _COMPACT_RE)):
+                matched += 1
+                assert _has_coordinate_marker(text), text
+        assert matched > 2000
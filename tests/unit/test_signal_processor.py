@@ -4,7 +4,7 @@ Unit tests for signal processing module.
 
 import pytest
 import numpy as np
-from tetraear.signal.processor import SignalProcessor
+from tetraear.signal.processor import SignalProcessor, _decimate
 
 
 @pytest.mark.unit
@@ -23,6 +23,14 @@ class TestSignalProcessor:
         processor = SignalProcessor(sample_rate=1.0e6)
         assert processor.sample_rate == 1.0e6
         assert processor.symbol_rate == 18000
+        # 55.56 samples per symbol are resampled to 56 for symbol extraction
+        assert processor.samples_per_symbol == 56
+    
+    def test_processor_invalid_sample_rate(self):
+        """Test impossible sample rates are rejected up front."""
+        for rate in (0, -1.0e6, float('nan'), float('inf')):
+            with pytest.raises(ValueError, match="Invalid sample rate"):
+                SignalProcessor(sample_rate=rate)
     
     def test_resample(self, sample_iq_samples):
         """Test signal resampling."""
@@ -53,6 +61,57 @@ class TestSignalProcessor:
         result = processor.filter_signal(sample_iq_samples, bandwidth=50000)
         assert len(result) == len(sample_iq_samples)
     
+    def test_filter_signal_with_freq_offset(self, sample_iq_samples):
+        """Test mixing inside the filter matches shifting then filtering."""
+        processor = SignalProcessor()
+        samples = np.asarray(sample_iq_samples, dtype=np.complex128)
+        for offset in (0, 1500, -20000):
+            shifted = processor.frequency_shift(samples, offset) if offset else samples
+            expected = processor.filter_signal(shifted)
+            result = processor.filter_signal(samples, freq_offset=offset)
+            assert np.allclose(result, expected, rtol=0, atol=1e-9 * np.max(np.abs(expected)))
+
+    def test_mix_and_filter_jit_matches_numpy(self):
+        """Test the fused Numba mixer/filter matches mixing then sosfiltfilt."""
+        pytest.importorskip("numba")
+        from tetraear.signal.processor import (
+            _mix_and_filter, _mix_and_filter_numpy, _lowpass_sos, _lowpass_zi
+        )
+        rng = np.random.default_rng(0)
+        # Narrow float32 sections round differently in the two cascades, hence
+        # the loose single-precision tolerance
+        for cutoff in (25000 / 2.4e6, 25000 / 240000, 0.5):
+            zi, padlen = _lowpass_zi(cutoff)
+            for length in (padlen + 1, padlen + 2, 2 * padlen + 1, 1000, 5000):
+                samples = rng.standard_normal(length) + 1j * rng.standard_normal(length)
+                for dtype, tolerance in ((np.complex128, 1e-9), (np.complex64, 1e-3)):
+                    x = samples.astype(dtype)
+                    sos = _lowpass_sos(cutoff).astype(x.real.dtype)
+                    for phase_step in (0.0, 0.01, -0.5, 2.0):
+                        expected = _mix_and_filter_numpy(x, sos, zi, padlen, phase_step)
+                        result = _mix_and_filter(x, sos, zi, padlen, phase_step)
+                        assert result.dtype == expected.dtype
+                        np.testing.assert_allclose(result, expected, rtol=0,
+                                                   atol=tolerance * np.max(np.abs(expected)))
+
+    def test_filter_signal_short_input_keeps_freq_offset(self):
+        """Test inputs too short to filter are still frequency shifted."""
+        processor = SignalProcessor()
+        samples = np.exp(1j * np.arange(10) * 0.3)
+        result = processor.filter_signal(samples, freq_offset=1000)
+        assert np.allclose(result, processor.frequency_shift(samples, 1000))
+
+    def test_decimate_passes_band_and_rejects_aliases(self):
+        """Test FIR decimation keeps in-band tones and suppresses aliasing ones."""
+        n = np.arange(24000)
+        in_band = np.exp(2j * np.pi * 5e3 / 2.4e6 * n)
+        alias = np.exp(2j * np.pi * 1.19e6 / 2.4e6 * n)
+        for factor in (7, 8, 10):
+            result = _decimate(in_band + alias, factor)
+            assert len(result) == len(n[::factor])
+            expected = in_band[::factor]
+            assert np.max(np.abs(result - expected)[50:-50]) < 1e-2
+    
     def test_frequency_shift(self, sample_iq_samples):
         """Test frequency shifting."""
         processor = SignalProcessor()
@@ -69,6 +128,31 @@ class TestSignalProcessor:
         # Should return original (or very close)
         assert len(result) == len(sample_iq_samples)
     
+    def test_single_precision_preserved(self, sample_iq_samples):
+        """Test complex64 capture data stays complex64 through the pipeline."""
+        processor = SignalProcessor()
+        samples = np.asarray(sample_iq_samples).astype(np.complex64)
+        assert processor.frequency_shift(samples, 1000).dtype == np.complex64
+        assert processor.filter_signal(samples).dtype == np.complex64
+        processor.process(samples, freq_offset=1000)
+        assert processor.symbols.dtype == np.complex64
+    
+    def test_process_reuses_scratch_without_aliasing(self):
+        """Test repeated process() calls match fresh processors and keep earlier results."""
+        rng = np.random.default_rng(0)
+        chunks = [(rng.standard_normal(n) + 1j * rng.standard_normal(n)).astype(np.complex64)
+                  for n in (60000, 60000, 40000)]
+        for rate in (2.4e6, 1.92e6):
+            processor = SignalProcessor(sample_rate=rate)
+            results = []
+            for chunk in chunks:
+                results.append((processor.process(chunk, freq_offset=500), processor.symbols))
+            assert processor._scratch
+            for chunk, (demodulated, symbols) in zip(chunks, results):
+                fresh = SignalProcessor(sample_rate=rate)
+                assert np.array_equal(fresh.process(chunk, freq_offset=500), demodulated)
+                assert np.array_equal(fresh.symbols, symbols)
+
     def test_demodulate_dqpsk_empty(self):
         """Test DQPSK demodulation with empty samples."""
         processor = SignalProcessor()
@@ -93,6 +177,46 @@ class TestSignalProcessor:
         assert isinstance(result, np.ndarray)
         assert result.dtype == np.uint8
         assert all(0 <= s <= 3 for s in result)
+
+    def test_demodulate_dqpsk_phase_bins(self):
+        """Test phase differences are quantized into the expected symbol bins."""
+        processor = SignalProcessor()
+        transitions = np.array([np.pi / 4, np.pi / 2, -np.pi / 2, -3 * np.pi / 4, np.pi])
+        samples = np.exp(1j * np.concatenate([[0.0], np.cumsum(transitions)]))
+        result = processor.demodulate_dqpsk(samples)
+        assert result.tolist() == [0, 1, 2, 3, 3]
+
+    def test_demodulate_dqpsk_jit_matches_numpy(self):
+        """Test the Numba DQPSK kernel matches the NumPy path, including bin edges."""
+        pytest.importorskip("numba")
+        from tetraear.signal.processor import _demodulate_dqpsk, _demodulate_dqpsk_numpy
+        rng = np.random.default_rng(0)
+        edges = np.pi * np.array([0, 0.5, -0.5, 1, -1, 3 / 8, -3 / 8, 5 / 8, -5 / 8])
+        steps = np.concatenate([rng.uniform(-np.pi, np.pi, 2000),
+                                np.repeat(edges, 3), np.nextafter(edges, 4), np.nextafter(edges, -4)])
+        points = np.array([1, 1j, -1, -1j, 0, -0.0, complex(0.0, -0.0), complex(-0.0, -0.0),
+                           1 + 1j, -1 - 1j, np.inf, -np.inf * 1j, complex(np.nan, 0), 1e-160, 1e160])
+        cases = [np.exp(1j * np.cumsum(steps)), rng.choice(points, 2000), points,
+                 np.tile(points, len(points)), np.repeat(points, 2)]
+        for samples in cases:
+            for dtype in (np.complex128, np.complex64):
+                with np.errstate(over='ignore', invalid='ignore'):
+                    x = samples.astype(dtype)
+                    tiny = np.finfo(x.real.dtype).tiny
+                    expected, expected_in_range = _demodulate_dqpsk_numpy(x, tiny)
+                result, in_range = _demodulate_dqpsk(x, tiny)
+                assert np.array_equal(result, expected)
+                assert in_range == expected_in_range
+    
+    def test_demodulate_dqpsk_scale_invariant(self, sample_iq_samples):
+        """Test symbols do not depend on the signal scale, even near float limits."""
+        processor = SignalProcessor()
+        samples = np.asarray(sample_iq_samples, dtype=np.complex128)
+        expected = processor.demodulate_dqpsk(samples)
+        for scale in (1e-200, 1e-3, 1e3, 1e200):
+            assert np.array_equal(processor.demodulate_dqpsk(samples * scale), expected)
+        assert np.array_equal(processor.demodulate_dqpsk(np.array([0, 1, 2, 0, -1])),
+                              processor.demodulate_dqpsk(np.array([0.0, 0.5, 1.0, 0.0, -0.5])))
     
     def test_extract_symbols_empty(self):
         """Test symbol extraction with empty samples."""
@@ -109,6 +233,21 @@ class TestSignalProcessor:
         assert isinstance(result, np.ndarray)
         assert np.iscomplexobj(result)
     
+    def test_extract_symbols_fractional_rate_no_drift(self):
+        """Test 13.33 samples per symbol yields one sample per symbol without drift."""
+        processor = SignalProcessor()
+        rng = np.random.default_rng(0)
+        steps = rng.choice([np.pi / 4, 3 * np.pi / 4, -np.pi / 4, -3 * np.pi / 4], size=600)
+        n = np.arange(int(600 * 240000 / 18000))
+        samples = np.exp(1j * np.cumsum(steps)[n * 18000 // 240000])
+        result = processor.extract_symbols(samples, sample_rate=240000)
+        assert abs(len(result) - 600) <= 1
+        measured = np.angle(result[1:] * np.conj(result[:-1]))[10:-10]
+        # Every measured step matches the transmitted one at a single alignment
+        errors = [np.max(np.abs(np.angle(np.exp(1j * (measured - steps[k:k + len(measured)])))))
+                  for k in range(8, 14)]
+        assert min(errors) < np.pi / 8
+    
     def test_extract_symbols_custom_rate(self, sample_iq_samples):
         """Test symbol extraction with custom sample rate."""
         processor = SignalProcessor()
@@ -4,6 +4,7 @@ Unit tests for TETRA encryption/decryption module.
 
 import pytest
 import struct
+import numpy as np
 from tetraear.core.crypto import TEADecryptor, TetraKeyManager
 
 
@@ -106,6 +107,43 @@ class TestTEADecryptor:
         result = decryptor.decrypt_block(sample_encrypted_frame)
         assert len(result) == 8
 
+    @pytest.mark.parametrize("algorithm, key_len", [('TEA1', 10), ('TEA2', 16), ('TEA3', 16)])
+    def test_decrypt_batch_matches_decrypt(self, algorithm, key_len):
+        """Test batch decryption matches per-key decryption."""
+        keys = [bytes((i * 37 + j) & 0xFF for j in range(key_len)) for i in range(6)]
+        keys.append(bytes(key_len - 1))  # wrong length -> None
+        data = bytes(range(40))
+        results = TEADecryptor.decrypt_batch(keys, data, algorithm)
+        assert results[-1] is None
+        for key, result in zip(keys[:-1], results[:-1]):
+            assert result == TEADecryptor(key, algorithm).decrypt(data)
+
+    @pytest.mark.parametrize("algorithm, key_len", [('TEA1', 10), ('TEA2', 16)])
+    def test_decrypt_batch_jit_matches_numpy(self, algorithm, key_len):
+        """Test the Numba TEA kernel matches the NumPy fallback and per-key decryption."""
+        pytest.importorskip("numba")
+        from tetraear.core.crypto import _tea_decrypt_batch, _tea_decrypt_batch_numpy
+        rng = np.random.default_rng(0)
+        keys = [rng.bytes(key_len) for _ in range(20)] + [bytes(key_len), b'\xff' * key_len]
+        data = rng.bytes(64) + b'\xff' * 8 + bytes(8)
+        words = np.frombuffer(b''.join(keys), dtype=np.uint8).reshape(len(keys), key_len)
+        if algorithm == 'TEA1':
+            key_words = words[:, :8].copy().view('>u2').astype(np.uint32)
+        else:
+            key_words = words.copy().view('>u4').astype(np.uint32)
+        blocks = np.frombuffer(data, dtype='>u4').astype(np.uint32).reshape(-1, 2)
+        tea1 = algorithm == 'TEA1'
+        assert np.array_equal(_tea_decrypt_batch(key_words, blocks, tea1),
+                              _tea_decrypt_batch_numpy(key_words, blocks, tea1))
+        # decrypt_batch runs the Numba kernel whenever Numba is installed
+        for key, result in zip(keys, TEADecryptor.decrypt_batch(keys, data, algorithm)):
+            assert result == TEADecryptor(key, algorithm).decrypt(data)
+
+    def test_decrypt_batch_invalid_length(self, sample_tea1_key):
+        """Test batch decryption rejects data that is not whole blocks."""
+        with pytest.raises(ValueError, match="multiple of 8"):
+            TEADecryptor.decrypt_batch([sample_tea1_key], bytes(7))
+
 
 @pytest.mark.unit
 class TestTetraKeyManager:
@@ -116,3 +116,93 @@ class TestTetraDecoder:
         decoder = TetraDecoder()
         assert hasattr(decoder, 'SYNC_PATTERN')
         assert len(decoder.SYNC_PATTERN) > 0
+    
+    def test_check_payload_crc_cached(self):
+        """Test CRC results are memoized per payload."""
+        decoder = TetraDecoder()
+        payload = bytes(range(16))
+        bits = np.unpackbits(np.frombuffer(payload, dtype=np.uint8))
+        first = decoder._check_payload_crc(payload, bits)
+        assert payload in decoder._crc_cache
+        assert decoder._check_payload_crc(payload, bits) == first
+        assert len(decoder._crc_cache) == 1
+    
+    def test_decrypt_frame_parallel_matches_sequential(self):
+        """Test parallel key trials pick the same key as a sequential scan."""
+        payload = bytes([0x82]) + b"HELLO WORLD" + bytes(4)
+        results = []
+        for workers in (1, 4):
+            with TetraDecoder(decrypt_workers=workers) as decoder:
+                frame_data = {
+                    'number': 0,
+                    'encryption_algorithm': 'TEA1',
+                    'mac_pdu': {'data': payload},
+                    'bits': [0] * 510,
+                }
+                result = decoder._decrypt_frame(frame_data)
+                results.append((result['best_key'], result['best_score'], result['keys_tried']))
+            assert decoder._executor is None
+        assert results[0] == results[1]
+
+    def test_parallel_scoring_stops_at_early_exit(self):
+        """Test the pool scores at most one window of candidates past an early exit."""
+        decoder = TetraDecoder(decrypt_workers=2)
+        scored = []
+        decoder._score_plaintext = lambda payload: scored.append(payload) or 100
+        jobs = [(bytes(10), f"key_{i}", 'TEA1') for i in range(10)]
+        run = decoder._score_run(jobs, [bytes([i]) * 8 for i in range(10)])
+        assert next(run)[0] == "key_0"
+        run.close()
+        decoder.close()
+        assert len(scored) <= 2
+
+    def test_decrypt_frame_counts_only_tried_keys(self):
+        """Test keys_tried stops counting at the first good score."""
+        decoder = TetraDecoder(decrypt_workers=1)
+        decoder._score_plaintext = lambda payload: 100
+        frame_data = {
+            'number': 0,
+            'encryption_algorithm': 'TEA1',
+            'mac_pdu': {'data': bytes(16)},
+            'bits': [0] * 510,
+        }
+        result = decoder._decrypt_frame(frame_data)
+        assert result['keys_tried'] == 1
+        assert result['best_key'] == "TEA1 common_key_0"
+
+    def test_payload_bits(self):
+        """Test hex payload unpacking to MSB-first bits."""
+        bits = TetraDecoder.payload_bits("A501")
+        assert bits.tolist() == [1, 0, 1, 0, 0, 1, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1]
+    
+    def test_find_sync_reuses_correlations(self):
+        """Test find_sync with precomputed correlations matches a fresh search."""
+        decoder = TetraDecoder()
+        bits = np.zeros(1200, dtype=np.int64)
+        sync_pattern = decoder.sync_patterns['TS1']
+        bits[100:122] = sync_pattern
+        bits[700:722] = sync_pattern
+        correlations = decoder.sync_correlation(bits)
+        assert len(correlations) == len(bits) - 21
+        assert correlations[100] == 1.0
+        for threshold in (0.9, 0.85, 0.8):
+            assert decoder.find_sync(bits, threshold, correlations=correlations) == \
+                decoder.find_sync(bits, threshold)
+        assert decoder.find_sync(bits, 0.95) == [100, 700]
+
+    def test_sync_match_counts_jit_matches_numpy(self):
+        """Test the Numba sync correlator matches the NumPy correlate fallback."""
+        pytest.importorskip("numba")
+        from tetraear.core.decoder import _sync_match_counts, _sync_match_counts_numpy
+        decoder = TetraDecoder()
+        rng = np.random.default_rng(0)
+        for dtype in (np.uint8, np.int64):
+            for pattern in decoder._sync_arrays:
+                pattern = pattern.astype(dtype)
+                for length in (len(pattern), len(pattern) + 1, 510, 4096):
+                    bits = rng.integers(0, 2, size=length).astype(dtype)
+                    bits[:len(pattern)] = pattern
+                    expected = _sync_match_counts_numpy(bits, pattern)
+                    result = _sync_match_counts(bits, pattern)
+                    assert np.array_equal(result, expected)
+                    assert result[0] == len(pattern)
@@ -10,6 +10,24 @@ from tetraear.core.protocol import (
 )
 
 
+def _pack_gsm7(septets, fill_bits=0):
+    """Pack 7-bit codes LSB first (GSM 03.38), after fill_bits zero bits."""
+    value = 0
+    for i, code in enumerate(septets):
+        value |= code << (fill_bits + 7 * i)
+    return value.to_bytes((fill_bits + 7 * len(septets) + 7) // 8, 'little')
+
+
+def _gsm7_codes(text):
+    """GSM 03.38 codes for text, with ESC pairs for extension characters."""
+    basic = {c: i for i, c in enumerate(TetraProtocolParser._GSM7_DEFAULT_ALPHABET)}
+    extension = {c: code for code, c in TetraProtocolParser._GSM7_EXTENSION_TABLE.items()}
+    codes = []
+    for c in text:
+        codes.extend([basic[c]] if c in basic else [0x1B, extension[c]])
+    return codes
+
+
 @pytest.mark.unit
 class TestTetraProtocolParser:
     """Test TetraProtocolParser class."""
@@ -39,7 +57,50 @@ class TestTetraProtocolParser:
         result = parser.parse_burst(symbols, slot_number=0)
         # Result may be None if CRC fails, but should not crash
         assert result is None or isinstance(result, TetraBurst)
-    
+
+    def test_parse_bursts_batch_matches_parse_burst(self):
+        """Test batch burst parsing matches parsing one burst at a time."""
+        rng = np.random.default_rng(0)
+        symbols = rng.integers(0, 4, size=(6, 255))
+        # Row 0: sync burst (continuous sync pattern mid-burst)
+        bits = np.empty(510, dtype=np.int64)
+        bits[0::2] = symbols[0] >> 1
+        bits[1::2] = symbols[0] & 1
+        bits[255:277] = TetraProtocolParser.SYNC_CONTINUOUS_DOWNLINK
+        symbols[0] = bits[0::2] * 2 + bits[1::2]
+        # Row 1: normal burst carrying a valid CRC
+        bits[0::2] = symbols[1] >> 1
+        bits[1::2] = symbols[1] & 1
+        data = np.concatenate([bits[0:108], bits[122:230]])
+        data[-16:] = TetraProtocolParser()._calculate_crc16(data[:-16])
+        bits[0:108], bits[122:230] = data[:108], data[108:]
+        symbols[1] = bits[0::2] * 2 + bits[1::2]
+
+        single = TetraProtocolParser()
+        batch = TetraProtocolParser()
+        expected = [single.parse_burst(row, slot_number=i % 4) for i, row in enumerate(symbols)]
+        result = batch.parse_bursts_batch(symbols, [i % 4 for i in range(6)])
+
+        assert result[0].burst_type == BurstType.Synchronization
+        assert result[1].crc_ok is True
+        assert len(result) == len(expected)
+        for a, b in zip(expected, result):
+            assert a.burst_type == b.burst_type
+            assert a.crc_ok == b.crc_ok
+            assert a.slot_number == b.slot_number
+            assert np.array_equal(a.training_sequence, b.training_sequence)
+            assert np.array_equal(a.data_bits, b.data_bits)
+        assert single.stats == batch.stats
+
+    def test_parse_bursts_batch_slot_count_mismatch(self):
+        """Test a slot number list of the wrong length is rejected, not truncated."""
+        parser = TetraProtocolParser()
+        symbols = np.zeros((3, 255), dtype=np.int64)
+        for slot_numbers in ([0, 1], [0, 1, 2, 3]):
+            with pytest.raises(ValueError, match="Expected 3 slot numbers"):
+                parser.parse_bursts_batch(symbols, slot_numbers)
+        assert parser.stats['total_bursts'] == 0
+
     def test_detect_burst_type(self):
         """Test burst type detection."""
         parser = TetraProtocolParser()
@@ -90,6 +151,15 @@ class TestTetraProtocolParser:
         # Convert numpy bool to Python bool
         assert isinstance(bool(result), bool)
     
+    def test_check_crc_reversed_retry_opt_in(self):
+        """Test a CRC over the reversed payload only passes with try_reversed_crc."""
+        parser = TetraProtocolParser()
+        payload = np.random.default_rng(3).integers(0, 2, size=200)
+        bits = np.concatenate([payload, parser._calculate_crc16(payload[::-1])])
+        assert parser._check_crc(bits) is False
+        parser.try_reversed_crc = True
+        assert parser._check_crc(bits) is True
+
     def test_calculate_crc16(self):
         """Test CRC-16 calculation."""
         parser = TetraProtocolParser()
@@ -98,6 +168,19 @@ class TestTetraProtocolParser:
         assert len(crc) == 16
         assert all(bit in [0, 1] for bit in crc)
     
+    def test_crc16_value_check_string(self):
+        """Test table-driven CRC-16 matches the CCITT check value and a bitwise reference."""
+        parser = TetraProtocolParser()
+        bits = np.unpackbits(np.frombuffer(b"123456789", dtype=np.uint8))
+        assert parser._crc16_value(bits) == 0x29B1
+        # Partial trailing byte is shifted in bit by bit
+        bits = np.array([1, 0, 1, 1, 0, 0, 1, 0, 1, 1, 1])
+        crc = 0xFFFF
+        for bit in bits:
+            crc ^= int(bit) << 15
+            crc = ((crc << 1) ^ 0x1021 if crc & 0x8000 else crc << 1) & 0xFFFF
+        assert parser._crc16_value(bits) == crc
+    
     def test_parse_mac_pdu_insufficient_bits(self):
         """Test parsing MAC PDU with insufficient bits."""
         parser = TetraProtocolParser()
@@ -154,3 +237,104 @@ class TestTetraProtocolParser:
         parser.parse_burst(symbols, slot_number=0)
         # Stats should be updated (even if burst parsing fails)
         assert parser.stats['total_bursts'] >= initial_bursts
+
+    @pytest.mark.parametrize("text", [
+        "Cost 5€ {ok} [x]",
+        "€{}[]~|^\\\f",
+        "@£$¥ Δ_ ÄÖÑÜ§ äöñüà",
+    ])
+    def test_unpack_gsm7bit_escape_characters(self, text):
+        """Test GSM 7-bit text with extension characters round-trips."""
+        parser = TetraProtocolParser()
+        codes = _gsm7_codes(text)
+        assert parser._unpack_gsm7bit(_pack_gsm7(codes), septet_count=len(codes)) == text
+
+    def test_unpack_gsm7bit_lone_and_unmapped_escapes(self):
+        """Test a trailing ESC and ESC before an unmapped code decode to nothing."""
+        parser = TetraProtocolParser()
+        ok = _gsm7_codes("OK")
+        assert parser._unpack_gsm7bit(_pack_gsm7(ok + [0x1B]), septet_count=3) == "OK"
+        # 0x41 ('A') has no extension character; ESC ESC neither
+        codes = _gsm7_codes("A") + [0x1B, 0x41] + _gsm7_codes("B") + [0x1B, 0x1B] + _gsm7_codes("C")
+        assert parser._unpack_gsm7bit(_pack_gsm7(codes), septet_count=len(codes)) == "ABC"
+
+    def test_unpack_gsm7bit_matches_septet_loop(self):
+        """Test table-driven GSM 7-bit decoding matches a septet-by-septet decode."""
+        parser = TetraProtocolParser()
+        rng = np.random.default_rng(5)
+        for _ in range(200):
+            codes = rng.integers(0, 128, size=int(rng.integers(1, 40)))
+            codes[rng.random(len(codes)) < 0.2] = 0x1B
+            skip = int(rng.integers(0, 7))
+            expected, escaped = [], False
+            for code in codes:
+                if escaped:
+                    expected.append(parser._GSM7_EXTENSION_TABLE.get(int(code), ""))
+                    escaped = False
+                elif code == 0x1B:
+                    escaped = True
+                else:
+                    expected.append(parser._GSM7_DEFAULT_ALPHABET[code])
+            data = _pack_gsm7([int(c) for c in codes], fill_bits=skip)
+            result = parser._unpack_gsm7bit(data, septet_count=len(codes), skip_bits=skip)
+            assert result == "".join(expected)
+
+    def test_unpack_gsm7bit_with_concatenation_udh(self):
+        """Test text behind a concatenated-SMS UDH starts after the fill bits."""
+        parser = TetraProtocolParser()
+        udh = bytes([0x05, 0x00, 0x03, 0x2A, 0x02, 0x01])  # ref 0x2A, part 1 of 2
+        text = "Meet at gate 4 {B}"
+        codes = _gsm7_codes(text)
+        # 48 header bits plus 1 fill bit: the text starts at septet 7
+        packed = bytearray(_pack_gsm7(codes, fill_bits=49))
+        packed[:len(udh)] = udh
+        data = bytes(packed)
+        assert parser._udh_layout(data, 7 + len(codes)) == (49, len(codes))
+        assert parser._unpack_gsm7bit_with_udh(data, septet_count=7 + len(codes)) == text
+        assert parser._unpack_gsm7bit_with_udh(data).rstrip("@") == text
+        assert text in list(parser._gsm7_candidates(data, [(0, None)]))
+        sds = bytes([0x07, 0x00, 7 + len(codes)]) + data
+        assert parser.parse_sds_data(sds) == f"[SDS-GSM] {text}"
+
+    def test_best_gsm7_candidate_regression(self):
+        """Test the early-exit candidate choice matches scoring every candidate."""
+        parser = TetraProtocolParser()
+
+        def layouts(data):
+            count = data[2]
+            max_septets = ((len(data) - 3) * 8) // 7
+            return ([(3, count)] if 0 < count <= min(160, max_septets) else []) + [(3, None), (2, None)]
+
+        def reference(data):
+            # Every candidate scored in order; the first strictly best one wins
+            payload_3, payload_2 = data[3:], data[2:]
+            candidates = []
+            if (3, data[2]) in layouts(data):
+                candidates += [parser._unpack_gsm7bit(payload_3, septet_count=data[2]),
+                               parser._unpack_gsm7bit_with_udh(payload_3, septet_count=data[2])]
+            candidates += [parser._unpack_gsm7bit(payload_3), parser._unpack_gsm7bit_with_udh(payload_3),
+                           parser._unpack_gsm7bit(payload_2), parser._unpack_gsm7bit_with_udh(payload_2)]
+            best, best_score = "", 0.0
+            for text in candidates:
+                text = text.strip("\x00").strip()
+                if text and parser._score_text(text) > best_score:
+                    best, best_score = text, parser._score_text(text)
+            return best
+
+        # The unbounded decode of the same septets adds a padding '@' and scores close
+        codes = _gsm7_codes("UNIT 12 AT GATE")
+        data = bytes([0x07, 0x00, len(codes)]) + _pack_gsm7(codes)
+        unbounded = parser._unpack_gsm7bit(data[3:]).strip()
+        assert unbounded != "UNIT 12 AT GATE" and parser._score_text(unbounded) > 2.0
+        best = parser._best_gsm7_candidate(parser._gsm7_candidates(data, layouts(data)))
+        assert best == reference(data) == "UNIT 12 AT GATE"
+        assert parser.parse_sds_data(data) == "[SDS-GSM] UNIT 12 AT GATE"
+
+        rng = np.random.default_rng(11)
+        for _ in range(300):
+            text = ''.join(rng.choice(list("ABCDEFGHIJ KLMNOP 0123456789 .,!?@{}€"),
+                                      size=int(rng.integers(1, 30))))
+            codes = _gsm7_codes(text)
+            count = int(rng.choice([len(codes), 0, int(rng.integers(0, 200))]))
+            data = bytes([0x07, 0x00, count & 0xFF]) + _pack_gsm7(codes, fill_bits=int(rng.integers(0, 8)))
+            assert parser._best_gsm7_candidate(parser._gsm7_candidates(data, layouts(data))) == reference(data)
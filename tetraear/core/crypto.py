@@ -17,10 +17,89 @@ Example:
 
 import struct
 import logging
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Sequence
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Optional JIT acceleration for batch decryption
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Below this many (key, block) pairs the per-block Python path beats NumPy call overhead
+BATCH_MIN_BLOCKS = 16
+
+_TEA_DELTA = 0x9e3779b9
+
+
+def _tea_decrypt_batch_numpy(key_words: np.ndarray, blocks: np.ndarray, tea1: bool) -> np.ndarray:
+    """
+    Decrypt every block under every key (ECB), vectorized over (key, block) pairs.
+    
+    key_words is (K, 4) uint32 (TEA1: first four 16-bit words, TEA2: 32-bit words),
+    blocks is (B, 2) uint32. Returns (K, B, 2) uint32.
+    """
+    # One row per key, one column per block; uint32 arithmetic wraps like the & 0xFFFFFFFF masks
+    v0 = np.repeat(blocks[None, :, 0], len(key_words), axis=0)
+    v1 = np.repeat(blocks[None, :, 1], len(key_words), axis=0)
+    sums = [(_TEA_DELTA * (32 - r)) & 0xFFFFFFFF for r in range(33)]
+    
+    if tea1:
+        # The (key word + sum) terms only depend on the round, so compute them up front
+        sum_arr = np.array(sums, dtype=np.uint32)
+        k1_terms = (key_words[:, (sum_arr[:32] >> 11) & 3] + sum_arr[:32])[:, :, None]
+        k0_terms = (key_words[:, sum_arr[1:] & 3] + sum_arr[1:])[:, :, None]
+        for r in range(32):
+            v1 -= (((v0 << 4) ^ (v0 >> 5) ^ np.uint32(sums[r])) + v0) ^ k1_terms[:, r]
+            v0 -= (((v1 << 4) ^ (v1 >> 5) ^ np.uint32(sums[r + 1])) + v1) ^ k0_terms[:, r]
+    else:
+        k0, k1, k2, k3 = (key_words[:, i][:, None] for i in range(4))
+        for r in range(32):
+            v1 -= ((v0 << 4) + k2) ^ (v0 + np.uint32(sums[r])) ^ ((v0 >> 5) + k3)
+            v0 -= ((v1 << 4) + k0) ^ (v1 + np.uint32(sums[r + 1])) ^ ((v1 >> 5) + k1)
+    
+    return np.stack([v0, v1], axis=-1)
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True, boundscheck=False)
+    def _tea_decrypt_batch(key_words, blocks, tea1):
+        """Decrypt every block under every key (JIT, keys split across cores)."""
+        mask = 0xFFFFFFFF
+        n_keys = key_words.shape[0]
+        n_blocks = blocks.shape[0]
+        out = np.empty((n_keys, n_blocks, 2), np.uint32)
+        for k in prange(n_keys):
+            kw0 = np.int64(key_words[k, 0])
+            kw1 = np.int64(key_words[k, 1])
+            kw2 = np.int64(key_words[k, 2])
+            kw3 = np.int64(key_words[k, 3])
+            kw = (kw0, kw1, kw2, kw3)
+            for b in range(n_blocks):
+                v0 = np.int64(blocks[b, 0])
+                v1 = np.int64(blocks[b, 1])
+                sum_val = np.int64((_TEA_DELTA * 32) & mask)
+                for _ in range(32):
+                    if tea1:
+                        v1 = (v1 - (((((v0 << 4) ^ (v0 >> 5) ^ sum_val) + v0) & mask)
+                                    ^ ((kw[(sum_val >> 11) & 3] + sum_val) & mask))) & mask
+                        sum_val = (sum_val - _TEA_DELTA) & mask
+                        v0 = (v0 - (((((v1 << 4) ^ (v1 >> 5) ^ sum_val) + v1) & mask)
+                                    ^ ((kw[sum_val & 3] + sum_val) & mask))) & mask
+                    else:
+                        v1 = (v1 - ((((v0 << 4) + kw2) ^ (v0 + sum_val) ^ ((v0 >> 5) + kw3)) & mask)) & mask
+                        sum_val = (sum_val - _TEA_DELTA) & mask
+                        v0 = (v0 - ((((v1 << 4) + kw0) ^ (v1 + sum_val) ^ ((v1 >> 5) + kw1)) & mask)) & mask
+                out[k, b, 0] = v0
+                out[k, b, 1] = v1
+        return out
+else:
+    _tea_decrypt_batch = _tea_decrypt_batch_numpy
+
 
 class TEADecryptor:
     """
@@ -266,6 +345,64 @@ class TEADecryptor:
                 prev_block = block
             
             return decrypted
+    
+    @classmethod
+    def decrypt_batch(cls, keys: Sequence[bytes], data: bytes,
+                      algorithm: str = 'TEA1') -> List[Optional[bytes]]:
+        """
+        Decrypt the same data under many keys at once (ECB mode).
+        
+        Equivalent to ``TEADecryptor(key, algorithm).decrypt(data)`` for each
+        key, but the rounds run over every (key, block) pair at once: a
+        Numba kernel parallel across keys when Numba is installed, NumPy
+        uint32 operations otherwise. Useful for bruteforcing candidate keys.
+        
+        Args:
+            keys: Candidate keys
+            data: Encrypted data (must be multiple of 8 bytes)
+            algorithm: Algorithm variant ('TEA1', 'TEA2', 'TEA3', 'TEA4')
+        
+        Returns:
+            Decrypted data per key, in the order of ``keys``. Entries are None
+            for keys whose length does not match the algorithm.
+        
+        Raises:
+            ValueError: If algorithm is unknown or data length is not multiple of 8 bytes
+        
+        Example:
+            >>> keys = [bytes(10), bytes.fromhex('00112233445566778899')]
+            >>> plaintexts = TEADecryptor.decrypt_batch(keys, encrypted_data, 'TEA1')
+        """
+        algorithm = algorithm.upper()
+        key_bits = cls.KEY_LENGTHS.get(algorithm)
+        if key_bits is None:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+        if len(data) % 8 != 0:
+            raise ValueError("Data length must be multiple of 8 bytes")
+        
+        key_len = key_bits // 8
+        results: List[Optional[bytes]] = [None] * len(keys)
+        valid = [i for i, key in enumerate(keys) if len(key) == key_len]
+        if not valid:
+            return results
+        if not NUMBA_AVAILABLE and len(valid) * (len(data) // 8) < BATCH_MIN_BLOCKS:
+            for i in valid:
+                results[i] = cls(keys[i], algorithm).decrypt(data)
+            return results
+        
+        key_arr = np.frombuffer(b''.join(keys[i] for i in valid), dtype=np.uint8).reshape(len(valid), key_len)
+        blocks = np.frombuffer(data, dtype='>u4').astype(np.uint32).reshape(-1, 2)
+        if algorithm == 'TEA1':
+            # Five 16-bit key words; the round indexes only the first four
+            key_words = key_arr[:, :8].copy().view('>u2').astype(np.uint32)
+        else:
+            # TEA2 (TEA3/TEA4 share the TEA2 round function here)
+            key_words = key_arr.copy().view('>u4').astype(np.uint32)
+        
+        out = _tea_decrypt_batch(key_words, blocks, algorithm == 'TEA1').astype('>u4')
+        for row, i in enumerate(valid):
+            results[i] = out[row].tobytes()
+        return results
 
 
 class TetraKeyManager:
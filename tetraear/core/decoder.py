@@ -5,6 +5,11 @@ TETRA frame decoder module.
 import numpy as np
 from bitstring import BitArray
 import logging
+import threading
+from collections import OrderedDict, deque
+from itertools import groupby, islice
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from tetraear.core.crypto import TEADecryptor, TetraKeyManager
@@ -12,25 +17,142 @@ from tetraear.core.protocol import TetraProtocolParser, TetraBurst, MacPDU, Call
 
 logger = logging.getLogger(__name__)
 
+# Optional JIT acceleration for bit-level kernels
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Upper bounds for the per-decoder candidate result caches (LRU eviction).
+CRC_CACHE_SIZE = 1024
+SDS_CACHE_SIZE = 2048
+
+# Default number of threads used to score candidate keys. Decryption is batched,
+# so the pool only runs pure-Python scoring under the GIL: sequential is faster.
+DEFAULT_DECRYPT_WORKERS = 1
+
+
+# Lookup table for first payload bytes that look like common TETRA traffic headers
+_TETRA_SYNC_LUT = bytes(1 if i in (0x01, 0x02, 0x03, 0x04, 0x05, 0x08, 0x0A, 0x0C) else 0 for i in range(256))
+
+# 8-PSK symbol (0-7) to QPSK symbol (0-3), merging neighbours for noise tolerance
+_PSK8_TO_QPSK = np.array([0, 0, 0, 1, 1, 3, 2, 2], dtype=np.int64)
+
+
+def _sync_match_counts_numpy(bits: np.ndarray, pattern: np.ndarray) -> np.ndarray:
+    """Count bits equal to pattern at every offset (ones vs ones + zeros vs zeros)."""
+    pattern = pattern.astype(np.int32)
+    return (np.correlate((bits == 1).astype(np.int32), pattern, mode='valid')
+            + np.correlate((bits == 0).astype(np.int32), 1 - pattern, mode='valid'))
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _sync_match_counts(bits, pattern):
+        """Count bits equal to pattern at every offset (JIT, offsets split across cores)."""
+        plen = pattern.shape[0]
+        n = bits.shape[0] - plen + 1
+        out = np.empty(n, np.int32)
+        for i in prange(n):
+            count = 0
+            for j in range(plen):
+                if bits[i + j] == pattern[j]:
+                    count += 1
+            out[i] = count
+        return out
+else:
+    _sync_match_counts = _sync_match_counts_numpy
+
+
+# Sentinel for cache misses where None is a valid cached value
+_MISSING = object()
+
+
+class _LRUCache:
+    """Small thread-safe LRU mapping used to memoize per-payload results."""
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key, default=None):
+        """Return the cached value for key (marking it recently used) or default."""
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                return default
+            self._data.move_to_end(key)
+            return value
+    
+    def put(self, key, value):
+        """Store value for key, evicting the least recently used entry when full."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def __contains__(self, key):
+        return key in self._data
+    
+    def __len__(self):
+        return len(self._data)
+
 
 class TetraDecoder:
-    """Decodes TETRA frames from demodulated symbols."""
+    """
+    Decodes TETRA frames from demodulated symbols.
     
-    def __init__(self, key_manager: Optional[TetraKeyManager] = None, auto_decrypt: bool = True):
+    Candidate keys are scored sequentially by default. ``decrypt_workers`` > 1
+    scores them on a thread pool, which only pays off when scoring releases the
+    GIL (a nogil kernel); the pure-Python scorer is faster sequentially. A
+    decoder that started a pool should be closed, or used as a context manager.
+    """
+    
+    # MAC encryption mode -> (assumed algorithm, description)
+    # 1=Class 2 (usually TEA1, sometimes TEA2), 2=Class 3 (usually TEA2, sometimes TEA3/4),
+    # 3=Reserved (assume TEA3/4)
+    ENCRYPTION_MODES = {
+        1: ('TEA1', 'Class 2 (SCK)'),
+        2: ('TEA2', 'Class 3 (DCK)'),
+        3: ('TEA3', 'Reserved'),
+    }
+    
+    def __init__(self, key_manager: Optional[TetraKeyManager] = None, auto_decrypt: bool = True,
+                 decrypt_workers: Optional[int] = None):
         """
         Initialize TETRA decoder.
         
         Args:
             key_manager: Optional key manager for decryption
             auto_decrypt: Automatically try common keys if no key manager provided
+            decrypt_workers: Threads used to score candidate keys (default 1 = sequential)
         """
         # TETRA frame structure constants
         self.SYNC_PATTERN = [0, 1, 0, 1, 1, 0, 0, 1, 1, 1, 0, 0, 0, 1, 0, 0,
                             1, 0, 1, 1, 0, 0, 1, 1, 1, 0, 0, 0, 1, 0, 0]
         self.FRAME_LENGTH = 510  # bits per frame
+        # Standard 22-bit training sequences searched by find_sync
+        self.sync_patterns = {
+            'TS1': np.array([1, 1, 0, 1, 0, 0, 0, 0, 1, 1, 1, 0, 1, 0, 0, 1, 1, 1, 0, 1, 0, 0]),
+            'TS2': np.array([0, 1, 1, 1, 1, 0, 1, 0, 0, 1, 0, 0, 0, 0, 1, 1, 0, 1, 1, 1, 0, 0]) # Example TS2
+        }
+        self.SYNC_LENGTH = 22  # bits per training sequence
+        self.TS_OFFSET = 216  # training sequence start within the burst (bit 216 = symbol 108)
+        self.FRAME_SYMBOLS = self.FRAME_LENGTH // 2  # 255 symbols per frame
+        # Training sequences in the dtype symbols_to_bits produces, so correlating needs no casts
+        self._sync_arrays = [pattern.astype(np.int64) for pattern in self.sync_patterns.values()]
         self.key_manager = key_manager
         self.auto_decrypt = auto_decrypt
         self.protocol_parser = TetraProtocolParser()  # Add protocol parser
+        # Results for candidate plaintexts (BYPASS and cross-tries often repeat payloads)
+        self._crc_cache = _LRUCache(CRC_CACHE_SIZE)
+        self._sds_cache = _LRUCache(SDS_CACHE_SIZE)
+        self.decrypt_workers = max(1, decrypt_workers or DEFAULT_DECRYPT_WORKERS)
+        self._executor = None
+        self._thread_state = threading.local()
         self._setup_common_keys()
     
     def _setup_common_keys(self):
@@ -95,9 +217,22 @@ class TetraDecoder:
                 bytes.fromhex('FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF'),
             ]
         }
+        self._prepare_common_keys()
         logger.debug(f"Auto-decrypt enabled with {sum(len(v) for v in self.common_keys.values())} common keys (OpenEar style)")
         self.user_keys = []  # Additional keys loaded from file
     
+    def _prepare_common_keys(self):
+        """Prebuild (key, description[, algorithm]) tuples for the bruteforce key list."""
+        self._prepared_common_keys = {
+            alg: [(key, f"{alg} common_key_{idx}") for idx, key in enumerate(keys)]
+            for alg, keys in self.common_keys.items()
+        }
+        # Cross-algorithm tries only use the first 5 keys of each algorithm
+        self._prepared_cross_keys = {
+            alg: [(key, f"{alg} common_key_{idx} (cross-try)", alg) for idx, key in enumerate(keys[:5])]
+            for alg, keys in self.common_keys.items()
+        }
+    
     def set_keys(self, keys):
         """
         Set user-provided encryption keys for bruteforce attempts.
@@ -142,33 +277,55 @@ class TetraDecoder:
         Convert demodulated symbols to bits (2 bits per symbol).
         Handles both 0-7 (8-PSK) and 0-3 (π/4-DQPSK) input formats.
         """
-        bits = []
-        mapped_symbols = []
+        symbols = np.asarray(symbols)
+        if len(symbols) == 0:
+            return np.array([]), np.array([])
         
         # Check if symbols are already in 0-3 format (π/4-DQPSK)
-        max_symbol = np.max(symbols) if len(symbols) > 0 else 0
+        max_symbol = np.max(symbols)
         is_dqpsk = max_symbol <= 3
         
-        for s in symbols:
-            if is_dqpsk:
-                # Already in 0-3 format (π/4-DQPSK) - pass through
-                # Symbols 0-3 directly represent the bit pairs
-                val = int(s) & 0x3  # Ensure it's in range 0-3
-            else:
-                # Map 0-7 (8-PSK) to 0-3 (QPSK)
-                # Handle neighbors for noise tolerance
-                if s in [0, 1, 2]: val = 0   # 00
-                elif s in [3, 4]: val = 1    # 01
-                elif s in [5]: val = 3       # 11
-                elif s in [6, 7]: val = 2    # 10
-                else: val = 0
-            
-            mapped_symbols.append(val)
-            bits.extend([val >> 1, val & 1])
-            
-        return np.array(bits), np.array(mapped_symbols)
+        symbol_ints = symbols.astype(np.int64)
+        if is_dqpsk:
+            # Already in 0-3 format (π/4-DQPSK) - pass through
+            # Symbols 0-3 directly represent the bit pairs
+            mapped_symbols = symbol_ints & 0x3  # Ensure it's in range 0-3
+        else:
+            # Map 0-7 (8-PSK) to 0-3 (QPSK); anything out of range maps to 0
+            in_range = (symbol_ints >= 0) & (symbol_ints <= 7)
+            mapped_symbols = np.where(in_range, _PSK8_TO_QPSK[np.clip(symbol_ints, 0, 7)], 0)
+        
+        bits = np.empty(2 * len(mapped_symbols), dtype=np.int64)
+        bits[0::2] = mapped_symbols >> 1
+        bits[1::2] = mapped_symbols & 1
+        return bits, mapped_symbols
+    
+    def sync_correlation(self, bits):
+        """
+        Correlate the bit stream against the training sequences at every offset.
+        
+        Args:
+            bits: Bit stream to search
+        
+        Returns:
+            Array with the best (TS1/TS2) match ratio (0.0-1.0) per bit offset,
+            empty if the stream is shorter than a training sequence
+        """
+        if not isinstance(bits, np.ndarray):
+            bits = np.array(bits)
+        if len(bits) < self.SYNC_LENGTH:
+            return np.zeros(0)
+        
+        bits = np.ascontiguousarray(bits)
+        best_matches = None
+        for pattern in self._sync_arrays:
+            if pattern.dtype != bits.dtype:
+                pattern = pattern.astype(bits.dtype)
+            matches = _sync_match_counts(bits, pattern)
+            best_matches = matches if best_matches is None else np.maximum(best_matches, matches)
+        return best_matches / self.SYNC_LENGTH
     
-    def find_sync(self, bits, threshold=0.85, return_max_corr=False):
+    def find_sync(self, bits, threshold=0.85, return_max_corr=False, correlations=None):
         """
         Find TETRA synchronization pattern (Training Sequence 1).
         
@@ -176,87 +333,22 @@ class TetraDecoder:
             bits: Bit stream to search
             threshold: Correlation threshold (0.0-1.0)
             return_max_corr: If True, return (sync_positions, max_corr) tuple
+            correlations: Optional precomputed result of sync_correlation(bits),
+                so several thresholds can be tried without re-correlating
         
         Returns:
             sync_positions list, or (sync_positions, max_corr) if return_max_corr=True
         """
-        sync_positions = []
-        # Training Sequence 1 (from TetraProtocolParser)
-        # [0, 1, 1, 0, 1, 0, 0, 1, 1, 1, 0, 0, 1, 1]
-        # Converted to bits (assuming 0->00, 1->01? No, these are likely bits)
-        # Standard TS1 is 22 bits.
-        # Let's use a known TS1 bit pattern: 1101000011101001110100
-        # Or try to match what TetraProtocolParser uses.
-        
-        # Let's use the pattern from TetraProtocolParser but expanded to bits
-        # If parser uses [0, 1...], let's assume they are bits.
-        ts1_bits = [0, 1, 1, 0, 1, 0, 0, 1, 1, 1, 0, 0, 1, 1] # 14 bits? Too short.
-        
-        # Let's use the standard 22-bit TS1
-        self.sync_patterns = {
-            'TS1': np.array([1, 1, 0, 1, 0, 0, 0, 0, 1, 1, 1, 0, 1, 0, 0, 1, 1, 1, 0, 1, 0, 0]),
-            'TS2': np.array([0, 1, 1, 1, 1, 0, 1, 0, 0, 1, 0, 0, 0, 0, 1, 1, 0, 1, 1, 1, 0, 0]) # Example TS2
-        }
-        
-        if len(bits) < 22:
-            if return_max_corr:
-                return sync_positions, 0.0
-            return sync_positions
-        
-        # Check every bit position (step=1) to ensure we don't miss sync
-        # Use numpy for faster correlation if possible
+        if correlations is None:
+            correlations = self.sync_correlation(bits)
         
-        # Convert bits to numpy array if not already
-        if not isinstance(bits, np.ndarray):
-            bits = np.array(bits)
-            
-        # Sliding window correlation
-        # Create a view of sliding windows
-        # shape: (num_windows, window_size)
-        sync_len = 22
-        num_windows = len(bits) - sync_len + 1
-        if num_windows <= 0:
+        if len(correlations) == 0:
             if return_max_corr:
-                return sync_positions, 0.0
-            return sync_positions
-            
-        # Simple loop is safer and easier to debug than stride_tricks for now
-        # Optimization: only check if first few bits match to avoid full correlation
+                return [], 0.0
+            return []
         
-        i = 0
-        max_corr = 0.0
-        # Track all correlations to find best positions
-        all_correlations = []
-        
-        while i < num_windows:
-            pos = i
-            found_sync = False
-
-            # Try both TS1 and TS2
-            best_corr_at_pos = 0.0
-            for _name, pattern in self.sync_patterns.items():
-                window = bits[pos:pos + sync_len]
-                match_count = np.sum(window == pattern)
-                correlation = match_count / sync_len
-
-                best_corr_at_pos = max(best_corr_at_pos, correlation)
-                max_corr = max(max_corr, correlation)
-
-                if correlation >= threshold:
-                    sync_positions.append(pos)
-                    found_sync = True
-                    break
-
-            # Track correlation at each position for adaptive threshold
-            if best_corr_at_pos > 0:
-                all_correlations.append((pos, best_corr_at_pos))
-
-            if found_sync:
-                # Skip ahead to avoid duplicate detections (at least half a frame).
-                i = pos + 250  # TETRA frame is ~510 bits
-                continue
-
-            i += 1
+        max_corr = float(np.max(correlations))
+        sync_positions = self._select_sync_positions(correlations, threshold)
         
         # If no syncs found but we have a good max correlation close to threshold, use adaptive threshold
         # This prevents dropping frames when max_corr is just below the threshold (e.g., 0.8182 vs 0.85)
@@ -267,33 +359,36 @@ class TetraDecoder:
             # Allow up to 0.02 tolerance below threshold if max_corr is close
             adaptive_threshold = max(0.75, max_corr - 0.02)  # 2% tolerance
             if adaptive_threshold < threshold:
-                # Re-search with adaptive threshold - use stored correlations to avoid re-computation
-                sync_positions = []
-                seen_positions = set()
-                for pos, corr in all_correlations:
-                    if corr >= adaptive_threshold and pos not in seen_positions:
-                        sync_positions.append(pos)
-                        seen_positions.add(pos)
-                        # Mark nearby positions as seen to avoid duplicates
-                        for nearby in range(max(0, pos - 250), min(num_windows, pos + 250)):
-                            seen_positions.add(nearby)
-
+                sync_positions = self._select_sync_positions(correlations, adaptive_threshold)
                 used_adaptive = bool(sync_positions)
         
         if not sync_positions:
-            logger.debug(f"No sync found at threshold {threshold:.4f}. Max correlation: {max_corr:.4f}")
+            logger.debug("No sync found at threshold %.4f. Max correlation: %.4f", threshold, max_corr)
         elif used_adaptive and adaptive_threshold is not None:
             logger.debug(
-                f"Found {len(sync_positions)} syncs at adaptive threshold {adaptive_threshold:.4f} "
-                f"(max: {max_corr:.4f}, original: {threshold:.4f})"
+                "Found %d syncs at adaptive threshold %.4f (max: %.4f, original: %.4f)",
+                len(sync_positions), adaptive_threshold, max_corr, threshold,
             )
         else:
-            logger.debug(f"Found {len(sync_positions)} syncs at threshold {threshold:.4f}. Max correlation: {max_corr:.4f}")
+            logger.debug("Found %d syncs at threshold %.4f. Max correlation: %.4f",
+                         len(sync_positions), threshold, max_corr)
         
         if return_max_corr:
             return sync_positions, max_corr
         return sync_positions
     
+    @staticmethod
+    def _select_sync_positions(correlations, threshold):
+        """Pick offsets at or above threshold, skipping ~half a frame after each hit."""
+        sync_positions = []
+        next_allowed = 0
+        for pos in np.flatnonzero(correlations >= threshold):
+            if pos >= next_allowed:
+                sync_positions.append(int(pos))
+                # Skip ahead to avoid duplicate detections (TETRA frame is ~510 bits)
+                next_allowed = pos + 250
+        return sync_positions
+    
     def decode_frame(self, bits, start_pos, symbols=None):
         """
         Decode a TETRA frame starting at given position.
@@ -447,7 +542,7 @@ class TetraDecoder:
                                 # Threshold: if >70% unique bytes, likely encrypted
                                 if entropy_ratio > 0.7 and total_bytes > 8:
                                     # High entropy - likely encrypted despite flag
-                                    logger.debug(f"Frame {frame_number}: High entropy ({entropy_ratio:.2f}) suggests encryption despite clear flag")
+                                    logger.debug("Frame %s: High entropy (%.2f) suggests encryption despite clear flag", frame_number, entropy_ratio)
                                     encrypted = True
                                     frame_data['encrypted'] = True
                                     frame_data["encryption_suspected"] = True
@@ -456,7 +551,7 @@ class TetraDecoder:
                                     encrypted = False
                                     frame_data['encrypted'] = False
                                     frame_data['encryption_algorithm'] = None
-                                    logger.debug(f"Frame {frame_number}: Low entropy ({entropy_ratio:.2f}) confirms clear mode")
+                                    logger.debug("Frame %s: Low entropy (%.2f) confirms clear mode", frame_number, entropy_ratio)
                                     # Medium entropy can still indicate encryption on some networks (or partially decoded payloads).
                                     if entropy_ratio > 0.55 and total_bytes > 8:
                                         frame_data["encryption_suspected"] = True
@@ -540,12 +635,13 @@ class TetraDecoder:
             frame_data["encryption_algorithm"] = "TEA1"
         if should_try_decrypt and (self.key_manager or self.auto_decrypt):
             frame_data = self._decrypt_frame(frame_data)
+            decrypted_raw = frame_data.pop('_decrypted_bytes_raw', None)
             
             # If decryption successful, try to parse SDS again with decrypted data
             if frame_data.get('decrypted') and 'decrypted_bytes' in frame_data:
                 try:
                     # Create a temporary MacPDU with decrypted data
-                    decrypted_bytes = bytes.fromhex(frame_data['decrypted_bytes'])
+                    decrypted_bytes = decrypted_raw or bytes.fromhex(frame_data['decrypted_bytes'])
                     
                     # Use protocol parser to handle SDS data properly
                     sds_text = self.protocol_parser.parse_sds_data(decrypted_bytes)
@@ -611,7 +707,7 @@ class TetraDecoder:
         if payload_bytes is None:
             payload_bits = frame_data['bits'][32:]
             try:
-                payload_bytes = BitArray(payload_bits).tobytes()
+                payload_bytes = np.packbits(np.asarray(payload_bits, dtype=np.uint8)).tobytes()
             except Exception as e:
                 frame_data['decrypted'] = False
                 frame_data['decryption_error'] = f'Invalid payload format: {e}'
@@ -628,145 +724,20 @@ class TetraDecoder:
             padding = 8 - (len(payload_bytes) % 8)
             payload_bytes += b'\x00' * padding
         
-        keys_to_try = []
-        
-        # Try key from key manager first
-        if self.key_manager and self.key_manager.has_key(algorithm, key_id):
-            key = self.key_manager.get_key(algorithm, key_id)
-            keys_to_try.append((key, f"{algorithm} key_id={key_id} (from file)"))
-            logger.info(f"Trying key from file for {algorithm}")
-        
-        # Try user-provided keys first (highest priority).
-        # Always attempt matching-alg keys first, then cross-try others.
-        user_keys_primary = []
-        user_keys_cross = []
-        for idx, (key_alg, key) in enumerate(self.user_keys):
-            if key_alg == algorithm:
-                user_keys_primary.append((key, f"{key_alg} user_key_{idx} (loaded)", key_alg))
-            else:
-                user_keys_cross.append((key, f"{key_alg} user_key_{idx} (cross-try)", key_alg))
-        keys_to_try[0:0] = user_keys_primary
-        
-        # ALWAYS add common keys for bruteforce (OpenEar style)
-        if algorithm in self.common_keys:
-            for idx, common_key in enumerate(self.common_keys[algorithm]):
-                keys_to_try.append((common_key, f"{algorithm} common_key_{idx}"))
-        
-        # Add BYPASS attempt (treat as clear) - User requested "try common,bypass"
-        # This handles cases where frames are marked encrypted but are actually clear (network config error)
-        keys_to_try.append((None, "BYPASS (Treat as Clear)"))
-        
-        # Also cross-try user keys (and common keys) for other algorithms if primary fails.
-        keys_to_try.extend(user_keys_cross)
-
-        # Also try with other algorithms if primary fails
-        for other_alg in ['TEA1', 'TEA2', 'TEA3', 'TEA4']:
-            if other_alg != algorithm and other_alg in self.common_keys:
-                for idx, common_key in enumerate(self.common_keys[other_alg][:5]):  # Try first 5
-                    keys_to_try.append((common_key, f"{other_alg} common_key_{idx} (cross-try)", other_alg))
-        
-        # If no keys to try, bail out
-        if not keys_to_try:
-            frame_data['decrypted'] = False
-            frame_data['decryption_error'] = 'No keys available'
-            logger.warning("No keys available for decryption")
-            return frame_data
-
-        frame_data["keys_tried"] = len(keys_to_try)
-        
-        logger.info(f"Trying {len(keys_to_try)} keys for frame {frame_data['number']}")
-        
-        # Try each key
+        # Try each key. Candidates are generated lazily and may be scored in
+        # parallel, but results are consumed in priority order so the chosen
+        # key matches a sequential scan.
         best_result = None
         best_score = 0
+        keys_tried = 0
         
-        for item in keys_to_try:
-            if len(item) == 3:
-                key, key_desc, alg_to_use = item
-            else:
-                key, key_desc = item
-                alg_to_use = algorithm
-            
-            try:
-                if key is None:
-                    # BYPASS mode - use payload as is
-                    decrypted_payload = payload_bytes
-                else:
-                    decryptor = TEADecryptor(key, alg_to_use if alg_to_use else algorithm)
-                    decrypted_payload = decryptor.decrypt(payload_bytes)
-                
-                # Score the decrypted data (how "good" it looks)
-                # More lenient scoring for TETRA
-                score = 0
-                
-                # Count printable ASCII (32-126)
-                printable_count = sum(1 for b in decrypted_payload if 32 <= b <= 126)
-                score += printable_count * 2
-                
-                # Check for reasonable byte distribution (not all same)
-                unique_bytes = len(set(decrypted_payload))
-                if unique_bytes > len(decrypted_payload) // 8:  # At least 12.5% unique (more lenient)
-                    score += 30
-                
-                # Penalize all zeros or all 0xFF (but less)
-                if decrypted_payload == b'\x00' * len(decrypted_payload):
-                    score -= 50  # Less penalty
-                if decrypted_payload == b'\xFF' * len(decrypted_payload):
-                    score -= 50
-                
-                # Check for common TETRA patterns
-                if len(decrypted_payload) >= 4:
-                    # Look for reasonable header patterns
-                    first_bytes = decrypted_payload[:4]
-                    # Add points if it looks like structured data
-                    if first_bytes[0] != 0 and first_bytes[0] != 0xFF:
-                        score += 10
-                    
-                    # Check for TETRA-specific byte patterns (common in traffic)
-                    # TETRA often has specific sync bytes
-                    if first_bytes[0] in [0x01, 0x02, 0x03, 0x04, 0x05, 0x08, 0x0A, 0x0C]:
-                        score += 20
-                
-                # More lenient entropy check
-                if unique_bytes > 1:  # Any diversity is good
-                    score += 10
-                
-                # --- Advanced Scoring: Prefer plausible SDS decode when decrypting MAC bytes ---
-                try:
-                    sds_text = self.protocol_parser.parse_sds_data(decrypted_payload)
-                    if sds_text:
-                        if sds_text.startswith("[BIN-ENC]"):
-                            # Still looks encrypted/random.
-                            score -= 20
-                        elif sds_text.startswith("[BIN]"):
-                            # Structured binary is still a "valid" decode candidate.
-                            score += 40
-                        else:
-                            # Readable/typed SDS output (TXT/LIP/GSM7/etc).
-                            score += 120
-                except Exception:
-                    pass
-
-                # --- Advanced Scoring: Try to parse as MAC PDU (best-effort) ---
-                try:
-                    # Convert bytes to bits for parser
-                    decrypted_bits = []
-                    for b in decrypted_payload:
-                        for i in range(7, -1, -1):
-                            decrypted_bits.append((b >> i) & 1)
-                    decrypted_bits = np.array(decrypted_bits)
-                    
-                    # Check CRC if possible (heuristic)
-                    if self.protocol_parser._check_crc(decrypted_bits):
-                        score += 100  # Big bonus for valid CRC/Structure
-                        
-                    # Try to parse as MAC PDU
-                    pdu = self.protocol_parser.parse_mac_pdu(decrypted_bits)
-                    if pdu and pdu.pdu_type != self.protocol_parser.PDUType.MAC_DATA: # If it parses as a specific type
-                         score += 50
-                except:
-                    pass
-                
+        candidates = self._score_candidates(self._candidate_keys(algorithm, key_id), payload_bytes)
+        try:
+            for key_desc, score, decrypted_payload in candidates:
+                keys_tried += 1
+                frame_data["keys_tried"] = keys_tried
+                if score is None:
+                    continue
                 if score > best_score:
                     best_score = score
                     best_result = (decrypted_payload, key_desc)
@@ -775,12 +746,10 @@ class TetraDecoder:
                 
                 # Lower threshold - accept more attempts
                 if score > 80:  # Was 50, increased due to CRC bonus
-                    logger.info(f"Good decryption score {score} with {key_desc}")
+                    logger.info("Good decryption score %s with %s (%d keys tried)", score, key_desc, keys_tried)
                     break
-                    
-            except Exception as e:
-                logger.debug(f"Key {key_desc} failed: {e}")
-                continue
+        finally:
+            candidates.close()
         
         # Use the best result if we found one. Keep this strict to avoid "garbage decrypted" frames.
         if best_result and best_score >= 80:
@@ -802,12 +771,12 @@ class TetraDecoder:
                 )
                 return frame_data
 
-            # Convert back to bits
-            decrypted_bits = BitArray(decrypted_payload)
-
+            # Only the hex form is stored; consumers unpack bits on demand
+            # (see TetraDecoder.payload_bits) instead of carrying an 8N-char bit string.
             frame_data['decrypted'] = True
-            frame_data['decrypted_payload'] = decrypted_bits.bin
             frame_data['decrypted_bytes'] = decrypted_payload.hex()
+            # Raw bytes for the caller's SDS re-parse (popped before the frame is returned)
+            frame_data['_decrypted_bytes_raw'] = decrypted_payload
             frame_data['key_used'] = key_desc
             frame_data['decrypt_confidence'] = best_score
             frame_data["best_score"] = best_score
@@ -819,19 +788,313 @@ class TetraDecoder:
             elif "TEA3" in key_desc: frame_data['encryption_algorithm'] = "TEA3"
             elif "TEA4" in key_desc: frame_data['encryption_algorithm'] = "TEA4"
 
-            logger.info(f"[OK] Decrypted frame {frame_data['number']} using {key_desc} (confidence: {best_score})")
+            logger.info("[OK] Decrypted frame %s using %s (confidence: %s)", frame_data['number'], key_desc, best_score)
         else:
             # All keys failed or low confidence
             frame_data['decrypted'] = False
-            if not keys_to_try:
+            if not keys_tried:
                 frame_data['decryption_error'] = 'No keys available'
+                logger.warning("No keys available for decryption")
             else:
-                frame_data['decryption_error'] = f'Tried {len(keys_to_try)} key(s), best score: {best_score}'
-                logger.debug(f"All keys failed for frame {frame_data['number']}, best score: {best_score}")
+                frame_data['decryption_error'] = f'Tried {keys_tried} key(s), best score: {best_score}'
+                logger.debug("All keys failed for frame %s, best score: %s", frame_data['number'], best_score)
             frame_data["best_score"] = best_score
         
         return frame_data
     
+    def _candidate_keys(self, algorithm: str, key_id: str):
+        """
+        Generate candidate keys for _decrypt_frame in priority order.
+        
+        Lazy, so nothing is built for keys after an early good score.
+        
+        Yields:
+            (key, key_desc, algorithm) tuples; key None means BYPASS
+        """
+        # Try user-provided keys first (highest priority).
+        # Always attempt matching-alg keys first, then cross-try others.
+        for idx, (key_alg, key) in enumerate(self.user_keys):
+            if key_alg == algorithm:
+                yield key, f"{key_alg} user_key_{idx} (loaded)", key_alg
+        
+        # Then the key from the key manager
+        if self.key_manager and self.key_manager.has_key(algorithm, key_id):
+            logger.info("Trying key from file for %s", algorithm)
+            yield self.key_manager.get_key(algorithm, key_id), f"{algorithm} key_id={key_id} (from file)", algorithm
+        
+        # ALWAYS add common keys for bruteforce (OpenEar style)
+        for key, key_desc in self._prepared_common_keys.get(algorithm, ()):
+            yield key, key_desc, algorithm
+        
+        # Add BYPASS attempt (treat as clear) - User requested "try common,bypass"
+        # This handles cases where frames are marked encrypted but are actually clear (network config error)
+        yield None, "BYPASS (Treat as Clear)", algorithm
+        
+        # Also cross-try user keys (and common keys) for other algorithms if primary fails.
+        for idx, (key_alg, key) in enumerate(self.user_keys):
+            if key_alg != algorithm:
+                yield key, f"{key_alg} user_key_{idx} (cross-try)", key_alg
+        
+        # Also try with other algorithms if primary fails
+        for other_alg in ['TEA1', 'TEA2', 'TEA3', 'TEA4']:
+            if other_alg != algorithm:
+                yield from self._prepared_cross_keys.get(other_alg, ())
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Lazily create the thread pool used for candidate-key trials."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.decrypt_workers,
+                thread_name_prefix="tetra-decrypt",
+            )
+        return self._executor
+    
+    def close(self):
+        """Shut down the key-trial thread pool, if one was started."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+    
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+    
+    def _scoring_parser(self) -> TetraProtocolParser:
+        """
+        Get a per-thread protocol parser for scoring candidates.
+        
+        Trial parses must not touch the fragment buffer or statistics of the
+        main parser, and parser state is not safe to share between threads.
+        """
+        parser = getattr(self._thread_state, 'parser', None)
+        if parser is None:
+            parser = TetraProtocolParser()
+            self._thread_state.parser = parser
+        return parser
+    
+    def _decrypt_candidates(self, jobs, payload_bytes: bytes):
+        """
+        Decrypt the payload under every candidate key, batching keys per algorithm.
+        
+        Args:
+            jobs: List of (key, key_desc, algorithm) tuples; key None means BYPASS
+            payload_bytes: Encrypted payload (multiple of 8 bytes)
+            
+        Returns:
+            List aligned with jobs: plaintext bytes, or None if the key is unusable
+        """
+        plaintexts = [None] * len(jobs)
+        jobs_by_alg = {}
+        for idx, (key, _key_desc, alg) in enumerate(jobs):
+            if key is None:
+                # BYPASS mode - use payload as is
+                plaintexts[idx] = payload_bytes
+            else:
+                jobs_by_alg.setdefault(alg, []).append(idx)
+        
+        for alg, indices in jobs_by_alg.items():
+            try:
+                decrypted = TEADecryptor.decrypt_batch([jobs[i][0] for i in indices], payload_bytes, alg)
+            except ValueError as e:
+                logger.debug("Batch decrypt for %s failed: %s", alg, e)
+                continue
+            for idx, plaintext in zip(indices, decrypted):
+                plaintexts[idx] = plaintext
+        return plaintexts
+    
+    def _score_candidates(self, jobs, payload_bytes: bytes):
+        """
+        Decrypt and score candidate keys, yielding results in job order.
+        
+        Args:
+            jobs: Iterable of (key, key_desc, algorithm) tuples; key None means BYPASS
+            payload_bytes: Encrypted payload (multiple of 8 bytes)
+            
+        Yields:
+            (key_desc, score, decrypted_payload) for each job; score and
+            decrypted_payload are None if the key failed.
+            Closing the generator cancels scoring that has not started yet.
+        """
+        # Decrypt lazily, one run of same-algorithm keys at a time, so an early
+        # good score still skips decrypting (and generating) the remaining keys.
+        for _alg, run in groupby(jobs, key=itemgetter(2)):
+            # The head of a run is the likeliest hit, so it is tried on its own
+            # before paying for the batch over the rest of the run.
+            head = [next(run)]
+            yield from self._score_run(head, self._decrypt_candidates(head, payload_bytes))
+            rest = list(run)
+            if rest:
+                yield from self._score_run(rest, self._decrypt_candidates(rest, payload_bytes))
+    
+    def _score_run(self, jobs, plaintexts):
+        """Score already decrypted candidates (see _score_candidates), in job order."""
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if self.decrypt_workers <= 1 or len(jobs) < 2:
+            for (_key, key_desc, _alg), decrypted_payload in zip(jobs, plaintexts):
+                if decrypted_payload is None:
+                    if debug:
+                        logger.debug("Key %s failed: invalid key length", key_desc)
+                    yield key_desc, None, None
+                    continue
+                try:
+                    score = self._score_plaintext(decrypted_payload)
+                except Exception as e:
+                    if debug:
+                        logger.debug("Key %s failed: %s", key_desc, e)
+                    yield key_desc, None, None
+                    continue
+                yield key_desc, score, decrypted_payload
+            return
+        
+        executor = self._get_executor()
+        entries = zip(jobs, plaintexts)
+        pending = deque()
+        try:
+            while True:
+                # At most one candidate per worker in flight, so an early exit
+                # leaves the rest of the run unscored
+                for (_key, key_desc, _alg), decrypted_payload in islice(
+                        entries, self.decrypt_workers - len(pending)):
+                    future = (executor.submit(self._score_plaintext, decrypted_payload)
+                              if decrypted_payload is not None else None)
+                    pending.append((key_desc, decrypted_payload, future))
+                if not pending:
+                    break
+                key_desc, decrypted_payload, future = pending.popleft()
+                if future is None:
+                    if debug:
+                        logger.debug("Key %s failed: invalid key length", key_desc)
+                    yield key_desc, None, None
+                    continue
+                try:
+                    score = future.result()
+                except Exception as e:
+                    if debug:
+                        logger.debug("Key %s failed: %s", key_desc, e)
+                    yield key_desc, None, None
+                    continue
+                yield key_desc, score, decrypted_payload
+        finally:
+            for _key_desc, _decrypted_payload, future in pending:
+                if future is not None:
+                    future.cancel()
+    
+    def _score_plaintext(self, decrypted_payload: bytes) -> int:
+        """
+        Score a candidate plaintext.
+        
+        Args:
+            decrypted_payload: Payload decrypted with a candidate key (or BYPASS)
+            
+        Returns:
+            Score - higher values look more like valid data
+        """
+        parser = self._scoring_parser()
+        
+        # Score the decrypted data (how "good" it looks)
+        # More lenient scoring for TETRA
+        score = 0
+        
+        # Count printable ASCII (32-126)
+        printable_count = sum(1 for b in decrypted_payload if 32 <= b <= 126)
+        score += printable_count * 2
+        
+        # Check for reasonable byte distribution (not all same)
+        unique_bytes = len(set(decrypted_payload))
+        if unique_bytes > len(decrypted_payload) // 8:  # At least 12.5% unique (more lenient)
+            score += 30
+        
+        # Penalize all zeros or all 0xFF (but less)
+        if decrypted_payload == b'\x00' * len(decrypted_payload):
+            score -= 50  # Less penalty
+        if decrypted_payload == b'\xFF' * len(decrypted_payload):
+            score -= 50
+        
+        # Check for common TETRA patterns
+        if len(decrypted_payload) >= 4:
+            # Look for reasonable header patterns
+            first_bytes = decrypted_payload[:4]
+            # Add points if it looks like structured data
+            if 0 < first_bytes[0] < 0xFF:
+                score += 10
+            
+            # Check for TETRA-specific byte patterns (common in traffic)
+            # TETRA often has specific sync bytes
+            if _TETRA_SYNC_LUT[first_bytes[0]]:
+                score += 20
+        
+        # More lenient entropy check
+        if unique_bytes > 1:  # Any diversity is good
+            score += 10
+        
+        # --- Advanced Scoring: Prefer plausible SDS decode when decrypting MAC bytes ---
+        try:
+            sds_text = self._score_sds(parser, decrypted_payload)
+            if sds_text:
+                if sds_text.startswith("[BIN-ENC]"):
+                    # Still looks encrypted/random.
+                    score -= 20
+                elif sds_text.startswith("[BIN]"):
+                    # Structured binary is still a "valid" decode candidate.
+                    score += 40
+                else:
+                    # Readable/typed SDS output (TXT/LIP/GSM7/etc).
+                    score += 120
+        except Exception:
+            pass
+
+        # --- Advanced Scoring: Try to parse as MAC PDU (best-effort) ---
+        try:
+            # Convert bytes to bits for parser (MSB first)
+            decrypted_bits = np.unpackbits(np.frombuffer(decrypted_payload, dtype=np.uint8))
+            
+            # Check CRC if possible (heuristic)
+            if self._check_payload_crc(decrypted_payload, decrypted_bits):
+                score += 100  # Big bonus for valid CRC/Structure
+                
+            # Try to parse as MAC PDU
+            pdu = parser.parse_mac_pdu(decrypted_bits)
+            if pdu and pdu.pdu_type != parser.PDUType.MAC_DATA: # If it parses as a specific type
+                 score += 50
+        except:
+            pass
+        
+        return score
+    
+    def _check_payload_crc(self, payload: bytes, bits: np.ndarray) -> bool:
+        """
+        Check CRC of a candidate plaintext, memoized by payload bytes.
+        
+        Args:
+            payload: Candidate plaintext bytes (cache key)
+            bits: The same payload unpacked to bits (MSB first)
+            
+        Returns:
+            True if the CRC heuristic passes
+        """
+        crc_ok = self._crc_cache.get(payload)
+        if crc_ok is None:
+            crc_ok = bool(self.protocol_parser._check_crc(bits))
+            self._crc_cache.put(payload, crc_ok)
+        return crc_ok
+    
+    def _score_sds(self, parser: TetraProtocolParser, payload: bytes) -> Optional[str]:
+        """
+        Parse a candidate plaintext as SDS, memoized by payload bytes.
+        
+        Only used for scoring: the scratch parser's statistics are irrelevant,
+        so skipping repeat parses does not lose any counts.
+        """
+        sds_text = self._sds_cache.get(payload, _MISSING)
+        if sds_text is _MISSING:
+            sds_text = parser.parse_sds_data(payload)
+            self._sds_cache.put(payload, sds_text)
+        return sds_text
+    
     def decode(self, symbols):
         """
         Decode TETRA frames from symbol stream.
@@ -842,48 +1105,51 @@ class TetraDecoder:
         # Find synchronization patterns (Training Sequence)
         # Use adaptive thresholding based on max correlation to avoid dropping frames
         # The find_sync function now has built-in adaptive thresholding when max_corr is close to threshold
-        sync_positions, max_corr = self.find_sync(bits, threshold=0.90, return_max_corr=True)
+        # Correlate once; each threshold below only filters the cached correlations
+        correlations = self.sync_correlation(bits)
+        sync_positions, max_corr = self.find_sync(bits, threshold=0.90, return_max_corr=True,
+                                                  correlations=correlations)
         
         if not sync_positions:
             # Try 0.85 threshold - find_sync will use adaptive threshold if max_corr is close
-            sync_positions, max_corr = self.find_sync(bits, threshold=0.85, return_max_corr=True)
+            sync_positions, max_corr = self.find_sync(bits, threshold=0.85, return_max_corr=True,
+                                                      correlations=correlations)
             if not sync_positions:
                 # Try 0.80 threshold - find_sync will use adaptive threshold if max_corr is close
-                sync_positions, max_corr = self.find_sync(bits, threshold=0.80, return_max_corr=True)
+                sync_positions, max_corr = self.find_sync(bits, threshold=0.80, return_max_corr=True,
+                                                          correlations=correlations)
                 if not sync_positions and max_corr >= 0.75:
                     # Last resort: use adaptive threshold based on max correlation
                     adaptive_threshold = max(0.75, max_corr - 0.02)
-                    sync_positions, _ = self.find_sync(bits, threshold=adaptive_threshold, return_max_corr=True)
+                    sync_positions, _ = self.find_sync(bits, threshold=adaptive_threshold, return_max_corr=True,
+                                                       correlations=correlations)
                     # Do not go lower than 0.75 for 22-bit sync
         
         # Decode frames
+        # TS starts at bit 216 (symbol 108); keep bursts fully inside the stream
+        start_positions = np.asarray(sync_positions, dtype=np.int64) - self.TS_OFFSET
+        valid = ((start_positions >= 0)
+                 & (start_positions // 2 + self.FRAME_SYMBOLS <= len(mapped_symbols))
+                 & (start_positions + self.FRAME_LENGTH <= len(bits)))
+        start_positions = start_positions[valid]
+        
         frames = []
-        for pos in sync_positions:
-            # Adjust position to start of burst
-            # TS starts at bit 216 (symbol 108)
-            # But we need to be careful about array bounds
-            start_pos = pos - 216
-            
-            if start_pos >= 0:
-                # Extract symbols for this frame
-                # 255 symbols = 510 bits
-                start_sym = start_pos // 2
-                if start_sym + 255 <= len(mapped_symbols):
-                    frame_symbols = mapped_symbols[start_sym : start_sym + 255]
-                    
-                    # Reconstruct bits for decode_frame (it expects bits)
-                    # But decode_frame logic for header/type is based on bits
-                    # We pass the bits corresponding to the frame
-                    frame_bits = bits[start_pos : start_pos + 510]
-                    
-                    # Calculate a pseudo frame number based on position
-                    # Assuming continuous stream, 510 bits per timeslot
-                    current_frame_num = start_pos // 510
-                    
-                    frame = self.decode_frame(frame_bits, 0, frame_symbols, frame_number=current_frame_num)
-                    if frame:
-                        frames.append(frame)
-                        logger.info(f"Decoded frame {frame['number']} (type: {frame['type']})")
+        if len(start_positions) == 0:
+            return frames
+        
+        # Gather every frame's bits (510) and symbols (255) in one go
+        frame_bits_batch = np.lib.stride_tricks.sliding_window_view(
+            bits, self.FRAME_LENGTH)[start_positions].astype(np.uint8)
+        frame_symbols_batch = np.lib.stride_tricks.sliding_window_view(
+            mapped_symbols, self.FRAME_SYMBOLS)[start_positions // 2]
+        # Pseudo frame numbers, assuming a continuous stream of 510-bit timeslots
+        frame_numbers = (start_positions // self.FRAME_LENGTH).tolist()
+        
+        for frame_bits, frame_symbols, current_frame_num in zip(frame_bits_batch, frame_symbols_batch, frame_numbers):
+            frame = self.decode_frame(frame_bits, 0, frame_symbols, frame_number=current_frame_num)
+            if frame:
+                frames.append(frame)
+                logger.info("Decoded frame %s (type: %s)", frame['number'], frame['type'])
         
         return frames
 
@@ -893,20 +1159,20 @@ class TetraDecoder:
         """
         if len(bits) < self.FRAME_LENGTH:
             return None
-            
-        frame_bits = bits
-        frame = BitArray(frame_bits)
+        
+        # One contiguous 0/1 byte per bit (no copy if the caller already passes uint8)
+        frame_bits = np.asarray(bits, dtype=np.uint8)
         
         # Extract frame header (first 32 bits)
-        header = frame[0:32]
+        header = frame_bits[:32]
         
         # Extract frame type (first 2 bits for MAC PDU type)
         # The previous logic took 4 bits, which confused PDU Type with Encryption Mode
         # Standard Downlink MAC PDU Type is 2 bits.
-        pdu_type_int = header[0:2].uint
+        pdu_type_int = (int(header[0]) << 1) | int(header[1])
         
         # Encryption Mode is usually next 2 bits (bits 2-3)
-        encryption_mode_int = header[2:4].uint
+        encryption_mode_int = (int(header[2]) << 1) | int(header[3])
         
         # Extract frame number (next 8 bits? No, frame number is not in MAC header)
         # Frame number is passed from the burst/slot counter in the decoder loop
@@ -945,15 +1211,9 @@ class TetraDecoder:
         encrypted = encryption_mode_int > 0
         encryption_algorithm = None
         
-        if encryption_mode_int == 1:
-            encryption_algorithm = 'TEA1' # Default assumption for Class 2
-            additional_info['encryption_mode'] = 'Class 2 (SCK)'
-        elif encryption_mode_int == 2:
-            encryption_algorithm = 'TEA2' # Default assumption for Class 3
-            additional_info['encryption_mode'] = 'Class 3 (DCK)'
-        elif encryption_mode_int == 3:
-            encryption_algorithm = 'TEA3' # Assumption
-            additional_info['encryption_mode'] = 'Reserved'
+        mode_info = self.ENCRYPTION_MODES.get(encryption_mode_int)
+        if mode_info:
+            encryption_algorithm, additional_info['encryption_mode'] = mode_info
             
         key_id = '0'
         
@@ -963,7 +1223,7 @@ class TetraDecoder:
             'number': frame_number,
             'timeslot': frame_number % 4,  # Add timeslot (0-3)
             'bits': frame_bits,
-            'header': header.bin,
+            'header': ''.join('1' if b else '0' for b in header.tolist()),
             'position': start_pos,
             'encrypted': encrypted,
             'encryption_algorithm': encryption_algorithm,
@@ -975,12 +1235,9 @@ class TetraDecoder:
         try:
             # Use provided symbols if available, otherwise reconstruct
             if symbols is None:
-                # Reconstruct 0-3 symbols from bits
-                symbols = []
-                for i in range(0, len(frame_bits), 2):
-                    val = (frame_bits[i] << 1) | frame_bits[i+1]
-                    symbols.append(val)
-                symbols = np.array(symbols)
+                # Reconstruct 0-3 symbols from bit pairs
+                n_bits = len(frame_bits) // 2 * 2
+                symbols = (frame_bits[0:n_bits:2].astype(np.int64) << 1) | frame_bits[1:n_bits:2]
 
             # Parse burst structure
             burst = self.protocol_parser.parse_burst(
@@ -1013,21 +1270,10 @@ class TetraDecoder:
                             # 0=Clear, 1=Class2(TEA1/2), 2=Class3(TEA2/3/4), 3=Reserved
                             enc_mode = getattr(mac_pdu, 'encryption_mode', 0)
                             
-                            if enc_mode == 1:
-                                # Class 2 - usually TEA1, sometimes TEA2
-                                encryption_algorithm = 'TEA1'
-                                frame_data['encryption_algorithm'] = 'TEA1'
-                                additional_info['encryption_mode'] = 'Class 2 (SCK)'
-                            elif enc_mode == 2:
-                                # Class 3 - usually TEA2, sometimes TEA3/4
-                                encryption_algorithm = 'TEA2'
-                                frame_data['encryption_algorithm'] = 'TEA2'
-                                additional_info['encryption_mode'] = 'Class 3 (DCK)'
-                            elif enc_mode == 3:
-                                # Reserved - assume TEA3/4
-                                encryption_algorithm = 'TEA3'
-                                frame_data['encryption_algorithm'] = 'TEA3'
-                                additional_info['encryption_mode'] = 'Reserved'
+                            mode_info = self.ENCRYPTION_MODES.get(enc_mode)
+                            if mode_info:
+                                encryption_algorithm, additional_info['encryption_mode'] = mode_info
+                                frame_data['encryption_algorithm'] = encryption_algorithm
                             else:
                                 # Default
                                 if not encryption_algorithm:
@@ -1105,9 +1351,10 @@ class TetraDecoder:
         # Decryption logic
         if frame_data.get('encrypted') and (self.key_manager or self.auto_decrypt):
             frame_data = self._decrypt_frame(frame_data)
+            decrypted_raw = frame_data.pop('_decrypted_bytes_raw', None)
             if frame_data.get('decrypted') and 'decrypted_bytes' in frame_data:
                 try:
-                    decrypted_bytes = bytes.fromhex(frame_data['decrypted_bytes'])
+                    decrypted_bytes = decrypted_raw or bytes.fromhex(frame_data['decrypted_bytes'])
                     sds_text = self.protocol_parser.parse_sds_data(decrypted_bytes)
                     if sds_text:
                         frame_data['sds_message'] = sds_text
@@ -1163,7 +1410,10 @@ class TetraDecoder:
                 data = frame['mac_pdu']['data']
                 if isinstance(data, (bytes, bytearray)) and len(data) > 0:
                     # Try to show as text first
-                    printable_count = sum(1 for b in data if 32 <= b <= 126 or b in (10, 13))
+                    arr = np.frombuffer(data, dtype=np.uint8)
+                    printable_count = int(np.count_nonzero(
+                        ((arr >= 32) & (arr <= 126)) | (arr == 10) | (arr == 13)
+                    ))
                     if (printable_count / len(data)) > 0.7:
                         try:
                             text = data.decode('latin-1', errors='replace').strip()
@@ -1186,6 +1436,19 @@ class TetraDecoder:
         
         return info
     
+    @staticmethod
+    def payload_bits(payload_hex: str) -> np.ndarray:
+        """
+        Unpack a hex payload (e.g. frame['decrypted_bytes']) into bits, MSB first.
+        
+        Args:
+            payload_hex: Hex string of payload bytes
+            
+        Returns:
+            uint8 array of 0/1 values (8 per byte)
+        """
+        return np.unpackbits(np.frombuffer(bytes.fromhex(payload_hex), dtype=np.uint8))
+    
     def _get_frame_type_name(self, frame_type):
         """Get human-readable frame type name."""
         frame_types = {
@@ -4,11 +4,261 @@ Parses LIP (Location Information Protocol) and GPS coordinates from SDS messages
 """
 
 import re
+import struct
 import logging
-from typing import Optional, Tuple
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Optional linear-time (DFA) regex engine for the coordinate scan
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+# Optional JIT acceleration for bulk LIP decoding
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Upper bound for memoized display strings (stationary radios repeat positions)
+FORMAT_CACHE_SIZE = 4096
+
+# Texts at least this long are scanned with RE2 when it is installed. On short
+# SDS text the wrapper's per-call overhead loses to re, but re backtracks
+# quadratically on long digit runs while RE2 stays linear.
+RE2_MIN_LENGTH = 256
+
+# Map link prefixes for get_google_maps_url / get_openstreetmap_url
+_GMAPS_PREFIX = "https://www.google.com/maps?q="
+_OSM_PREFIX = "https://www.openstreetmap.org/?mlat="
+_OSM_ZOOM = 15
+
+# Coordinate formats recognised by LocationParser.parse_coordinates
+# Decimal format: Lat: XX.XXXXX Lon: YY.YYYYY
+_DECIMAL_PATTERN = r'Lat:?\s*(-?\d+\.?\d*)\s+Lon:?\s*(-?\d+\.?\d*)'
+# DMS format: 52°14'30"N 21°00'30"E
+_DMS_PATTERN = r'(\d+)°(\d+)[\'′](\d+(?:\.\d+)?)[\"″]([NS])\s+(\d+)°(\d+)[\'′](\d+(?:\.\d+)?)[\"″]([EW])'
+# Compact format: N52.2417 E021.0083
+_COMPACT_PATTERN = r'([NS])(\d+\.?\d*)\s+([EW])(\d+\.?\d*)'
+
+_DECIMAL_RE = re.compile(_DECIMAL_PATTERN, re.IGNORECASE)
+_DMS_RE = re.compile(_DMS_PATTERN)
+_COMPACT_RE = re.compile(_COMPACT_PATTERN)
+# All formats in one pass; the group name tells which format matched first.
+# The lookahead on the possible first characters lets the engine skip other
+# positions quickly instead of trying every alternative at each one.
+_COORD_ALTERNATION = (
+    f'(?P<decimal>(?i:{_DECIMAL_PATTERN}))|(?P<dms>{_DMS_PATTERN})|(?P<compact>{_COMPACT_PATTERN})'
+)
+_COORD_RE = re.compile(r'(?=[LlNS\d])' + f'(?:{_COORD_ALTERNATION})')
+
+if RE2_AVAILABLE:
+    # RE2 has no lookahead (and needs none), and its \d and \s are ASCII-only;
+    # spell out Python's Unicode digit and whitespace classes instead
+    _COORD_RE2 = re2.compile(
+        _COORD_ALTERNATION
+        .replace(r'\d', r'\p{Nd}')
+        .replace(r'\s', r'[\s\x0b\x1c-\x1f\x85\p{Z}]')
+    )
+
+# LIP position: latitude and longitude as 24-bit signed big-endian integers
+# from byte 1, each split into a signed high byte and an unsigned low word
+_LIP_POSITION = struct.Struct('>bHbH')
+# LIP long report tail from byte 7: altitude (signed), speed, heading
+_LIP_LONG_TAIL = struct.Struct('>hHH')
+# LIP positions map ±180° to ±2^23, so |latitude| <= 90° is |raw| <= 2^22.
+# Longitude needs no check: any 24-bit value maps into [-180°, 180°).
+_LAT_MAX_RAW = 1 << 22
+
+# Record layout returned by LocationParser.parse_lip_batch
+LIP_BATCH_DTYPE = np.dtype([
+    ('valid', np.bool_),        # Row decoded to a position in range
+    ('pdu_type', np.uint8),     # 0 = short report, 1 = long report
+    ('latitude', np.float64),
+    ('longitude', np.float64),
+    ('altitude', np.int16),     # Long reports only (0 otherwise)
+    ('speed', np.float64),      # km/h, long reports only
+    ('heading', np.uint16),     # Long reports only
+])
+
+# Characters bytes.fromhex accepts as digits
+_HEX_DIGITS = frozenset('0123456789abcdefABCDEF')
+
+# Compact format needs N/S directly followed by a digit
+_NS_DIGIT_RE = re.compile(r'[NS]\d')
+
+
+def _parse_lip_batch_numpy(arr: np.ndarray, out: np.ndarray) -> None:
+    """Fill out (LIP_BATCH_DTYPE, zeroed) from (N, L) uint8 LIP messages with array arithmetic."""
+    pdu_type = arr[:, 0]
+    out['pdu_type'] = pdu_type
+
+    # 24-bit big-endian fields, sign-extended
+    fields = arr[:, 1:7].astype(np.int32)
+    lat_raw = (fields[:, 0] << 16) | (fields[:, 1] << 8) | fields[:, 2]
+    lon_raw = (fields[:, 3] << 16) | (fields[:, 4] << 8) | fields[:, 5]
+    lat_raw -= (lat_raw & 0x800000) << 1
+    lon_raw -= (lon_raw & 0x800000) << 1
+
+    # Range: ±180° mapped to ±2^23
+    lat = (lat_raw / (2**23)) * 180
+    lon = (lon_raw / (2**23)) * 180
+    in_range = np.abs(lat_raw) <= _LAT_MAX_RAW
+
+    short = pdu_type == 0x00
+    long_report = (pdu_type == 0x01) & (arr.shape[1] >= 16)
+    valid = in_range & (short | long_report)
+    out['valid'] = valid
+    out['latitude'] = np.where(valid, lat, 0.0)
+    out['longitude'] = np.where(valid, lon, 0.0)
+
+    if arr.shape[1] >= 16:
+        tail = arr[:, 7:13].astype(np.uint16)
+        long_valid = valid & long_report
+        altitude = ((tail[:, 0] << 8) | tail[:, 1]).view(np.int16)
+        speed = (tail[:, 2] << 8) | tail[:, 3]
+        heading = (tail[:, 4] << 8) | tail[:, 5]
+        out['altitude'] = np.where(long_valid, altitude, 0)
+        out['speed'] = np.where(long_valid, speed / 10, 0.0)
+        out['heading'] = np.where(long_valid, heading, 0)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, boundscheck=False)
+    def _parse_lip_batch(arr, out):
+        """Fill out from LIP messages in one pass over the rows (JIT)."""
+        long_ok = arr.shape[1] >= 16
+        for i in range(arr.shape[0]):
+            row = arr[i]
+            pdu_type = row[0]
+            out[i].pdu_type = pdu_type
+            if not (pdu_type == 0x00 or (pdu_type == 0x01 and long_ok)):
+                continue
+            # 24-bit big-endian fields, sign-extended
+            lat_raw = (((np.int32(row[1]) ^ 0x80) - 0x80) << 16) | (np.int32(row[2]) << 8) | np.int32(row[3])
+            if lat_raw < -_LAT_MAX_RAW or lat_raw > _LAT_MAX_RAW:
+                continue
+            lon_raw = (((np.int32(row[4]) ^ 0x80) - 0x80) << 16) | (np.int32(row[5]) << 8) | np.int32(row[6])
+            out[i].valid = True
+            # Range: ±180° mapped to ±2^23
+            out[i].latitude = (lat_raw / (2**23)) * 180
+            out[i].longitude = (lon_raw / (2**23)) * 180
+            if pdu_type == 0x01:
+                altitude = (np.int32(row[7]) << 8) | np.int32(row[8])
+                out[i].altitude = altitude - ((altitude & 0x8000) << 1)
+                out[i].speed = ((np.int32(row[9]) << 8) | np.int32(row[10])) / 10
+                out[i].heading = (np.int32(row[11]) << 8) | np.int32(row[12])
+else:
+    _parse_lip_batch = _parse_lip_batch_numpy
+
+
+def _has_coordinate_marker(text: str) -> bool:
+    """Cheap necessary condition for any coordinate format, checked before the regex engine runs."""
+    if '°' in text or 'lat' in text.lower():
+        return True
+    return ('N' in text or 'S' in text) and _NS_DIGIT_RE.search(text) is not None
+
+
+def _search_from(pattern, text: str, start: int, anchored: bool):
+    """Leftmost match of pattern at or after start; tried as an anchored match first if the scan found it there."""
+    match = pattern.match(text, start) if anchored else None
+    return match or pattern.search(text, start)
+
+
+def _hex_to_bytes(text: str) -> Optional[bytes]:
+    """Decode stripped hex text (spaces between digits allowed), or None if it is not hex."""
+    # fromhex needs a hex digit first, so plain text is rejected without raising
+    if text[:1] not in _HEX_DIGITS:
+        return None
+    try:
+        return bytes.fromhex(text)
+    except ValueError:
+        pass
+    # fromhex only skips whitespace between byte pairs; a stray space inside
+    # a pair still needs the stripped copy
+    if ' ' in text:
+        try:
+            return bytes.fromhex(text.replace(' ', ''))
+        except ValueError:
+            pass
+    return None
+
+
+class LIPReport(NamedTuple):
+    """Decoded LIP position report (long-report fields are None for short reports)."""
+    type: str
+    latitude: float
+    longitude: float
+    altitude: Optional[int] = None
+    speed: Optional[float] = None  # km/h
+    heading: Optional[int] = None
+    formatted: str = ''
+    source: Optional[str] = None
+    
+    def to_dict(self) -> dict:
+        """Location dict as returned by extract_location_from_frame (unset fields omitted)."""
+        return {name: value for name, value in zip(self._fields, self) if value is not None}
+
+
+def _decode_lip_short(data: bytes) -> Optional[LIPReport]:
+    """Type 0: Short Location Report."""
+    # Extract lat/lon from binary (24 bits each)
+    lat_hi, lat_lo, lon_hi, lon_lo = _LIP_POSITION.unpack_from(data, 1)
+    lat_raw = (lat_hi << 16) | lat_lo
+    lon_raw = (lon_hi << 16) | lon_lo
+    if not -_LAT_MAX_RAW <= lat_raw <= _LAT_MAX_RAW:
+        return None
+    
+    # Convert to degrees (WGS84)
+    # Range: ±180° mapped to ±2^23
+    lat = (lat_raw / (2**23)) * 180
+    lon = (lon_raw / (2**23)) * 180
+    # _make skips the keyword-parsing __new__ wrapper
+    return LIPReport._make((
+        'LIP Short Report', lat, lon, None, None, None,
+        LocationParser.format_coordinates(lat, lon), None
+    ))
+
+
+def _decode_lip_long(data: bytes) -> Optional[LIPReport]:
+    """Type 1: Long Location Report (with altitude, speed, etc.)."""
+    if len(data) < 16:
+        return None
+    lat_hi, lat_lo, lon_hi, lon_lo = _LIP_POSITION.unpack_from(data, 1)
+    lat_raw = (lat_hi << 16) | lat_lo
+    lon_raw = (lon_hi << 16) | lon_lo
+    if not -_LAT_MAX_RAW <= lat_raw <= _LAT_MAX_RAW:
+        return None
+    
+    lat = (lat_raw / (2**23)) * 180
+    lon = (lon_raw / (2**23)) * 180
+    
+    # Additional fields
+    altitude, speed, heading = _LIP_LONG_TAIL.unpack_from(data, 7)
+    
+    return LIPReport._make((
+        'LIP Long Report', lat, lon,
+        altitude,
+        speed / 10,  # km/h
+        heading,
+        LocationParser.format_coordinates(lat, lon), None
+    ))
+
+
+# LIP decoders by PDU type (first byte); messages of other types are ignored.
+# Each decoder gets at least 10 bytes and returns None if it cannot decode them.
+_LIP_HANDLERS = {
+    0x00: _decode_lip_short,
+    0x01: _decode_lip_long,
+}
+
 
 class LocationParser:
     """Parse GPS and location data from TETRA messages."""
@@ -18,15 +268,30 @@ class LocationParser:
         """
         Parse latitude/longitude from text.
         
+        Formats are tried in a fixed order: decimal, then DMS, then compact,
+        each using its first match anywhere in the text. A later decimal
+        coordinate therefore wins over an earlier compact one, and a format
+        whose first match is out of range falls through to the next format.
+        
         Returns:
             (latitude, longitude) or None
         """
-        if not text:
+        if not text or not _has_coordinate_marker(text):
             return None
         
+        # One scan finds the leftmost coordinate of any format. Nothing matches
+        # before it, so each format's own search can start there, and the format
+        # that matched is just an anchored match at that position.
+        if RE2_AVAILABLE and len(text) >= RE2_MIN_LENGTH:
+            found = _COORD_RE2.search(text)
+        else:
+            found = _COORD_RE.search(text)
+        if found is None:
+            return None
+        start = found.start()
+        
         # Try decimal format: Lat: XX.XXXXX Lon: YY.YYYYY
-        decimal_pattern = r'Lat:?\s*(-?\d+\.?\d*)\s+Lon:?\s*(-?\d+\.?\d*)'
-        match = re.search(decimal_pattern, text, re.IGNORECASE)
+        match = _search_from(_DECIMAL_RE, text, start, found.lastgroup == 'decimal')
         if match:
             try:
                 lat = float(match.group(1))
@@ -37,8 +302,7 @@ class LocationParser:
                 pass
         
         # Try DMS format: 52°14'30"N 21°00'30"E
-        dms_pattern = r'(\d+)°(\d+)[\'′](\d+(?:\.\d+)?)[\"″]([NS])\s+(\d+)°(\d+)[\'′](\d+(?:\.\d+)?)[\"″]([EW])'
-        match = re.search(dms_pattern, text)
+        match = _search_from(_DMS_RE, text, start, found.lastgroup == 'dms')
         if match:
             try:
                 # Latitude
@@ -67,8 +331,7 @@ class LocationParser:
                 pass
         
         # Try compact format: N52.2417 E021.0083
-        compact_pattern = r'([NS])(\d+\.?\d*)\s+([EW])(\d+\.?\d*)'
-        match = re.search(compact_pattern, text)
+        match = _search_from(_COMPACT_RE, text, start, found.lastgroup == 'compact')
         if match:
             try:
                 lat = float(match.group(2))
@@ -87,94 +350,90 @@ class LocationParser:
         return None
     
     @staticmethod
+    @lru_cache(maxsize=FORMAT_CACHE_SIZE)
     def format_coordinates(lat: float, lon: float) -> str:
         """
         Format coordinates for display.
         
+        Memoized, since the same position is often reported many times;
+        see LocationParser.format_coordinates.cache_info().
+        
         Returns:
             Formatted string like "52.2417°N, 21.0083°E"
         """
-        lat_dir = 'N' if lat >= 0 else 'S'
-        lon_dir = 'E' if lon >= 0 else 'W'
+        if lat >= 0:
+            lat_dir = 'N'
+        else:
+            lat, lat_dir = -lat, 'S'
+        if lon >= 0:
+            lon_dir = 'E'
+        else:
+            lon, lon_dir = -lon, 'W'
         
-        return f"{abs(lat):.4f}°{lat_dir}, {abs(lon):.4f}°{lon_dir}"
+        # "or 0.0" turns -0.0 (which passes the >= 0 test) into 0.0
+        return "%.4f°%s, %.4f°%s" % (lat or 0.0, lat_dir, lon or 0.0, lon_dir)
     
     @staticmethod
     def get_google_maps_url(lat: float, lon: float) -> str:
         """Get Google Maps URL for coordinates."""
-        return f"https://www.google.com/maps?q={lat},{lon}"
+        return f"{_GMAPS_PREFIX}{lat},{lon}"
     
     @staticmethod
     def get_openstreetmap_url(lat: float, lon: float) -> str:
         """Get OpenStreetMap URL for coordinates."""
-        return f"https://www.openstreetmap.org/?mlat={lat}&mlon={lon}&zoom=15"
+        return f"{_OSM_PREFIX}{lat}&mlon={lon}&zoom={_OSM_ZOOM}"
     
     @staticmethod
-    def parse_lip_message(data: bytes) -> Optional[dict]:
+    def parse_lip_message(data: bytes) -> Optional[LIPReport]:
         """
         Parse LIP (Location Information Protocol) message.
         
         Returns:
-            dict with location info or None
+            LIPReport with location info or None
         """
         if not data or len(data) < 10:
             return None
         
-        try:
-            # LIP structure (simplified):
-            # PDU Type (1 byte)
-            # Location fields...
-            
-            pdu_type = data[0]
-            
-            # Type 0: Short Location Report
-            if pdu_type == 0x00 and len(data) >= 10:
-                # Extract lat/lon from binary (24 bits each)
-                lat_raw = int.from_bytes(data[1:4], 'big', signed=True)
-                lon_raw = int.from_bytes(data[4:7], 'big', signed=True)
-                
-                # Convert to degrees (WGS84)
-                # Range: ±180° mapped to ±2^23
-                lat = (lat_raw / (2**23)) * 180
-                lon = (lon_raw / (2**23)) * 180
-                
-                if -90 <= lat <= 90 and -180 <= lon <= 180:
-                    return {
-                        'type': 'LIP Short Report',
-                        'latitude': lat,
-                        'longitude': lon,
-                        'formatted': LocationParser.format_coordinates(lat, lon)
-                    }
-            
-            # Type 1: Long Location Report (with altitude, speed, etc.)
-            elif pdu_type == 0x01 and len(data) >= 16:
-                lat_raw = int.from_bytes(data[1:4], 'big', signed=True)
-                lon_raw = int.from_bytes(data[4:7], 'big', signed=True)
-                
-                lat = (lat_raw / (2**23)) * 180
-                lon = (lon_raw / (2**23)) * 180
-                
-                # Additional fields
-                altitude = int.from_bytes(data[7:9], 'big', signed=True)
-                speed = int.from_bytes(data[9:11], 'big')
-                heading = int.from_bytes(data[11:13], 'big')
-                
-                if -90 <= lat <= 90 and -180 <= lon <= 180:
-                    return {
-                        'type': 'LIP Long Report',
-                        'latitude': lat,
-                        'longitude': lon,
-                        'altitude': altitude,
-                        'speed': speed / 10,  # km/h
-                        'heading': heading,
-                        'formatted': LocationParser.format_coordinates(lat, lon)
-                    }
+        # LIP structure (simplified):
+        # PDU Type (1 byte)
+        # Location fields...
+        handler = _LIP_HANDLERS.get(data[0])
+        if handler is None:
+            return None
         
+        try:
+            return handler(data)
         except Exception as e:
             logger.debug(f"Error parsing LIP: {e}")
         
         return None
     
+    @staticmethod
+    def parse_lip_batch(buffers) -> np.ndarray:
+        """
+        Parse many fixed-length LIP messages at once.
+        
+        Vectorized counterpart of parse_lip_message for bulk decoding
+        (e.g. replaying captures): each row is one message, decoded with
+        NumPy array arithmetic (or a JIT-compiled loop when Numba is
+        installed) instead of per-message Python.
+        
+        Args:
+            buffers: (N, L) uint8 array-like, one LIP message per row.
+                L must be at least 10; long reports need L >= 16.
+        
+        Returns:
+            Structured array of LIP_BATCH_DTYPE, one record per row. Rows that
+            parse_lip_message would reject have valid=False.
+        """
+        arr = np.asarray(buffers, dtype=np.uint8)
+        if arr.ndim != 2 or arr.shape[1] < 10:
+            raise ValueError(f"Expected (N, L>=10) array of LIP messages, got shape {arr.shape}")
+        
+        out = np.zeros(len(arr), dtype=LIP_BATCH_DTYPE)
+        _parse_lip_batch(arr, out)
+        return out
+    
     @staticmethod
     def extract_location_from_frame(frame: dict) -> Optional[dict]:
         """
@@ -184,9 +443,9 @@ class LocationParser:
             dict with location data or None
         """
         # Check SDS message for text coordinates
-        sds_msg = frame.get('sds_message', '') or frame.get('decoded_text', '')
+        sds_msg = frame.get('sds_message') or frame.get('decoded_text') or ''
         
-        if '[LIP]' in sds_msg or '[LOC]' in sds_msg or '[GPS]' in sds_msg:
+        if sds_msg and ('[LIP]' in sds_msg or '[LOC]' in sds_msg or '[GPS]' in sds_msg):
             # Try to parse as text coordinates
             coords = LocationParser.parse_coordinates(sds_msg)
             if coords:
@@ -201,23 +460,21 @@ class LocationParser:
             
             # Try to parse as LIP binary (if hex data present)
             # Extract hex data after marker
-            hex_data = sds_msg.split(':', 1)[-1].strip()
-            try:
-                data_bytes = bytes.fromhex(hex_data.replace(' ', ''))
+            head, sep, tail = sds_msg.partition(':')
+            hex_data = (tail if sep else head).strip()
+            data_bytes = _hex_to_bytes(hex_data)
+            if data_bytes is not None:
                 lip_data = LocationParser.parse_lip_message(data_bytes)
                 if lip_data:
-                    lip_data['source'] = 'LIP Message'
-                    return lip_data
-            except:
-                pass
+                    return lip_data._replace(source='LIP Message').to_dict()
         
         # Check MAC PDU data for binary LIP
-        if 'mac_pdu' in frame and 'data' in frame['mac_pdu']:
-            data = frame['mac_pdu']['data']
+        mac_pdu = frame.get('mac_pdu')
+        if isinstance(mac_pdu, dict):
+            data = mac_pdu.get('data')
             if isinstance(data, (bytes, bytearray)):
                 lip_data = LocationParser.parse_lip_message(data)
                 if lip_data:
-                    lip_data['source'] = 'MAC PDU'
-                    return lip_data
+                    return lip_data._replace(source='MAC PDU').to_dict()
         
         return None
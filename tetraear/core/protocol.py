@@ -21,15 +21,191 @@ Example:
     >>> burst = parser.parse_burst(symbols, slot_number=0)
 """
 
+import binascii
+import codecs
+import struct
+import sys
 import numpy as np
-from bitstring import BitArray
 import logging
-from typing import Optional, Dict, List, Tuple
+from typing import Optional, Dict, Iterable, Iterator, List, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# Optional JIT acceleration for the per-burst bit kernels
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Array kinds (bool, signed, unsigned) the JIT kernels are used for
+_JIT_KINDS = 'biu'
+
+# Per-instance __dict__-free dataclasses where supported (Python 3.10+)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Big-endian 32-bit word; 24-bit SSI/talkgroup fields are read as its top 3 bytes
+_U32 = struct.Struct('>I')
+
+
+def _bits_to_int(bits) -> int:
+    """Pack a 0/1 bit sequence (MSB first) into an int."""
+    bits = np.asarray(bits, dtype=np.uint8)
+    return int.from_bytes(np.packbits(bits).tobytes(), 'big') >> (-len(bits) % 8)
+
+
+def _char_class_table(predicate) -> bytes:
+    """bytes.translate table mapping each latin-1 octet to 1 if predicate(char) else 0."""
+    return bytes(1 if predicate(chr(i)) else 0 for i in range(256))
+
+
+# Character classes used by the SDS text heuristics, for latin-1 encodable text
+_PRINTABLE_TABLE = _char_class_table(str.isprintable)
+_PRINTABLE_WS_TABLE = _char_class_table(lambda c: c.isprintable() or c in '\n\r\t')
+_ALNUM_SPACE_TABLE = _char_class_table(lambda c: c.isalnum() or c.isspace())
+_ALNUM_BLANK_TABLE = _char_class_table(lambda c: c.isalnum() or c == ' ')
+_ALPHA_TABLE = _char_class_table(str.isalpha)
+# ... and for raw SDS payload octets: printable ASCII plus CR/LF (and TAB)
+_ASCII_TEXT_TABLE = _char_class_table(lambda c: ' ' <= c <= '~' or c in '\n\r')
+_ASCII_TEXT_TAB_TABLE = _char_class_table(lambda c: ' ' <= c <= '~' or c in '\n\r\t')
+
+# Upper-case two-digit hex for each octet, used by the [BIN] preview fields
+_HEX2 = tuple(f"{i:02X}" for i in range(256))
+
+
+def _sign_extend(value: int, width: int) -> int:
+    """Interpret the low `width` bits of value as a two's complement integer."""
+    return value - (1 << width) if value & (1 << (width - 1)) else value
+
+
+def _bits_to_bytes(bits) -> bytes:
+    """Pack a bit sequence (MSB first, nonzero = 1) into bytes, zero-padding the last byte."""
+    return np.packbits(np.asarray(bits)).tobytes()
+
+
+def _unpack_dibits_numpy(symbols: np.ndarray) -> np.ndarray:
+    """Split each 2-bit symbol into its high and low bit."""
+    bits = np.empty(2 * len(symbols), dtype=np.int64)
+    bits[0::2] = (symbols >> 1) & 1
+    bits[1::2] = symbols & 1
+    return bits
+
+
+def _crc16_rows_numpy(bits: np.ndarray) -> np.ndarray:
+    """CRC-16-CCITT (0x1021, initial value 0xFFFF) of every row of a 2-D bit array."""
+    bits = bits.astype(np.uint8) & 1
+    n_whole = bits.shape[1] - bits.shape[1] % 8
+    packed = np.packbits(bits[:, :n_whole], axis=1)
+    crcs = np.array([binascii.crc_hqx(row.tobytes(), 0xFFFF) for row in packed], dtype=np.int64)
+    
+    # Trailing partial byte, one bit column at a time across all rows
+    for column in bits[:, n_whole:].T.astype(np.int64):
+        crcs ^= column << 15
+        crcs = np.where(crcs & 0x8000, (crcs << 1) ^ 0x1021, crcs << 1) & 0xFFFF
+    return crcs
+
+
+def _popcount16(values: np.ndarray) -> np.ndarray:
+    """Number of set bits in each 16-bit value."""
+    as_bytes = values.astype('>u2').view(np.uint8)
+    return np.unpackbits(as_bytes).reshape(-1, 16).sum(axis=1)
+
+
+# Bit weights of a septet, LSB first (GSM 03.38 packing order)
+_GSM7_SEPTET_WEIGHTS = np.array([1, 2, 4, 8, 16, 32, 64], dtype=np.uint8)
+
+
+def _gsm7_stream_numpy(data: bytes) -> np.ndarray:
+    """LSB-first bit stream of 7-bit packed octets."""
+    return np.unpackbits(np.frombuffer(data, dtype=np.uint8), bitorder='little')
+
+
+def _gsm7_septets_numpy(bits: np.ndarray, septet_count: int, skip_bits: int) -> np.ndarray:
+    """Septet codes from bit skip_bits of an LSB-first bit stream (septet_count < 0: all that fit)."""
+    bits = bits[skip_bits:]
+    max_septets = len(bits) // 7
+    if septet_count < 0 or septet_count > max_septets:
+        septet_count = max_septets
+    # One row of 7 bits per septet, weighted LSB first
+    return bits[:septet_count * 7].reshape(-1, 7) @ _GSM7_SEPTET_WEIGHTS
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _crc16_bits(bits):
+        """CRC-16-CCITT (0x1021, initial value 0xFFFF) over the low bit of each element (JIT)."""
+        crc = 0xFFFF
+        for i in range(bits.shape[0]):
+            crc ^= (np.int64(bits[i]) & 1) << 15
+            if crc & 0x8000:
+                crc = ((crc << 1) ^ 0x1021) & 0xFFFF
+            else:
+                crc = (crc << 1) & 0xFFFF
+        return crc
+    
+    @njit(cache=True)
+    def _bits_word(bits):
+        """Pack up to 63 0/1 bits (MSB first) into an int (JIT)."""
+        word = 0
+        for i in range(bits.shape[0]):
+            word = (word << 1) | (bits[i] != 0)
+        return word
+    
+    @njit(cache=True)
+    def _crc16_rows(bits):
+        """CRC-16-CCITT of every row of a 2-D bit array (JIT)."""
+        crcs = np.empty(bits.shape[0], np.int64)
+        for r in range(bits.shape[0]):
+            crcs[r] = _crc16_bits(bits[r])
+        return crcs
+    
+    @njit(cache=True)
+    def _unpack_dibits(symbols):
+        """Split each 2-bit symbol into its high and low bit (JIT)."""
+        bits = np.empty(2 * symbols.shape[0], np.int64)
+        for i in range(symbols.shape[0]):
+            sym = np.int64(symbols[i])
+            bits[2 * i] = (sym >> 1) & 1
+            bits[2 * i + 1] = sym & 1
+        return bits
+    
+    @njit(cache=True)
+    def _gsm7_septets(octets, septet_count, skip_bits):
+        """Septet codes read straight from 7-bit packed octets (JIT)."""
+        max_septets = max((octets.shape[0] * 8 - skip_bits) // 7, 0)
+        if septet_count < 0 or septet_count > max_septets:
+            septet_count = max_septets
+        septets = np.empty(septet_count, np.uint8)
+        bit = skip_bits
+        for i in range(septet_count):
+            shift = bit & 7
+            value = np.int64(octets[bit >> 3]) >> shift
+            if shift > 1:
+                value |= np.int64(octets[(bit >> 3) + 1]) << (8 - shift)
+            septets[i] = value & 0x7F
+            bit += 7
+        return septets
+    
+    def _gsm7_stream(data: bytes) -> np.ndarray:
+        """7-bit packed octets as read by the _gsm7_septets kernel."""
+        return np.frombuffer(data, dtype=np.uint8)
+else:
+    _bits_word = _bits_to_int
+    _crc16_rows = _crc16_rows_numpy
+    _unpack_dibits = _unpack_dibits_numpy
+    _gsm7_septets = _gsm7_septets_numpy
+    _gsm7_stream = _gsm7_stream_numpy
+
+
+def _bits_value(bits) -> int:
+    """Unsigned value of a short 0/1 bit field (MSB first), e.g. an address or length."""
+    bits = np.asarray(bits)
+    if NUMBA_AVAILABLE and bits.dtype.kind in _JIT_KINDS:
+        return int(_bits_word(bits))
+    return _bits_to_int(bits)
+
 
 class BurstType(Enum):
     """TETRA burst types."""
@@ -63,7 +239,7 @@ class PDUType(Enum):
     MAC_U_BLK = 7
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class TetraBurst:
     """Represents a TETRA burst (255 symbols)."""
     burst_type: BurstType
@@ -76,7 +252,7 @@ class TetraBurst:
     colour_code: int = 0
     
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class TetraSlot:
     """Represents a TETRA time slot (14.167ms, 255 symbols)."""
     slot_number: int  # 0-3 within frame
@@ -87,7 +263,7 @@ class TetraSlot:
     encryption_mode: int = 0
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class TetraFrame:
     """Represents a TETRA frame (4 slots = 56.67ms)."""
     frame_number: int  # 0-17 within multiframe
@@ -95,21 +271,21 @@ class TetraFrame:
     multiframe_number: int = 0
     
     
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class TetraMultiframe:
     """Represents a TETRA multiframe (18 frames = 1.02 seconds)."""
     multiframe_number: int
     frames: List[TetraFrame]
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class TetraHyperframe:
     """Represents a TETRA hyperframe (60 multiframes = 61.2 seconds)."""
     hyperframe_number: int
     multiframes: List[TetraMultiframe]
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class MacPDU:
     """MAC layer PDU."""
     pdu_type: PDUType
@@ -122,7 +298,7 @@ class MacPDU:
     reassembled_data: Optional[bytes] = None  # For fragmented messages
     
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class CallMetadata:
     """Call setup/teardown metadata."""
     call_type: str  # "Voice", "Data", "Group", "Individual"
@@ -161,6 +337,11 @@ class TetraProtocolParser:
     # Sync patterns
     SYNC_CONTINUOUS_DOWNLINK = [1, 1, 0, 1, 0, 0, 0, 0, 1, 1, 1, 0, 1, 0, 0, 1, 1, 1, 0, 1, 0, 0]
     SYNC_DISCONTINUOUS_DOWNLINK = [0, 0, 1, 1, 1, 0, 1, 0, 0, 1, 0, 0, 0, 0, 1, 1, 0, 1, 0, 0, 1, 1]
+    # The same patterns packed into ints, for XOR/popcount comparison
+    _SYNC_CONTINUOUS_WORD = _bits_to_int(SYNC_CONTINUOUS_DOWNLINK)
+    _SYNC_DISCONTINUOUS_WORD = _bits_to_int(SYNC_DISCONTINUOUS_DOWNLINK)
+    # ... and stacked as rows, for comparing a whole batch of bursts at once
+    _SYNC_PATTERNS = np.array([SYNC_CONTINUOUS_DOWNLINK, SYNC_DISCONTINUOUS_DOWNLINK])
     
     def __init__(self):
         """Initialize protocol parser."""
@@ -189,6 +370,11 @@ class TetraProtocolParser:
         self.fragment_buffer = bytearray()
         self.fragment_metadata = {}
         
+        # Also accept a CRC computed over the payload in reversed bit order
+        # (endianness mismatch). Off by default: it doubles the CRC work on
+        # every failing burst and mostly adds chance matches on noise.
+        self.try_reversed_crc = False
+        
     def parse_burst(self, symbols: np.ndarray, slot_number: int = 0) -> Optional[TetraBurst]:
         """
         Parse a TETRA burst (255 symbols).
@@ -208,10 +394,11 @@ class TetraProtocolParser:
         burst_symbols = symbols[:self.SYMBOLS_PER_SLOT]
         
         # Convert symbols to bits (2 bits per π/4-DQPSK symbol)
-        bits = []
-        for sym in burst_symbols:
-            bits.extend([int(sym >> 1 & 1), int(sym & 1)])
-        bits = np.array(bits)
+        burst_symbols = np.asarray(burst_symbols)
+        if burst_symbols.dtype.kind in 'iu':
+            bits = _unpack_dibits(burst_symbols)
+        else:
+            bits = _unpack_dibits_numpy(burst_symbols)
         
         # Detect burst type from training sequence position
         burst_type = self._detect_burst_type(bits)
@@ -243,6 +430,81 @@ class TetraProtocolParser:
         
         return burst
     
+    def parse_bursts_batch(self, symbols: np.ndarray, slot_numbers) -> List[TetraBurst]:
+        """
+        Parse a batch of TETRA bursts in one pass.
+        
+        Dibit unpacking, burst type detection and the CRC check run on the
+        whole batch; only the TetraBurst objects are built per burst.
+        
+        Args:
+            symbols: Symbol array of shape (N, 255) (extra columns are ignored)
+            slot_numbers: Slot number (0-3) of each burst
+            
+        Returns:
+            Parsed TetraBurst for each row, in order
+        
+        Raises:
+            ValueError: If slot_numbers does not have one entry per row
+        """
+        symbols = np.asarray(symbols)
+        if symbols.ndim != 2 or symbols.shape[1] < self.SYMBOLS_PER_SLOT:
+            logger.warning("Insufficient symbols for burst batch: %s", symbols.shape)
+            return []
+        symbols = symbols[:, :self.SYMBOLS_PER_SLOT]
+        count = len(symbols)
+        if len(slot_numbers) != count:
+            raise ValueError(f"Expected {count} slot numbers, got {len(slot_numbers)}")
+        
+        # Convert symbols to bits (2 bits per π/4-DQPSK symbol)
+        bits = np.empty((count, 2 * self.SYMBOLS_PER_SLOT), dtype=np.int64)
+        bits[:, 0::2] = (symbols >> 1) & 1
+        bits[:, 1::2] = symbols & 1
+        
+        # Detect burst type: sync pattern (at most 4 bit errors) mid-burst
+        sync_pos = bits.shape[1] // 2
+        sync_bits = bits[:, np.newaxis, sync_pos:sync_pos + 22]
+        is_sync = (sync_bits != self._SYNC_PATTERNS).sum(axis=2).min(axis=1) <= 4
+        
+        # Data bits: normal bursts drop training and tail, sync bursts keep all
+        normal_rows = np.flatnonzero(~is_sync)
+        sync_rows = np.flatnonzero(is_sync)
+        normal_data = np.concatenate((bits[normal_rows, 0:108], bits[normal_rows, 122:230]), axis=1)
+        
+        crc_ok = np.zeros(count, dtype=bool)
+        crc_ok[normal_rows] = self._check_crc_batch(normal_data)
+        crc_ok[sync_rows] = self._check_crc_batch(bits[sync_rows])
+        
+        passed = int(crc_ok.sum())
+        self.stats['total_bursts'] += count
+        self.stats['crc_pass'] += passed
+        self.stats['crc_fail'] += count - passed
+        
+        frame_number = self.current_frame_number
+        colour_code = self.colour_code or 0
+        normal_iter = iter(normal_data)
+        bursts = []
+        for row, slot_number, sync, ok in zip(bits, slot_numbers, is_sync.tolist(), crc_ok.tolist()):
+            if sync:
+                burst_type = BurstType.Synchronization
+                training_seq = row[108:130]
+                data_bits = row
+            else:
+                burst_type = BurstType.NormalDownlink
+                training_seq = row[108:122]
+                data_bits = next(normal_iter)
+            bursts.append(TetraBurst(
+                burst_type=burst_type,
+                slot_number=slot_number,
+                frame_number=frame_number,
+                training_sequence=training_seq,
+                data_bits=data_bits,
+                crc_ok=ok,
+                colour_code=colour_code
+            ))
+        
+        return bursts
+    
     def _detect_burst_type(self, bits: np.ndarray) -> BurstType:
         """Detect burst type from training sequence position."""
         # Check for sync burst (training sequence at specific position)
@@ -258,11 +520,13 @@ class TetraProtocolParser:
         if len(bits) < 22:
             return False
         
-        # Check both sync patterns
-        match_cont = np.sum(bits[:22] == self.SYNC_CONTINUOUS_DOWNLINK) / 22
-        match_disc = np.sum(bits[:22] == self.SYNC_DISCONTINUOUS_DOWNLINK) / 22
+        # Check both sync patterns: count differing bits with one XOR each
+        word = _bits_value(bits[:22])
+        errors_cont = bin(word ^ self._SYNC_CONTINUOUS_WORD).count('1')
+        errors_disc = bin(word ^ self._SYNC_DISCONTINUOUS_WORD).count('1')
         
-        return max(match_cont, match_disc) > 0.8
+        # More than 80% of the 22 bits match, i.e. at most 4 differ
+        return min(errors_cont, errors_disc) <= 4
     
     def _extract_training_sequence(self, bits: np.ndarray, burst_type: BurstType) -> np.ndarray:
         """Extract training sequence from burst."""
@@ -305,10 +569,10 @@ class TetraProtocolParser:
 
         try:
             payload = bits[:-16]
-            received_crc = bits[-16:]
-            calculated_crc = self._calculate_crc16(payload)
+            received_crc = _bits_value(bits[-16:])
+            calculated_crc = self._crc16_value(payload)
             
-            errors = int(np.sum(calculated_crc != received_crc))
+            errors = bin(calculated_crc ^ received_crc).count('1')
             if errors == 0:
                 return True
 
@@ -317,35 +581,248 @@ class TetraProtocolParser:
                 return True
 
             # Try reversed bit order to handle endianness mismatches.
-            reversed_crc = self._calculate_crc16(payload[::-1])
-            errors_rev = int(np.sum(reversed_crc != received_crc))
-            if errors_rev == 0:
-                return True
-            if errors_rev <= 2:
-                return True
+            if self.try_reversed_crc:
+                reversed_crc = self._crc16_value(payload[::-1])
+                errors_rev = bin(reversed_crc ^ received_crc).count('1')
+                if errors_rev == 0:
+                    return True
+                if errors_rev <= 2:
+                    return True
         except Exception:
             return False
         
         return False
     
-    def _calculate_crc16(self, bits: np.ndarray) -> np.ndarray:
-        """Calculate CRC-16-CCITT (polynomial 0x1021)."""
-        polynomial = 0x1021
-        crc = 0xFFFF
+    def _check_crc_batch(self, bits: np.ndarray) -> np.ndarray:
+        """Vectorized _check_crc over the rows of a 2-D bit array."""
+        count, length = bits.shape
+        ok = np.zeros(count, dtype=bool)
+        if count == 0 or length < 16:
+            return ok
+        
+        ones = bits.sum(axis=1)
+        candidates = (ones != 0) & (ones != length)
+        
+        payload = bits[:, :-16]
+        received_crc = bits[:, -16:] @ (1 << np.arange(15, -1, -1))
+        ok = candidates & (_popcount16(_crc16_rows(payload) ^ received_crc) <= 2)
+        
+        # Try reversed bit order to handle endianness mismatches.
+        if not self.try_reversed_crc:
+            return ok
+        retry = np.flatnonzero(candidates & ~ok)
+        if len(retry):
+            reversed_crc = _crc16_rows(np.ascontiguousarray(payload[retry, ::-1]))
+            ok[retry] = _popcount16(reversed_crc ^ received_crc[retry]) <= 2
+        
+        return ok
+    
+    def _crc16_value(self, bits: np.ndarray) -> int:
+        """
+        Calculate CRC-16-CCITT (polynomial 0x1021, initial value 0xFFFF) as an int.
         
-        for bit in bits:
-            crc ^= (int(bit) << 15)
-            for _ in range(1):
-                if crc & 0x8000:
-                    crc = (crc << 1) ^ polynomial
-                else:
-                    crc <<= 1
-                crc &= 0xFFFF
+        Runs as a JIT bit loop when Numba is installed. Otherwise whole bytes
+        go through binascii.crc_hqx (the same CCITT polynomial, table-driven
+        in C) and a trailing partial byte is shifted in bit by bit.
+        """
+        bits = np.asarray(bits)
+        if NUMBA_AVAILABLE and bits.dtype.kind in _JIT_KINDS:
+            return int(_crc16_bits(bits))
+        
+        bits = bits.astype(np.uint8) & 1
+        n_whole = len(bits) - len(bits) % 8
+        crc = binascii.crc_hqx(np.packbits(bits[:n_whole]).tobytes(), 0xFFFF)
+        
+        for bit in bits[n_whole:].tolist():
+            crc ^= bit << 15
+            if crc & 0x8000:
+                crc = (crc << 1) ^ 0x1021
+            else:
+                crc <<= 1
+            crc &= 0xFFFF
+        
+        return crc
+    
+    def _calculate_crc16(self, bits: np.ndarray) -> np.ndarray:
+        """Calculate CRC-16-CCITT (polynomial 0x1021) as 16 bits, MSB first."""
+        crc = self._crc16_value(bits)
         
         # Convert to bits
         crc_bits = [(crc >> i) & 1 for i in range(15, -1, -1)]
         return np.array(crc_bits)
     
+    def _parse_mac_resource(self, bits: np.ndarray, encrypted: bool, encryption_mode_val: int):
+        """MAC-RESOURCE body: address, length and data; starts a fragment chain."""
+        # Bits: Type(2), EncMode(2), Fill(1), ...
+        fill_bit_ind = bits[4]
+        
+        # Position pointer
+        pos = 5
+        
+        # Encryption (already parsed mode)
+        
+        # Address (24 bits)
+        if len(bits) >= pos + 24:
+            address_bits = bits[pos:pos+24]
+            address = _bits_value(address_bits)
+            pos += 24
+        else:
+            return None # Truncated
+        
+        # Length (6 bits)
+        if len(bits) >= pos + 6:
+            length_bits = bits[pos:pos+6]
+            length = _bits_value(length_bits)
+            pos += 6
+        else:
+            return None # Truncated
+            
+        # Data
+        # If length is 0, it might mean "rest of slot" or specific rule
+        # Standard says: Length indicator 000000 means Null PDU or similar?
+        # Actually, length is in octets (bytes) usually.
+        
+        data_len_bits = length * 8
+        
+        # STRICT CHECK: Data length cannot exceed remaining bits significantly
+        if data_len_bits > len(bits) - pos + 16: # Allow small margin
+            return None
+        
+        if data_len_bits > 0 and len(bits) >= pos + data_len_bits:
+            data_bits = bits[pos:pos + data_len_bits]
+        else:
+            data_bits = bits[pos:]
+            
+        try:
+            data_bytes = _bits_to_bytes(data_bits)
+        except:
+            data_bytes = b''
+            
+        # Start fragmentation buffer
+        # Only start if this looks like the beginning of a message
+        self.fragment_buffer = bytearray(data_bytes)
+        self.fragment_metadata = {'address': address, 'encrypted': encrypted, 'mode': encryption_mode_val}
+        
+        return address, length, data_bytes, fill_bit_ind, encrypted
+    
+    def _parse_mac_frag(self, bits: np.ndarray, encrypted: bool, encryption_mode_val: int):
+        """MAC-FRAG body: continuation data appended to the fragment chain."""
+        # Bits: Type(2), EncMode(2), Fill(1), ...
+        fill_bit_ind = bits[4]
+        pos = 5
+        address = None
+        
+        data_bits = bits[pos:]
+        try:
+            data_bytes = _bits_to_bytes(data_bits)
+        except:
+            data_bytes = b''
+            
+        # Append to buffer
+        self.fragment_buffer.extend(data_bytes)
+        
+        # Restore metadata
+        if self.fragment_metadata:
+            encrypted = self.fragment_metadata.get('encrypted', False)
+            address = self.fragment_metadata.get('address')
+        
+        return address, 0, data_bytes, fill_bit_ind, encrypted
+    
+    def _parse_mac_broadcast(self, bits: np.ndarray, encrypted: bool, encryption_mode_val: int):
+        """MAC-BROADCAST body: SYSINFO network identity (MCC/MNC/colour code)."""
+        # Bits: Type(2), BroadcastType(2), ...
+        # BroadcastType: 00=SYSINFO, 01=ACCESS-DEFINE, ...
+        broadcast_type = (bits[2] << 1) | bits[3]
+        
+        pos = 4
+        # SYSINFO (Type 0)
+        if broadcast_type == 0:
+            # Parse SYSINFO elements
+            # MCC(10), MNC(14), CC(6), ...
+            if len(bits) >= pos + 30:
+                self.mcc = _bits_value(bits[pos:pos+10])
+                self.mnc = _bits_value(bits[pos+10:pos+24])
+                self.colour_code = _bits_value(bits[pos+24:pos+30])
+                
+                # STRICT CHECK: MCC/MNC sanity - Real TETRA networks
+                # MCC must be 200-799 (valid ITU-T E.212 range)
+                if self.mcc < 200 or self.mcc > 799:
+                    logger.debug(f"Invalid MCC {self.mcc} in SYNC - not real TETRA")
+                    return None
+                if self.mnc > 999:
+                    logger.debug(f"Invalid MNC {self.mnc} in SYNC - not real TETRA")
+                    return None
+                
+                logger.info(f"Valid TETRA SYNC: MCC={self.mcc} MNC={self.mnc}")
+            else:
+                return None
+        
+        data_bits = bits[pos:]
+        try:
+            data_bytes = _bits_to_bytes(data_bits)
+        except:
+            data_bytes = b''
+        
+        return None, 0, data_bytes, 0, encrypted
+    
+    def _parse_mac_end(self, bits: np.ndarray, encrypted: bool, encryption_mode_val: int):
+        """MAC-END body: final data of a fragment chain."""
+        # Bits: Type(2), EncMode(2), Fill(1), Length(6)?
+        # MAC-END usually has structure: Type(2), EncMode(2), Fill(1), Length(6)
+        fill_bit_ind = bits[4]
+        pos = 5
+        address = None
+        
+        # Assuming Length is present for MAC-END
+        if len(bits) >= pos + 6:
+            length_bits = bits[pos:pos+6]
+            length = _bits_value(length_bits)
+            pos += 6
+        else:
+            # If no length field, treat as invalid for MAC-END
+            return None
+            
+        data_len_bits = length * 8
+        
+        # STRICT CHECK
+        if data_len_bits > len(bits) - pos + 16:
+            return None
+            
+        if data_len_bits > 0 and len(bits) >= pos + data_len_bits:
+            data_bits = bits[pos:pos + data_len_bits]
+        else:
+            data_bits = bits[pos:]
+            
+        try:
+            data_bytes = _bits_to_bytes(data_bits)
+        except:
+            data_bytes = b''
+            
+        # Append and Finalize
+        self.fragment_buffer.extend(data_bytes)
+        
+        # Restore metadata
+        if self.fragment_metadata:
+            encrypted = self.fragment_metadata.get('encrypted', False)
+            address = self.fragment_metadata.get('address')
+        
+        return address, length, data_bytes, fill_bit_ind, encrypted
+    
+    # MAC PDU type (first 2 bits, downlink) -> (PDUType, body parser)
+    # 00: MAC-RESOURCE
+    # 01: MAC-FRAG
+    # 10: MAC-BROADCAST
+    # 11: MAC-ENCRYPTED (or other, depending on context)
+    _MAC_PARSERS = {
+        0: (PDUType.MAC_RESOURCE, _parse_mac_resource),
+        1: (PDUType.MAC_FRAG, _parse_mac_frag),
+        2: (PDUType.MAC_BROADCAST, _parse_mac_broadcast),
+    }
+    # Type 3 is often MAC-END or MAC-U-SIGNAL depending on context/uplink/downlink
+    # For Downlink, 11 is often reserved or proprietary, or MAC-D-BLCK
+    # Let's assume MAC-END for now if it fits the structure
+    _MAC_END_PARSER = (PDUType.MAC_END, _parse_mac_end)
+    
     def parse_mac_pdu(self, bits: np.ndarray) -> Optional[MacPDU]:
         """
         Parse MAC layer PDU.
@@ -360,26 +837,9 @@ class TetraProtocolParser:
         if len(bits) < 8:
             return None
         
-        # MAC PDU Type (first 2 bits for Downlink)
-        # 00: MAC-RESOURCE
-        # 01: MAC-FRAG
-        # 10: MAC-BROADCAST
-        # 11: MAC-ENCRYPTED (or other, depending on context)
-        
+        # MAC PDU Type (first 2 bits for Downlink), mapped to internal Enum
         pdu_type_int = (bits[0] << 1) | bits[1]
-        
-        # Map to internal Enum
-        if pdu_type_int == 0:
-            pdu_type = PDUType.MAC_RESOURCE
-        elif pdu_type_int == 1:
-            pdu_type = PDUType.MAC_FRAG
-        elif pdu_type_int == 2:
-            pdu_type = PDUType.MAC_BROADCAST
-        else:
-            # Type 3 is often MAC-END or MAC-U-SIGNAL depending on context/uplink/downlink
-            # For Downlink, 11 is often reserved or proprietary, or MAC-D-BLCK
-            # Let's assume MAC-END for now if it fits the structure
-            pdu_type = PDUType.MAC_END
+        pdu_type, parse_body = self._MAC_PARSERS.get(pdu_type_int, self._MAC_END_PARSER)
 
         # Encryption Mode (Bits 2-3)
         # 00: Class 1 (Clear)
@@ -389,159 +849,11 @@ class TetraProtocolParser:
         encryption_mode_val = (bits[2] << 1) | bits[3]
         encrypted = encryption_mode_val > 0
         
-        # Default fields
-        address = None
-        length = 0
-        data_bytes = b''
-        fill_bit_ind = 0
-        
         # Parse based on PDU Type
-        if pdu_type == PDUType.MAC_RESOURCE:
-            # MAC-RESOURCE
-            # Bits: Type(2), EncMode(2), Fill(1), ...
-            fill_bit_ind = bits[4]
-            
-            # Position pointer
-            pos = 5
-            
-            # Encryption (already parsed mode)
-            
-            # Address (24 bits)
-            if len(bits) >= pos + 24:
-                address_bits = bits[pos:pos+24]
-                address = int(''.join(str(b) for b in address_bits), 2)
-                pos += 24
-            else:
-                return None # Truncated
-            
-            # Length (6 bits)
-            if len(bits) >= pos + 6:
-                length_bits = bits[pos:pos+6]
-                length = int(''.join(str(b) for b in length_bits), 2)
-                pos += 6
-            else:
-                return None # Truncated
-                
-            # Data
-            # If length is 0, it might mean "rest of slot" or specific rule
-            # Standard says: Length indicator 000000 means Null PDU or similar?
-            # Actually, length is in octets (bytes) usually.
-            
-            data_len_bits = length * 8
-            
-            # STRICT CHECK: Data length cannot exceed remaining bits significantly
-            if data_len_bits > len(bits) - pos + 16: # Allow small margin
-                return None
-            
-            if data_len_bits > 0 and len(bits) >= pos + data_len_bits:
-                data_bits = bits[pos:pos + data_len_bits]
-            else:
-                data_bits = bits[pos:]
-                
-            try:
-                data_bytes = BitArray(data_bits).tobytes()
-            except:
-                data_bytes = b''
-                
-            # Start fragmentation buffer
-            # Only start if this looks like the beginning of a message
-            self.fragment_buffer = bytearray(data_bytes)
-            self.fragment_metadata = {'address': address, 'encrypted': encrypted, 'mode': encryption_mode_val}
-            
-        elif pdu_type == PDUType.MAC_FRAG:
-            # MAC-FRAG
-            # Bits: Type(2), EncMode(2), Fill(1), ...
-            fill_bit_ind = bits[4]
-            pos = 5
-            
-            data_bits = bits[pos:]
-            try:
-                data_bytes = BitArray(data_bits).tobytes()
-            except:
-                data_bytes = b''
-                
-            # Append to buffer
-            self.fragment_buffer.extend(data_bytes)
-            
-            # Restore metadata
-            if self.fragment_metadata:
-                encrypted = self.fragment_metadata.get('encrypted', False)
-                address = self.fragment_metadata.get('address')
-            
-        elif pdu_type == PDUType.MAC_BROADCAST:
-            # MAC-BROADCAST
-            # Bits: Type(2), BroadcastType(2), ...
-            # BroadcastType: 00=SYSINFO, 01=ACCESS-DEFINE, ...
-            broadcast_type = (bits[2] << 1) | bits[3]
-            
-            pos = 4
-            # SYSINFO (Type 0)
-            if broadcast_type == 0:
-                # Parse SYSINFO elements
-                # MCC(10), MNC(14), CC(6), ...
-                if len(bits) >= pos + 30:
-                    self.mcc = int(''.join(str(b) for b in bits[pos:pos+10]), 2)
-                    self.mnc = int(''.join(str(b) for b in bits[pos+10:pos+24]), 2)
-                    self.colour_code = int(''.join(str(b) for b in bits[pos+24:pos+30]), 2)
-                    
-                    # STRICT CHECK: MCC/MNC sanity - Real TETRA networks
-                    # MCC must be 200-799 (valid ITU-T E.212 range)
-                    if self.mcc < 200 or self.mcc > 799:
-                        logger.debug(f"Invalid MCC {self.mcc} in SYNC - not real TETRA")
-                        return None
-                    if self.mnc > 999:
-                        logger.debug(f"Invalid MNC {self.mnc} in SYNC - not real TETRA")
-                        return None
-                    
-                    logger.info(f"Valid TETRA SYNC: MCC={self.mcc} MNC={self.mnc}")
-                else:
-                    return None
-            
-            data_bits = bits[pos:]
-            try:
-                data_bytes = BitArray(data_bits).tobytes()
-            except:
-                data_bytes = b''
-                
-        else:
-            # Fallback / MAC-END
-            # Bits: Type(2), EncMode(2), Fill(1), Length(6)?
-            # MAC-END usually has structure: Type(2), EncMode(2), Fill(1), Length(6)
-            fill_bit_ind = bits[4]
-            pos = 5
-            
-            # Assuming Length is present for MAC-END
-            if len(bits) >= pos + 6:
-                length_bits = bits[pos:pos+6]
-                length = int(''.join(str(b) for b in length_bits), 2)
-                pos += 6
-            else:
-                # If no length field, treat as invalid for MAC-END
-                return None
-                
-            data_len_bits = length * 8
-            
-            # STRICT CHECK
-            if data_len_bits > len(bits) - pos + 16:
-                return None
-                
-            if data_len_bits > 0 and len(bits) >= pos + data_len_bits:
-                data_bits = bits[pos:pos + data_len_bits]
-            else:
-                data_bits = bits[pos:]
-                
-            try:
-                data_bytes = BitArray(data_bits).tobytes()
-            except:
-                data_bytes = b''
-                
-            # Append and Finalize
-            self.fragment_buffer.extend(data_bytes)
-            
-            # Restore metadata
-            if self.fragment_metadata:
-                encrypted = self.fragment_metadata.get('encrypted', False)
-                address = self.fragment_metadata.get('address')
+        body = parse_body(self, bits, encrypted, encryption_mode_val)
+        if body is None:
+            return None
+        address, length, data_bytes, fill_bit_ind, encrypted = body
 
         if encrypted:
             self.stats['encrypted_frames'] += 1
@@ -631,7 +943,7 @@ class TetraProtocolParser:
         call_type = "Group" if data[0] & 0x80 else "Individual"
         
         # Bytes 1-3: Talkgroup/SSI (24 bits)
-        talkgroup_id = int.from_bytes(data[1:4], 'big') & 0xFFFFFF
+        talkgroup_id = _U32.unpack_from(data, 1)[0] >> 8
         
         # Byte 4: Channel Allocation
         channel_allocated = data[4] & 0x3F
@@ -652,7 +964,7 @@ class TetraProtocolParser:
             # Valid SSI range: 1 - 16777215 (0 is reserved, >16M is reserved/short)
             # We skip the first few bytes which are MAC header
             for i in range(8, len(data) - 3):
-                val = int.from_bytes(data[i:i+3], 'big') & 0xFFFFFF
+                val = _U32.unpack_from(data, i)[0] >> 8
                 # Heuristic: SSI should be different from TG, and look "reasonable"
                 # Most user SSIs are > 1000 and < 16000000
                 if val != talkgroup_id and 1000 < val < 16000000:
@@ -684,8 +996,8 @@ class TetraProtocolParser:
             return None
         
         # Extract SSIs
-        source_ssi = int.from_bytes(data[0:3], 'big') & 0xFFFFFF
-        dest_ssi = int.from_bytes(data[3:6], 'big') & 0xFFFFFF
+        source_ssi = _U32.unpack_from(data, 0)[0] >> 8
+        dest_ssi = _U32.unpack_from(data, 3)[0] >> 8
         
         # Call type
         call_type_byte = data[6]
@@ -739,17 +1051,17 @@ class TetraProtocolParser:
         # Neighbour Cell Info...
         
         try:
-            # Convert to bits for easier parsing
-            bits = BitArray(data)
+            # All three fields sit in the first 32 bits
+            word = _U32.unpack_from(data, 0)[0]
             
             # MCC: 10 bits
-            mcc = bits[0:10].uint
+            mcc = word >> 22
             
             # MNC: 14 bits
-            mnc = bits[10:24].uint
+            mnc = (word >> 8) & 0x3FFF
             
             # Colour Code: 6 bits (often follows)
-            colour_code = bits[24:30].uint
+            colour_code = (word >> 2) & 0x3F
             
             # VALIDATE: Real TETRA networks use MCC 200-799 (ITU-T E.212)
             # Values outside this range indicate noise/invalid data
@@ -835,38 +1147,17 @@ class TetraProtocolParser:
         # Example 2: SDS with GSM 7-bit (07 00 Length ...)
         if len(data) > 3 and data[0] == 0x07 and data[1] == 0x00:
             # User example: 07 00 D2 D4 79 9E 2F 03 -> STATUS OK
-            candidates: List[str] = []
-
             # Some SDS payloads include a septet count at offset 2.
+            layouts: List[Tuple[int, Optional[int]]] = []
             septet_count = data[2]
-            payload_3 = data[3:]
-            if payload_3:
-                max_septets = (len(payload_3) * 8) // 7
-                if 0 < septet_count <= min(160, max_septets):
-                    candidates.append(self._unpack_gsm7bit(payload_3, septet_count=septet_count))
-                    candidates.append(self._unpack_gsm7bit_with_udh(payload_3, septet_count=septet_count))
-                candidates.append(self._unpack_gsm7bit(payload_3))
-                candidates.append(self._unpack_gsm7bit_with_udh(payload_3))
+            max_septets = ((len(data) - 3) * 8) // 7
+            if 0 < septet_count <= min(160, max_septets):
+                layouts.append((3, septet_count))
+            layouts.append((3, None))
 
             # Fallback: decode starting at offset 2 (treat offset-2 byte as packed content).
-            payload_2 = data[2:]
-            if payload_2:
-                candidates.append(self._unpack_gsm7bit(payload_2))
-                candidates.append(self._unpack_gsm7bit_with_udh(payload_2))
-
-            best = ""
-            best_score = 0.0
-            seen = set()
-            for text in candidates:
-                text = text.strip("\x00").strip()
-                if not text or text in seen:
-                    continue
-                seen.add(text)
-                s = self._score_text(text)
-                if s > best_score:
-                    best_score = s
-                    best = text
-
+            layouts.append((2, None))
+            best = self._best_gsm7_candidate(self._gsm7_candidates(data, layouts))
             if best and self._is_valid_text(best, threshold=0.55):
                 self.stats['data_messages'] += 1
                 return f"[SDS-GSM] {best}"
@@ -914,12 +1205,18 @@ class TetraProtocolParser:
         
         # Check for 7-bit GSM packing or 8-bit text
         # Heuristic: if > 60% of bytes are printable, treat as text
-        printable_count = sum(1 for b in test_data if 32 <= b <= 126 or b in (10, 13))
+        printable_count = test_data.translate(_ASCII_TEXT_TABLE).count(1)
         if len(test_data) > 0 and (printable_count / len(test_data)) > 0.6:
              try:
                 # Try multiple encodings
+                if test_data.isascii():
+                    # All of them decode pure ASCII to the same text: check it once
+                    encodings = ['ascii']
+                else:
+                    # ASCII cannot decode high-bit octets
+                    encodings = ['utf-8', 'latin-1', 'cp1252']
                 text = None
-                for encoding in ['utf-8', 'latin-1', 'ascii', 'cp1252']:
+                for encoding in encodings:
                     try:
                         text = test_data.decode(encoding, errors='strict')
                         if self._is_valid_text(text, threshold=0.6):
@@ -939,22 +1236,7 @@ class TetraProtocolParser:
         
         # Try GSM 7-bit unpacking as last resort (with UDH handling)
         try:
-            candidates = [
-                self._unpack_gsm7bit(test_data),
-                self._unpack_gsm7bit_with_udh(test_data),
-            ]
-            best = ""
-            best_score = 0.0
-            seen = set()
-            for text in candidates:
-                text = text.strip("\x00").strip()
-                if not text or text in seen:
-                    continue
-                seen.add(text)
-                score = self._score_text(text)
-                if score > best_score:
-                    best_score = score
-                    best = text
+            best = self._best_gsm7_candidate(self._gsm7_candidates(test_data, [(0, None)]))
             if best and self._is_valid_text(best, threshold=0.55):
                 self.stats['data_messages'] += 1
                 return f"[GSM7] {best}"
@@ -981,10 +1263,10 @@ class TetraProtocolParser:
         pid = data_stripped[0]
         payload = data_stripped[1:]
 
-        parts = [f"PID=0x{pid:02X}", f"HEX={hex_preview(data_stripped, max_bytes=32)}"]
+        parts = ["PID=0x" + _HEX2[pid], f"HEX={hex_preview(data_stripped, max_bytes=32)}"]
 
         if payload:
-            printable_count = sum(1 for b in payload if 32 <= b <= 126 or b in (10, 13, 9))
+            printable_count = payload.translate(_ASCII_TEXT_TAB_TABLE).count(1)
             if (printable_count / len(payload)) >= 0.85:
                 try:
                     ascii_text = payload.decode("latin-1", errors="replace").replace("\r", "").replace("\x00", "")
@@ -994,26 +1276,29 @@ class TetraProtocolParser:
                 except Exception:
                     pass
 
+            # Walk at most four tag/length/value items
             tlv_items = []
             idx = 0
-            while idx + 2 <= len(payload):
+            payload_len = len(payload)
+            for _ in range(4):
+                if idx + 2 > payload_len:
+                    break
                 tag = payload[idx]
                 length = payload[idx + 1]
-                if length == 0 or idx + 2 + length > len(payload):
+                if length == 0 or idx + 2 + length > payload_len:
                     break
                 value = payload[idx + 2: idx + 2 + length]
-                tlv_items.append(f"{tag:02X}:{length}={hex_preview(value, max_bytes=12)}")
+                tlv_items.append(f"{_HEX2[tag]}:{length}={hex_preview(value, max_bytes=12)}")
                 idx += 2 + length
-                if len(tlv_items) >= 4:
-                    break
             if tlv_items and idx >= max(3, int(len(payload) * 0.75)):
                 parts.append("TLV=" + " ".join(tlv_items))
 
             if len(payload) in (2, 4, 6, 8, 10, 12) and len(payload) <= 12:
-                words_le = [int.from_bytes(payload[i:i + 2], "little") for i in range(0, len(payload), 2)]
-                words_be = [int.from_bytes(payload[i:i + 2], "big") for i in range(0, len(payload), 2)]
-                parts.append("u16le=" + ",".join(f"0x{w:04X}" for w in words_le))
-                parts.append("u16be=" + ",".join(f"0x{w:04X}" for w in words_be))
+                word_count = len(payload) // 2
+                words_le = struct.unpack(f"<{word_count}H", payload)
+                words_be = struct.unpack(f">{word_count}H", payload)
+                parts.append("u16le=" + ",".join(["0x" + _HEX2[w >> 8] + _HEX2[w & 0xFF] for w in words_le]))
+                parts.append("u16be=" + ",".join(["0x" + _HEX2[w >> 8] + _HEX2[w & 0xFF] for w in words_be]))
 
         return "[BIN] " + " | ".join(parts)
 
@@ -1033,26 +1318,29 @@ class TetraProtocolParser:
             # 10: Location Report with Ack
             # 11: Reserved/Extended
             
-            # Convert to bits for easier parsing
-            bits = BitArray(data)
-            pdu_type = bits[0:2].uint
+            # All report fields sit in the first 10 octets; read them as one
+            # big-endian int and take each field by its end-bit offset
+            head = data[:10]
+            top = 8 * len(head)
+            word = int.from_bytes(head, 'big')
+            pdu_type = word >> (top - 2)
             
             if pdu_type == 0: # Short Location Report
                 # Structure: Type(2), Time Elapsed(2), Lat(24), Long(25), Pos Error(3), Horizontal Vel(5), Direction(4)
                 # Total ~65 bits
-                if len(bits) < 65:
+                if len(data) * 8 < 65:
                     return None
                     
                 # Time Elapsed (0-3) - 0=Current, 1=<5s, 2=<5min, 3=>5min
-                time_elapsed = bits[2:4].uint
+                time_elapsed = (word >> (top - 4)) & 0x3
                 
                 # Latitude (24 bits, 2's complement)
-                lat_raw = bits[4:28].int
+                lat_raw = _sign_extend((word >> (top - 28)) & 0xFFFFFF, 24)
                 # Scaling: lat_raw * 90 / 2^23
                 latitude = lat_raw * 90.0 / (1 << 23)
                 
                 # Longitude (25 bits, 2's complement)
-                lon_raw = bits[28:53].int
+                lon_raw = _sign_extend((word >> (top - 53)) & 0x1FFFFFF, 25)
                 # Scaling: lon_raw * 180 / 2^24
                 longitude = lon_raw * 180.0 / (1 << 24)
                 
@@ -1061,15 +1349,15 @@ class TetraProtocolParser:
             elif pdu_type == 1: # Long Location Report
                 # Structure: Type(2), Time Elapsed(2), Lat(25), Long(26), Pos Error(3), Horizontal Vel(8), Direction(9)
                 # Total ~75 bits
-                if len(bits) < 75:
+                if len(data) * 8 < 75:
                     return None
                     
                 # Latitude (25 bits)
-                lat_raw = bits[4:29].int
+                lat_raw = _sign_extend((word >> (top - 29)) & 0x1FFFFFF, 25)
                 latitude = lat_raw * 90.0 / (1 << 24)
                 
                 # Longitude (26 bits)
-                lon_raw = bits[29:55].int
+                lon_raw = _sign_extend((word >> (top - 55)) & 0x3FFFFFF, 26)
                 longitude = lon_raw * 180.0 / (1 << 25)
                 
                 return f"Lat: {latitude:.5f}, Lon: {longitude:.5f} (Long)"
@@ -1111,6 +1399,9 @@ class TetraProtocolParser:
         0x65: "€",
     }
 
+    # Default alphabet as a charmap decoding table, for translating whole messages
+    _GSM7_ALPHABET = "".join(_GSM7_DEFAULT_ALPHABET)
+
     def _unpack_gsm7bit(
         self,
         data: bytes,
@@ -1128,39 +1419,34 @@ class TetraProtocolParser:
         if not data:
             return ""
 
-        bits: List[int] = []
-        for b in data:
-            for i in range(8):
-                bits.append((b >> i) & 1)
-
-        if skip_bits:
-            if skip_bits >= len(bits):
-                return ""
-            bits = bits[skip_bits:]
+        return self._decode_gsm7_stream(_gsm7_stream(data), septet_count, skip_bits)
 
-        max_septets = len(bits) // 7
-        if septet_count is None or septet_count > max_septets:
-            septet_count = max_septets
+    def _decode_gsm7_stream(
+        self,
+        stream: np.ndarray,
+        septet_count: Optional[int] = None,
+        skip_bits: int = 0,
+    ) -> str:
+        """Decode septets from a _gsm7_stream of packed data (see _unpack_gsm7bit)."""
+        septets = _gsm7_septets(stream, -1 if septet_count is None else max(septet_count, 0), skip_bits)
 
-        septets: List[int] = []
-        for idx in range(septet_count):
-            base = idx * 7
-            val = 0
-            for offset in range(7):
-                val |= (bits[base + offset] << offset)
-            septets.append(val)
+        # Translate every septet in one lookup; only 0x1B maps to ESC, so
+        # without one (the common case) there are no extension pairs to resolve
+        text = codecs.charmap_decode(septets.tobytes(), 'strict', self._GSM7_ALPHABET)[0]
+        escape = text.find("\x1b")
+        if escape < 0:
+            return text
 
+        # ESC + code -> extension character (unknown codes decode to nothing)
         out: List[str] = []
-        escaped = False
-        for code in septets:
-            if escaped:
-                out.append(self._GSM7_EXTENSION_TABLE.get(code, ""))
-                escaped = False
-                continue
-            if code == 0x1B:
-                escaped = True
-                continue
-            out.append(self._gsm_map(code))
+        start = 0
+        while escape >= 0:
+            out.append(text[start:escape])
+            if escape + 1 < len(text):
+                out.append(self._GSM7_EXTENSION_TABLE.get(int(septets[escape + 1]), ""))
+            start = escape + 2
+            escape = text.find("\x1b", start)
+        out.append(text[start:])
 
         return "".join(out)
 
@@ -1170,44 +1456,124 @@ class TetraProtocolParser:
 
         The first octet is treated as UDHL when it yields a plausible header length.
         """
-        if not data or len(data) < 2:
+        layout = self._udh_layout(data, septet_count)
+        if layout is None:
             return ""
 
+        skip_bits, payload_septets = layout
+        return self._unpack_gsm7bit(
+            data,
+            septet_count=payload_septets,
+            skip_bits=skip_bits,
+        )
+
+    def _udh_layout(self, data: bytes, septet_count: Optional[int] = None) -> Optional[Tuple[int, Optional[int]]]:
+        """
+        Locate the text behind a UDH in 7-bit packed data.
+
+        Returns:
+            (bits to skip, septets to decode) or None if the first octet is
+            not a plausible UDHL
+        """
+        if not data or len(data) < 2:
+            return None
+
         udh_len = data[0]
         if udh_len <= 0:
-            return ""
+            return None
 
         udh_total = udh_len + 1
         if udh_total > len(data):
-            return ""
+            return None
 
-        skip_bits = udh_total * 8
+        # Fill bits pad the header to a septet boundary, where the text starts
+        skip_bits = (udh_total * 8 + 6) // 7 * 7
         payload_septets = None
         if septet_count is not None:
             udh_septets = (skip_bits + 6) // 7
             if septet_count > udh_septets:
                 payload_septets = septet_count - udh_septets
 
-        return self._unpack_gsm7bit(
-            data,
-            septet_count=payload_septets,
-            skip_bits=skip_bits,
-        )
+        return skip_bits, payload_septets
 
-    def _gsm_map(self, code: int) -> str:
-        """Map GSM 03.38 default-alphabet code to character."""
-        if 0 <= code < len(self._GSM7_DEFAULT_ALPHABET):
-            ch = self._GSM7_DEFAULT_ALPHABET[code]
-            return "" if ch == "\x1b" else ch
-        return ""
+    def _gsm7_candidates(self, data: bytes, layouts: List[Tuple[int, Optional[int]]]) -> Iterator[str]:
+        """
+        Decode 7-bit packed data at several layouts, each plain and behind a UDH.
+
+        The packed stream is prepared once from the earliest start octet and
+        every candidate is decoded from a bit offset into it. Candidates are
+        decoded lazily, and a (bit offset, septet count) pair already yielded
+        is not decoded again.
+
+        Args:
+            data: SDS data
+            layouts: (start octet, septet count or None) pairs, in candidate order
+
+        Yields:
+            Decoded candidates (none where no plausible UDH)
+        """
+        first = min(start for start, _ in layouts)
+        if first >= len(data):
+            return
+        stream = _gsm7_stream(data[first:])
+
+        decoded = set()
+        for start, septet_count in layouts:
+            payload = data[start:]
+            if not payload:
+                continue
+            offset = (start - first) * 8
+            udh = self._udh_layout(payload, septet_count)
+            keys = [(offset, septet_count)]
+            if udh is not None:
+                keys.append((offset + udh[0], udh[1]))
+            for key in keys:
+                if key not in decoded:
+                    decoded.add(key)
+                    yield self._decode_gsm7_stream(stream, key[1], key[0])
+
+    # Upper bound of _score_text: all printable, all alphanumeric/space, has a letter
+    _MAX_TEXT_SCORE = 2.5
+
+    def _best_gsm7_candidate(self, candidates: Iterable[str]) -> str:
+        """
+        Highest-scoring distinct candidate, stripped of NULs and whitespace ("" if none scores).
+
+        Stops at the first candidate with the maximum possible score, since no
+        later one can beat it.
+        """
+        score_text = self._score_text
+        best = ""
+        best_score = 0.0
+        seen = set()
+        for text in candidates:
+            text = text.strip("\x00").strip()
+            if not text or text in seen:
+                continue
+            seen.add(text)
+            score = score_text(text)
+            if score > best_score:
+                best_score = score
+                best = text
+                if score >= self._MAX_TEXT_SCORE:
+                    break
+        return best
 
     def _score_text(self, text: str) -> float:
         """Score decoded text to select the most plausible candidate."""
         if not text:
             return 0.0
-        printable = sum(1 for c in text if c.isprintable() and c not in "\x1b")
-        alnum = sum(1 for c in text if c.isalnum() or c.isspace())
-        alpha = sum(1 for c in text if c.isalpha())
+        try:
+            octets = text.encode('latin-1')
+        except UnicodeEncodeError:
+            printable = sum(1 for c in text if c.isprintable() and c not in "\x1b")
+            alnum = sum(1 for c in text if c.isalnum() or c.isspace())
+            alpha = sum(1 for c in text if c.isalpha())
+        else:
+            # Count each class in one C pass (ESC is not printable)
+            printable = octets.translate(_PRINTABLE_TABLE).count(1)
+            alnum = octets.translate(_ALNUM_SPACE_TABLE).count(1)
+            alpha = octets.translate(_ALPHA_TABLE).count(1)
         return (printable / len(text)) + (alnum / len(text)) + (0.5 if alpha > 0 else 0.0)
 
     def _is_valid_text(self, text: str, threshold: float = 0.8) -> bool:
@@ -1216,12 +1582,20 @@ class TetraProtocolParser:
             return False
             
         # Remove common whitespace
-        clean_text = ''.join(c for c in text if c not in '\n\r\t ')
+        clean_text = text.strip('\n\r\t ')
         if not clean_text:
             return False
+        
+        try:
+            octets = text.encode('latin-1')
+        except UnicodeEncodeError:
+            octets = None
             
         # Check ratio of printable characters
-        printable = sum(1 for c in text if c.isprintable() or c in '\n\r\t')
+        if octets is not None:
+            printable = octets.translate(_PRINTABLE_WS_TABLE).count(1)
+        else:
+            printable = sum(1 for c in text if c.isprintable() or c in '\n\r\t')
         ratio = printable / len(text)
         
         # Check for excessive repetition (padding)
@@ -1229,7 +1603,10 @@ class TetraProtocolParser:
             return False
             
         # Check for high density of symbols (binary data often looks like symbols)
-        alnum = sum(1 for c in text if c.isalnum() or c == ' ')
+        if octets is not None:
+            alnum = octets.translate(_ALNUM_BLANK_TABLE).count(1)
+        else:
+            alnum = sum(1 for c in text if c.isalnum() or c == ' ')
         alnum_ratio = alnum / len(text)
         
         return ratio >= threshold and alnum_ratio > 0.5
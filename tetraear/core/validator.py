@@ -16,12 +16,12 @@ class TetraSignalValidator:
     VALID_MCC_MAX = 799  # End of commonly assigned MCCs
     
     # Common TETRA countries in Europe (for Poland/nearby)
-    EUROPEAN_TETRA_MCCS = {
+    EUROPEAN_TETRA_MCCS = frozenset({
         202, 204, 206, 208, 212, 213, 214, 216, 218, 219, 220, 222, 225, 226,
         228, 230, 231, 232, 234, 235, 238, 240, 242, 244, 246, 247, 248, 250,
         255, 257, 259, 260, 262, 266, 268, 270, 272, 274, 276, 278, 280, 282,
         283, 284, 286, 288, 290, 292, 293, 294, 295, 297
-    }
+    })
     
     # Poland TETRA operators (MCC 260)
     POLAND_MNC = {
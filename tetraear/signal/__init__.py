@@ -16,6 +16,9 @@ def __getattr__(name):
     elif name == "RTLCapture":
         from tetraear.signal.capture import RTLCapture
         return RTLCapture
+    elif name == "RingCapture":
+        from tetraear.signal.capture import RingCapture
+        return RingCapture
     elif name == "TetraSignalDetector":
         from tetraear.signal.scanner import TetraSignalDetector
         return TetraSignalDetector
@@ -27,6 +30,7 @@ def __getattr__(name):
 __all__ = [
     "SignalProcessor",
     "RTLCapture",
+    "RingCapture",
     "TetraSignalDetector",
     "FrequencyScanner",
 ]
@@ -25,7 +25,9 @@ if sys.platform == "win32":
 
 import numpy as np
 import logging
+import threading
 import warnings
+from collections import deque
 
 # Lazy import of RtlSdr to avoid DLL loading issues during import
 try:
@@ -41,12 +43,59 @@ except (ImportError, OSError):
     RTL_SDR_AVAILABLE = False
     RtlSdr = None  # type: ignore
 
+# Optional JIT acceleration for the byte -> sample conversion
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Sample rates the RTL2832U supports reliably (Hz)
+VALID_SAMPLE_RATES = (0.225e6, 0.9e6, 1.024e6, 1.536e6, 1.8e6, 1.92e6,
+                      2.048e6, 2.4e6, 2.56e6, 2.88e6, 3.2e6)
+
+# USB transfers librtlsdr keeps queued during an async read (its default;
+# pyrtlsdr's read_bytes_async always passes buf_num=0)
+ASYNC_TRANSFER_COUNT = 15
+
+# Unsigned 8-bit I/Q byte -> centred float, as pyrtlsdr's packed_bytes_to_iq
+# computes it (x / 127.5 - 1), rounded to single precision
+_IQ_BYTE_LUT = (np.arange(256) / 127.5 - 1).astype(np.float32)
+
+
+def _convert_iq_bytes_numpy(data: np.ndarray, lut: np.ndarray, out: np.ndarray) -> None:
+    """Map each I/Q byte through ``lut`` into the float32 array ``out``."""
+    np.take(lut, data, out=out)
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _convert_iq_bytes(data, lut, out):
+        """Map each I/Q byte through ``lut`` into ``out`` (JIT, split across cores)."""
+        for i in prange(data.shape[0]):
+            out[i] = lut[data[i]]
+else:
+    _convert_iq_bytes = _convert_iq_bytes_numpy
+
+
+def _iq_bytes_to_complex64(raw, out: np.ndarray) -> np.ndarray:
+    """Convert interleaved RTL-SDR I/Q bytes into the front of ``out``."""
+    data = np.frombuffer(raw, dtype=np.uint8)
+    count = min(len(data) // 2, len(out))
+    samples = out[:count]
+    # complex64 is interleaved float32 pairs, the same layout as the I/Q bytes
+    _convert_iq_bytes(data[:2 * count], _IQ_BYTE_LUT, samples.view(np.float32))
+    return samples
+
 
 class RTLCapture:
     """Handles RTL-SDR device configuration and signal capture."""
     
+    # Serial numbers from the first successful USB enumeration, shared by all captures
+    _device_serials = None
+    
     def __init__(self, frequency=400e6, sample_rate=1.8e6, gain='auto'):
         """
         Initialize RTL-SDR capture.
@@ -60,6 +109,7 @@ class RTLCapture:
         self.sample_rate = sample_rate
         self.gain = gain
         self.sdr = None
+        self._sample_buf = None
         
     def open(self):
         """
@@ -79,9 +129,7 @@ class RTLCapture:
             self.sdr = RtlSdr()
             
             # Validate and round sample rate to nearest valid RTL-SDR rate
-            # Valid rates: 0.225, 0.9, 1.024, 1.536, 1.8, 1.92, 2.048, 2.4, 2.56, 2.88, 3.2 MHz
-            valid_rates = [0.225e6, 0.9e6, 1.024e6, 1.536e6, 1.8e6, 1.92e6, 2.048e6, 2.4e6, 2.56e6, 2.88e6, 3.2e6]
-            closest_rate = min(valid_rates, key=lambda x: abs(x - self.sample_rate))
+            closest_rate = min(VALID_SAMPLE_RATES, key=lambda x: abs(x - self.sample_rate))
             if abs(closest_rate - self.sample_rate) > 0.1e6:  # More than 100kHz difference
                 logger.warning(f"Sample rate {self.sample_rate/1e6:.3f} MHz is not valid for RTL-SDR, using {closest_rate/1e6:.3f} MHz")
             self.sample_rate = closest_rate
@@ -101,11 +149,16 @@ class RTLCapture:
                 # Older librtlsdr.dll doesn't have this function
                 pass
             
-            # Try to get serial, but don't fail if we can't
-            try:
-                serial = self.sdr.get_device_serial_addresses()
-                logger.info(f"RTL-SDR opened: {serial}")
-            except Exception:
+            # Try to get serial, but don't fail if we can't. Enumerating USB is
+            # slow, so the result is kept for later reopens (e.g. while scanning)
+            if RTLCapture._device_serials is None:
+                try:
+                    RTLCapture._device_serials = self.sdr.get_device_serial_addresses()
+                except Exception:
+                    pass
+            if RTLCapture._device_serials is not None:
+                logger.info(f"RTL-SDR opened: {RTLCapture._device_serials}")
+            else:
                 logger.info("RTL-SDR opened (serial read not available)")
             
             logger.info(f"Frequency: {self.frequency/1e6:.2f} MHz")
@@ -148,14 +201,20 @@ class RTLCapture:
             num_samples: Number of samples to read
             
         Returns:
-            Complex numpy array of samples
+            complex64 numpy array of samples, valid until the next read; copy
+            to retain. It is a view of a buffer every read overwrites.
         """
         if self.sdr is None:
             raise RuntimeError("RTL-SDR device not opened")
         
         try:
-            samples = self.sdr.read_samples(num_samples)
-            return samples
+            raw = self.sdr.read_bytes(2 * num_samples)
+            # Convert straight into a persistent complex64 buffer instead of
+            # letting pyrtlsdr allocate a fresh complex128 array per read.
+            # Single precision is ample for 8-bit IQ.
+            if self._sample_buf is None or len(self._sample_buf) < num_samples:
+                self._sample_buf = np.empty(num_samples, dtype=np.complex64)
+            return _iq_bytes_to_complex64(raw, self._sample_buf[:num_samples])
         except (OSError, RuntimeError) as e:
             error_msg = str(e)
             # Check for access violation or device errors
@@ -208,3 +267,187 @@ class RTLCapture:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
         self.close()
+
+
+class RingCapture(RTLCapture):
+    """
+    RTL-SDR capture that streams into a ring of preallocated buffers.
+
+    A background thread runs pyrtlsdr's ``read_bytes_async`` and converts each
+    USB transfer straight into free complex64 slots, so the device keeps streaming
+    while the caller processes the previous chunk. The USB transfer size is
+    independent of the chunk size: librtlsdr queues ``ASYNC_TRANSFER_COUNT``
+    transfers of ``buffer_size`` bytes and consecutive transfers are packed into
+    one slot. When every slot is full the incoming transfer is dropped and
+    counted in ``dropped_buffers``. A retune discards every queued transfer.
+    """
+
+    def __init__(self, frequency=400e6, sample_rate=1.8e6, gain='auto',
+                 num_samples=1024*1024, num_buffers=4, buffer_size=262144):
+        """
+        Initialize ring-buffered RTL-SDR capture.
+
+        Args:
+            frequency: Center frequency in Hz
+            sample_rate: Sample rate in Hz
+            gain: Gain setting ('auto' or numeric value)
+            num_samples: Samples per buffer (fixed for the whole stream)
+            num_buffers: Number of preallocated ring slots (at least 2)
+            buffer_size: Bytes per USB transfer (multiple of 512)
+
+        Raises:
+            ValueError: If buffer_size is not a positive multiple of 512
+        """
+        if buffer_size <= 0 or buffer_size % 512:
+            raise ValueError(f"Invalid USB buffer size: {buffer_size}")
+        super().__init__(frequency=frequency, sample_rate=sample_rate, gain=gain)
+        self.num_samples = int(num_samples)
+        self.num_buffers = max(2, int(num_buffers))
+        self.buffer_size = int(buffer_size)
+        self.dropped_buffers = 0
+        self._slots = [np.empty(self.num_samples, dtype=np.complex64)
+                       for _ in range(self.num_buffers)]
+        self._cond = threading.Condition()
+        self._free = deque()
+        self._ready = deque()
+        self._held = None
+        self._fill = None
+        self._fill_length = 0
+        self._skip = 0
+        self._generation = 0
+        self._thread = None
+        self._error = None
+
+    def open(self):
+        """
+        Open the RTL-SDR device and start streaming into the ring.
+
+        Returns:
+            bool: True if device opened successfully, False otherwise
+        """
+        if not super().open():
+            return False
+        with self._cond:
+            self._free = deque(range(self.num_buffers))
+            self._ready.clear()
+            self._held = None
+            self._fill = None
+            self._skip = 0
+            self._error = None
+        self._thread = threading.Thread(target=self._stream, name="RingCapture", daemon=True)
+        self._thread.start()
+        return True
+
+    def _stream(self):
+        """Run the blocking async read loop until it is cancelled."""
+        try:
+            self.sdr.read_bytes_async(self._on_bytes, self.buffer_size)
+        except Exception as e:
+            logger.error(f"RTL-SDR async read failed: {e}")
+            with self._cond:
+                self._error = e
+        finally:
+            with self._cond:
+                self._cond.notify_all()
+
+    def _on_bytes(self, raw, context=None):
+        """Pack one USB transfer into the slot being filled (async read callback)."""
+        # _fill / _fill_length are only touched here and by open() before the
+        # stream starts, and librtlsdr runs this callback on one thread, so
+        # they need no lock; the lists shared with readers do
+        data = np.frombuffer(raw, dtype=np.uint8)
+        with self._cond:
+            if self._skip:
+                # Transfer started before a retune; discard it with any partial slot
+                self._skip -= 1
+                if self._fill is not None:
+                    self._free.append(self._fill)
+                    self._fill = None
+                return
+            generation = self._generation
+        while len(data) >= 2:
+            if self._fill is None:
+                with self._cond:
+                    if not self._free:
+                        self.dropped_buffers += 1
+                        return
+                    self._fill = self._free.popleft()
+                self._fill_length = 0
+            # Only this thread writes to a slot taken from the free list
+            count = len(_iq_bytes_to_complex64(data, self._slots[self._fill][self._fill_length:]))
+            data = data[2 * count:]
+            self._fill_length += count
+            if self._fill_length == self.num_samples:
+                with self._cond:
+                    index, self._fill = self._fill, None
+                    if generation != self._generation:
+                        # Retuned while this transfer was being packed; drop it
+                        self._free.append(index)
+                        return
+                    self._ready.append((index, self._fill_length))
+                    self._cond.notify()
+
+    def read_samples(self, num_samples=None, timeout=5.0):
+        """
+        Return the next buffered chunk of samples.
+
+        The returned array is a view of a ring slot and stays valid until the
+        next call; copy it if it must outlive that.
+
+        Args:
+            num_samples: Chunk size; optional, but must match the one fixed at
+                construction when given
+            timeout: Seconds to wait for a buffer before giving up
+
+        Returns:
+            complex64 numpy array of samples
+
+        Raises:
+            ValueError: If num_samples differs from the ring's chunk size
+            RuntimeError: If the device is not streaming or no data arrives
+        """
+        if num_samples is not None and int(num_samples) != self.num_samples:
+            raise ValueError(f"RingCapture returns {self.num_samples}-sample chunks, "
+                             f"not {num_samples}")
+        if self.sdr is None or self._thread is None:
+            raise RuntimeError("RTL-SDR device not opened")
+
+        with self._cond:
+            if self._held is not None:
+                self._free.append(self._held)
+                self._held = None
+            if not self._cond.wait_for(
+                    lambda: self._ready or self._error is not None or not self._thread.is_alive(),
+                    timeout):
+                raise RuntimeError("Timed out waiting for RTL-SDR samples")
+            if not self._ready:
+                raise RuntimeError(f"RTL-SDR stream stopped: {self._error}")
+            index, length = self._ready.popleft()
+            self._held = index
+        return self._slots[index][:length]
+
+    def set_frequency(self, frequency: float):
+        """
+        Change center frequency and discard samples captured before the retune.
+
+        Args:
+            frequency: New center frequency in Hz
+        """
+        super().set_frequency(frequency)
+        with self._cond:
+            self._free.extend(index for index, _ in self._ready)
+            self._ready.clear()
+            # Every transfer already queued in librtlsdr holds pre-retune samples
+            self._skip = ASYNC_TRANSFER_COUNT
+            self._generation += 1
+
+    def close(self):
+        """Stop streaming and close RTL-SDR device."""
+        if self.sdr is not None and self._thread is not None:
+            try:
+                self.sdr.cancel_read_async()
+            except Exception as e:
+                logger.warning(f"Failed to cancel async read: {e}")
+            self._thread.join(timeout=5.0)
+        self._thread = None
+        super().close()
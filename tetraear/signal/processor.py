@@ -8,12 +8,333 @@ Implements π/4-DQPSK demodulation according to TETRA specifications:
 - Modulation: π/4-DQPSK with phase transitions per Table 5.1
 """
 
+import math
+from fractions import Fraction
+from functools import lru_cache
+from typing import Tuple
 import numpy as np
 from scipy import signal
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Optional JIT acceleration for the per-symbol demodulation kernel
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Upper bound for memoized filter designs (one per cutoff / rate ratio)
+FILTER_CACHE_SIZE = 32
+
+# Largest reduced up/down factor resampled with a polyphase FIR; beyond it the
+# filter gets long enough that the FFT resampler is the better choice
+MAX_POLYPHASE_FACTOR = 1000
+
+# Length of the halfband FIR used for each decimate-by-2 stage (4k + 3 taps,
+# so the outermost taps are non-zero)
+HALFBAND_TAPS = 23
+
+# π/4-DQPSK decision boundaries between the valid phase transitions
+# (-3π/4, -π/4, +π/4, +3π/4), and the symbol for each np.digitize bin.
+# Mapping to bits (MSB, LSB) for symbols_to_bits (val >> 1, val & 1):
+# +π/4  -> Bits (0,0) -> Symbol 0
+# +3π/4 -> Bits (0,1) -> Symbol 1
+# -π/4  -> Bits (1,0) -> Symbol 2
+# -3π/4 -> Bits (1,1) -> Symbol 3 (both outer bins, wrapping around ±π)
+_DQPSK_PHASE_THRESHOLDS = np.array([-5 * np.pi / 8, -3 * np.pi / 8, 3 * np.pi / 8, 5 * np.pi / 8])
+_DQPSK_BIN_SYMBOLS = np.array([3, 2, 0, 1, 3], dtype=np.uint8)
+
+# tan(3π/8): the ±3π/8 and ±5π/8 boundaries as slope tests, without atan2
+_DQPSK_TAN_3PI_8 = math.tan(3 * np.pi / 8)
+
+
+@lru_cache(maxsize=FILTER_CACHE_SIZE)
+def _lowpass_sos(cutoff: float) -> np.ndarray:
+    """4th-order Butterworth lowpass as second-order sections (cutoff relative to Nyquist)."""
+    # Second-order sections stay stable at low cutoffs where (b, a) does not
+    return signal.butter(4, cutoff, btype='low', output='sos')
+
+
+@lru_cache(maxsize=FILTER_CACHE_SIZE)
+def _lowpass_zi(cutoff: float) -> Tuple[np.ndarray, int]:
+    """Step-response initial state and odd-extension length sosfiltfilt uses for _lowpass_sos."""
+    sos = _lowpass_sos(cutoff)
+    zeros = min((sos[:, 2] == 0).sum(), (sos[:, 5] == 0).sum())
+    return signal.sosfilt_zi(sos), 3 * (2 * len(sos) + 1 - int(zeros))
+
+
+@lru_cache(maxsize=FILTER_CACHE_SIZE)
+def _polyphase_fir(up: int, down: int) -> np.ndarray:
+    """Anti-aliasing FIR that scipy.signal.resample_poly designs by default for up/down."""
+    max_rate = max(up, down)
+    return signal.firwin(20 * max_rate + 1, 1.0 / max_rate, window=('kaiser', 5.0))
+
+
+@lru_cache(maxsize=1)
+def _halfband_fir() -> np.ndarray:
+    """Halfband lowpass (cutoff fs/4, >80 dB stopband above 0.375 fs) for decimating by 2."""
+    # Odd-length windowed sinc at half Nyquist: every other tap off centre is zero
+    return signal.firwin(HALFBAND_TAPS, 0.5, window=('kaiser', 8.0))
+
+
+def _scratch_array(scratch, key, size: int, dtype) -> np.ndarray:
+    """
+    Array of ``size`` elements from a scratch pool, or a fresh one without a pool.
+    
+    Pool entries are keyed by (key, dtype) and only grow, so repeated calls at a
+    steady chunk size reuse the same memory. The contents are overwritten by the
+    next call with the same key.
+    """
+    if scratch is None:
+        return np.empty(size, dtype=dtype)
+    dtype = np.dtype(dtype)
+    buffer = scratch.get((key, dtype))
+    if buffer is None or len(buffer) < size:
+        buffer = scratch[(key, dtype)] = np.empty(size, dtype=dtype)
+    return buffer[:size]
+
+
+def _resample_poly(samples: np.ndarray, up: int, down: int,
+                   scratch=None, key=None) -> np.ndarray:
+    """resample_poly with the default FIR memoized, in the precision of the input."""
+    fir = _polyphase_fir(up, down).astype(samples.real.dtype)
+    if np.iscomplexobj(samples):
+        # Two real passes are about twice as fast as one complex pass
+        real = signal.resample_poly(samples.real, up, down, window=fir)
+        resampled = _scratch_array(scratch if key is not None else None, key,
+                                   len(real), samples.dtype)
+        resampled.real = real
+        resampled.imag = signal.resample_poly(samples.imag, up, down, window=fir)
+        return resampled
+    return signal.resample_poly(samples, up, down, window=fir)
+
+
+def _halfband_decimate(samples: np.ndarray, scratch=None, key=None) -> np.ndarray:
+    """
+    Decimate by 2 with the halfband FIR, as resample_poly(samples, 1, 2) would.
+    
+    Work arrays come from ``scratch`` when given; the output too if ``key`` is set.
+    """
+    taps = _halfband_fir().astype(samples.real.dtype)
+    half = len(taps) // 2
+    count = (len(samples) + 1) // 2
+    padded = _scratch_array(scratch, 'halfband_padded', len(samples) + 2 * half + 1, samples.dtype)
+    padded[:half] = 0
+    padded[half:half + len(samples)] = samples
+    padded[half + len(samples):] = 0
+    decimated = _scratch_array(scratch if key is not None else None, key, count, samples.dtype)
+    pair = _scratch_array(scratch, 'halfband_pair', count, samples.dtype)
+    # Zero phase: output m is centred on input 2m. Only the centre tap and odd
+    # offsets are non-zero and the filter is symmetric, so each output costs
+    # one multiply per tap pair
+    np.multiply(padded[half:half + 2 * count:2], taps[half], out=decimated)
+    for k in range(1, half + 1, 2):
+        np.add(padded[half - k:half - k + 2 * count:2],
+               padded[half + k:half + k + 2 * count:2], out=pair)
+        pair *= taps[half + k]
+        decimated += pair
+    return decimated
+
+
+@lru_cache(maxsize=FILTER_CACHE_SIZE)
+def _symbol_timing(sample_rate: float, symbol_rate: float) -> Tuple[int, int, int]:
+    """
+    Whole samples per symbol for a sample rate, and the up/down ratio that gets there.
+    
+    Rates that are not a whole number of samples per symbol (e.g. 240 kHz for
+    18 kHz symbols, 13.33 samples each) are resampled to the nearest whole
+    number, so picking every n-th sample does not drift across symbols.
+    """
+    ratio = Fraction(sample_rate / symbol_rate).limit_denominator(MAX_POLYPHASE_FACTOR)
+    samples_per_symbol = max(1, round(ratio))
+    if ratio == samples_per_symbol or samples_per_symbol == 1:
+        return 1, 1, samples_per_symbol
+    resampling = (samples_per_symbol / ratio).limit_denominator(MAX_POLYPHASE_FACTOR)
+    return resampling.numerator, resampling.denominator, samples_per_symbol
+
+
+def _decimate(samples, factor: int, scratch=None) -> np.ndarray:
+    """
+    Zero-phase FIR decimation: a halfband stage per factor of 2, then polyphase.
+    
+    With a ``scratch`` pool only the returned array is newly allocated.
+    """
+    samples = np.asarray(samples)
+    if samples.dtype.char not in 'fdgFDG':
+        samples = samples.astype(np.float64)
+    stage = 0
+    while factor % 2 == 0:
+        factor //= 2
+        # Stages feeding another stage write into the pool, alternating keys
+        last = factor == 1
+        samples = _halfband_decimate(samples, scratch, None if last else ('halfband', stage % 2))
+        stage += 1
+    if factor > 1:
+        samples = _resample_poly(samples, 1, factor)
+    return samples
+
+
+def _mix(samples: np.ndarray, phase_step: float) -> np.ndarray:
+    """Multiply samples by the oscillator e^(j·phase_step·n); complex64 input stays complex64."""
+    # cos/sin written straight into one complex buffer (cheaper than a complex
+    # exp), then mixed in place
+    phase = np.arange(len(samples)) * phase_step
+    shifted = np.empty(len(samples), dtype=np.result_type(samples, np.complex64))
+    np.cos(phase, out=shifted.real)
+    np.sin(phase, out=shifted.imag)
+    shifted *= samples
+    return shifted
+
+
+def _mix_and_filter_numpy(samples: np.ndarray, sos: np.ndarray, zi: np.ndarray,
+                          padlen: int, phase_step: float) -> np.ndarray:
+    """Mix then zero-phase filter, as two passes (sosfiltfilt derives zi / padlen itself)."""
+    if phase_step:
+        samples = _mix(samples, phase_step)
+    return signal.sosfiltfilt(sos, samples)
+
+
+def _dqpsk_phase_symbols_numpy(re: np.ndarray, im: np.ndarray) -> np.ndarray:
+    """π/4-DQPSK symbols for phase steps re + j·im, with the _DQPSK_PHASE_THRESHOLDS bins."""
+    return _DQPSK_BIN_SYMBOLS[np.digitize(np.arctan2(im, re), _DQPSK_PHASE_THRESHOLDS)]
+
+
+def _demodulate_dqpsk_numpy(samples: np.ndarray, tiny: float) -> Tuple[np.ndarray, bool]:
+    """
+    Quantize the phase step between consecutive samples to π/4-DQPSK symbols.
+    
+    Also reports whether every step product stayed within [tiny, inf), i.e.
+    whether the unnormalized samples were safe to demodulate as they are.
+    """
+    # Differential detection: Δφ = arg(sample * conj(prev_sample)) in [-π, π]
+    diff = samples[1:] * np.conj(samples[:-1])
+    re, im = diff.real, diff.imag
+    
+    # Quantize to the nearest valid phase transition (±π/4, ±3π/4) with slope
+    # tests instead of arctan2: 0 within 3π/8 of 0, 1 / 2 within π/8 of ±π/2,
+    # 3 otherwise (including NaN); the masks are disjoint, so subtract them
+    re_slope = np.abs(re) * _DQPSK_TAN_3PI_8
+    symbols = np.full(len(diff), 3, dtype=np.uint8)
+    symbols -= ((re > 0) & (np.abs(im) < re_slope)).view(np.uint8) * np.uint8(3)
+    symbols -= ((im > 0) & (re_slope <= im)).view(np.uint8) << 1
+    symbols -= ((im < 0) & (re_slope <= -im)).view(np.uint8)
+    
+    # Signed zeros and infinite steps defeat the slope tests: redo those from the angle
+    special = np.flatnonzero(((re == 0) & (im == 0)) | np.isinf(re_slope))
+    if len(special):
+        symbols[special] = _dqpsk_phase_symbols_numpy(re[special], im[special])
+    magnitude = np.abs(re) + np.abs(im)
+    in_range = bool(np.all(magnitude >= tiny) and np.all(magnitude < np.inf))
+    return symbols, in_range
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _dqpsk_phase_symbol(phase):
+        """π/4-DQPSK symbol for one phase step, with the _DQPSK_PHASE_THRESHOLDS bins (JIT)."""
+        if phase < -5 * np.pi / 8:
+            return 3
+        if phase < -3 * np.pi / 8:
+            return 2
+        if phase < 3 * np.pi / 8:
+            return 0
+        if phase < 5 * np.pi / 8:
+            return 1
+        return 3
+    
+    @njit(cache=True)
+    def _demodulate_dqpsk(samples, tiny):
+        """Quantize the phase step between consecutive complex samples (JIT, one fused pass)."""
+        out = np.empty(samples.shape[0] - 1, np.uint8)
+        slope = _DQPSK_TAN_3PI_8
+        special = False
+        in_range = True
+        for i in range(out.shape[0]):
+            cur = samples[i + 1]
+            prev = samples[i]
+            re = cur.real * prev.real + cur.imag * prev.imag
+            im = cur.imag * prev.real - cur.real * prev.imag
+            # Bins as slope tests, branch-free: 0 within 3π/8 of 0, 1 / 2 within
+            # π/8 of ±π/2, 3 otherwise (including NaN)
+            re_slope = abs(re) * slope
+            out[i] = (3 - 3 * ((re > 0.0) & (abs(im) < slope * re))
+                      - 2 * ((im > 0.0) & (re_slope <= im))
+                      - ((im < 0.0) & (re_slope <= -im)))
+            special |= ((re == 0.0) & (im == 0.0)) | (re_slope == math.inf)
+            magnitude = abs(re) + abs(im)
+            in_range &= (magnitude >= tiny) & (magnitude < math.inf)
+        
+        # Signed zeros and infinite steps defeat the slope tests: redo those from the angle
+        if special:
+            for i in range(out.shape[0]):
+                cur = samples[i + 1]
+                prev = samples[i]
+                re = cur.real * prev.real + cur.imag * prev.imag
+                im = cur.imag * prev.real - cur.real * prev.imag
+                if (re == 0.0 and im == 0.0) or abs(re) * slope == math.inf:
+                    out[i] = _dqpsk_phase_symbol(math.atan2(im, re))
+        return out, in_range
+    
+    @njit(cache=True)
+    def _mix_and_filter(samples, sos, zi, padlen, phase_step):
+        """sosfiltfilt of the mixed samples with the mixer folded into the forward pass (JIT)."""
+        n = samples.shape[0]
+        total = n + 2 * padlen
+        y = np.empty(total, dtype=samples.dtype)
+        first = complex(samples[0])
+        theta = phase_step * (n - 1)
+        last = samples[n - 1] * complex(math.cos(theta), math.sin(theta))
+        step = complex(math.cos(phase_step), math.sin(phase_step))
+        state = np.empty((sos.shape[0], 2), dtype=np.complex128)
+        phasor = 1.0 + 0.0j
+        
+        # Forward pass over the odd extension of the mixed signal, as sosfiltfilt pads it
+        for i in range(total):
+            k = i - padlen
+            if 0 <= k < n:
+                if k % 1024 == 0:
+                    # Re-anchor the rotating phasor so rounding does not accumulate
+                    theta = phase_step * k
+                    phasor = complex(math.cos(theta), math.sin(theta))
+                x = samples[k] * phasor
+                phasor *= step
+            else:
+                edge = first if k < 0 else last
+                k = -k if k < 0 else 2 * (n - 1) - k
+                theta = phase_step * k
+                x = 2 * edge - samples[k] * complex(math.cos(theta), math.sin(theta))
+            if i == 0:
+                for s in range(sos.shape[0]):
+                    state[s, 0] = zi[s, 0] * x
+                    state[s, 1] = zi[s, 1] * x
+            # Cascade of direct form II transposed sections, as sosfilt runs them
+            for s in range(sos.shape[0]):
+                out = sos[s, 0] * x + state[s, 0]
+                state[s, 0] = sos[s, 1] * x - sos[s, 4] * out + state[s, 1]
+                state[s, 1] = sos[s, 2] * x - sos[s, 5] * out
+                x = out
+            y[i] = x
+        
+        # Backward pass in place
+        x = complex(y[total - 1])
+        for s in range(sos.shape[0]):
+            state[s, 0] = zi[s, 0] * x
+            state[s, 1] = zi[s, 1] * x
+        for i in range(total - 1, -1, -1):
+            x = complex(y[i])
+            for s in range(sos.shape[0]):
+                out = sos[s, 0] * x + state[s, 0]
+                state[s, 0] = sos[s, 1] * x - sos[s, 4] * out + state[s, 1]
+                state[s, 1] = sos[s, 2] * x - sos[s, 5] * out
+                x = out
+            y[i] = x
+        return y[padlen:padlen + n]
+else:
+    _demodulate_dqpsk = _demodulate_dqpsk_numpy
+    _mix_and_filter = _mix_and_filter_numpy
+
 
 class SignalProcessor:
     """Processes raw IQ samples for TETRA demodulation."""
@@ -25,12 +346,18 @@ class SignalProcessor:
         Args:
             sample_rate: Sample rate in Hz (default: 2.4 MHz per TETRA spec)
         """
+        if not 0 < sample_rate < np.inf:
+            raise ValueError(f"Invalid sample rate: {sample_rate}")
         self.sample_rate = sample_rate
         # TETRA uses π/4-DQPSK modulation at 18 kHz symbol rate
         self.symbol_rate = 18000  # Hz (TETRA standard symbol rate)
-        self.samples_per_symbol = int(sample_rate / self.symbol_rate)
+        # Whole samples per symbol extract_symbols picks from at the capture rate
+        # (process() decimates first, so it works at the decimated rate's value)
+        self.samples_per_symbol = _symbol_timing(sample_rate, self.symbol_rate)[2]
         # Store symbols for voice extraction
         self.symbols = None
+        # Intermediate arrays reused across process() calls (see _scratch_array)
+        self._scratch = {}
         
     def resample(self, samples, target_rate):
         """
@@ -45,10 +372,23 @@ class SignalProcessor:
         """
         num_samples = len(samples)
         new_num_samples = int(num_samples * target_rate / self.sample_rate)
+        
+        # Integer rates: polyphase FIR at the reduced up/down ratio, without
+        # transforming the whole buffer (and without FFT wrap-around at the edges)
+        target_hz, source_hz = float(target_rate), float(self.sample_rate)
+        if target_hz.is_integer() and source_hz.is_integer():
+            common = math.gcd(int(target_hz), int(source_hz))
+            up, down = int(target_hz) // common, int(source_hz) // common
+            if 0 < up <= MAX_POLYPHASE_FACTOR and 0 < down <= MAX_POLYPHASE_FACTOR:
+                samples = np.asarray(samples)
+                if samples.dtype.char not in 'fdgFDG':
+                    samples = samples.astype(np.float64)
+                return _resample_poly(samples, up, down)[:new_num_samples]
+        
         resampled = signal.resample(samples, new_num_samples)
         return resampled
     
-    def filter_signal(self, samples, bandwidth=25000, sample_rate=None):
+    def filter_signal(self, samples, bandwidth=25000, sample_rate=None, freq_offset=0):
         """
         Apply bandpass filter to isolate TETRA signal channel.
         
@@ -59,6 +399,8 @@ class SignalProcessor:
             samples: Input samples
             bandwidth: Filter bandwidth in Hz (default: 25 kHz for TETRA)
             sample_rate: Sample rate in Hz (optional, defaults to self.sample_rate)
+            freq_offset: Frequency correction in Hz applied before filtering,
+                as frequency_shift would (mixed in the same pass)
             
         Returns:
             Filtered samples
@@ -73,14 +415,22 @@ class SignalProcessor:
         # Filter should pass TETRA channel bandwidth (25 kHz)
         cutoff = (bandwidth / 2) / nyquist
         cutoff = min(0.99, max(0.01, cutoff))  # Ensure valid range
+        samples = np.asarray(samples)
+        phase_step = -2 * np.pi * freq_offset / fs
         
         try:
-            b, a = signal.butter(4, cutoff, btype='low')
-            filtered = signal.filtfilt(b, a, samples)
-            return filtered
+            sos = _lowpass_sos(cutoff)
+            if samples.dtype.char in 'fF':
+                # Keep complex64 capture data in single precision
+                sos = sos.astype(np.float32)
+            zi, padlen = _lowpass_zi(cutoff)
+            if np.iscomplexobj(samples) and len(samples) > padlen:
+                return _mix_and_filter(samples, sos, zi, padlen, phase_step)
+            return _mix_and_filter_numpy(samples, sos, zi, padlen, phase_step)
         except Exception as e:
             logger.warning(f"Filter design failed, using unfiltered samples: {e}")
-            return samples
+            # The frequency correction still applies
+            return _mix(samples, phase_step) if phase_step else samples
     
     def frequency_shift(self, samples, freq_offset, sample_rate=None):
         """
@@ -95,9 +445,8 @@ class SignalProcessor:
             Frequency-shifted samples
         """
         fs = sample_rate if sample_rate is not None else self.sample_rate
-        t = np.arange(len(samples)) / fs
-        shift = np.exp(-1j * 2 * np.pi * freq_offset * t)
-        return samples * shift
+        # Oscillator e^(-j2π·f·n/fs)
+        return _mix(np.asarray(samples), -2 * np.pi * freq_offset / fs)
     
     def demodulate_dqpsk(self, samples):
         """
@@ -120,50 +469,30 @@ class SignalProcessor:
         if len(samples) < 2:
             return np.array([], dtype=np.uint8)
         
+        samples = np.asarray(samples)
+        demodulate = _demodulate_dqpsk if samples.dtype.kind == 'c' else _demodulate_dqpsk_numpy
+        
+        # Phase steps do not depend on the signal's scale, so demodulate the
+        # samples as they are; only if a step product left the normal float
+        # range (overflow, underflow, zeros, NaN) redo it on normalized samples
+        if samples.dtype.kind in 'fc':
+            with np.errstate(over='ignore', under='ignore'):
+                symbols, in_range = demodulate(samples, np.finfo(samples.dtype).tiny)
+            if in_range:
+                return symbols
+        
         # Normalize samples to prevent overflow
-        sample_power = np.abs(samples)
-        max_power = np.max(sample_power)
+        if samples.dtype.kind == 'c':
+            # Peak |s|² needs no square roots; only if squaring over- or
+            # underflows is the peak taken from |s| instead
+            with np.errstate(over='ignore', under='ignore'):
+                peak_power = np.max(samples.real * samples.real + samples.imag * samples.imag)
+            if 0 < peak_power < np.inf:
+                return demodulate(samples * (1 / np.sqrt(peak_power)), 0.0)[0]
+        max_power = np.max(np.abs(samples))
         if max_power > 0:
             samples = samples / max_power
-        
-        # Differential detection: phase difference between consecutive symbols
-        symbols = []
-        prev_sample = samples[0]
-        
-        # TETRA π/4-DQPSK uses 8 constellation points at multiples of π/4
-        # Phase transitions are: ±π/4, ±3π/4
-        for sample in samples[1:]:
-            # Calculate differential phase: Δφ = arg(sample * conj(prev_sample))
-            diff = sample * np.conj(prev_sample)
-            phase_diff = np.angle(diff)
-            
-            # Normalize phase to [-π, π]
-            phase_diff = np.arctan2(np.imag(diff), np.real(diff))
-            
-            # Map phase difference to TETRA symbol according to spec
-            # Quantize to nearest valid phase transition
-            # Valid transitions: -3π/4, -π/4, +π/4, +3π/4
-            # Mapping to bits (MSB, LSB) for symbols_to_bits (val >> 1, val & 1):
-            # +π/4  -> Bits (0,0) -> Symbol 0
-            # +3π/4 -> Bits (0,1) -> Symbol 1
-            # -π/4  -> Bits (1,0) -> Symbol 2
-            # -3π/4 -> Bits (1,1) -> Symbol 3
-            
-            if phase_diff < -5*np.pi/8:
-                symbol = 3  # Closest to -3π/4 (bits: 1,1)
-            elif phase_diff < -3*np.pi/8:
-                symbol = 2  # Closest to -π/4 (bits: 1,0)
-            elif phase_diff < 3*np.pi/8:
-                symbol = 0  # Closest to +π/4 (bits: 0,0)
-            elif phase_diff < 5*np.pi/8:
-                symbol = 1  # Closest to +3π/4 (bits: 0,1)
-            else:
-                symbol = 3  # Wrap around to -3π/4
-            
-            symbols.append(symbol)
-            prev_sample = sample
-        
-        return np.array(symbols, dtype=np.uint8)
+        return demodulate(samples, 0.0)[0]
     
     def extract_symbols(self, samples, sample_rate=None):
         """
@@ -180,39 +509,45 @@ class SignalProcessor:
             return np.array([], dtype=complex)
         
         fs = sample_rate if sample_rate is not None else self.sample_rate
-        samples_per_symbol = int(fs / self.symbol_rate)
+        up, down, samples_per_symbol = _symbol_timing(fs, self.symbol_rate)
         
         # Downsample to symbol rate using decimation
         if samples_per_symbol > 1:
+            if up != down:
+                # Resample to a whole number of samples per symbol first
+                samples = np.asarray(samples)
+                if samples.dtype.char not in 'fdgFDG':
+                    samples = samples.astype(np.float64)
+                samples = _resample_poly(samples, up, down, self._scratch, 'symbol_timing')
+            
             # Simple timing recovery: Find the phase with maximum average power
             # This helps align with the symbol centers (RRC pulse peaks)
-            best_phase = 0
-            max_power = -1
-            
-            # Check a few phases to find the best alignment
             # We don't need to check every sample, just enough to find the peak
             step = max(1, samples_per_symbol // 8)
+            phases = np.arange(0, samples_per_symbol, step)
             
-            for phase in range(0, samples_per_symbol, step):
-                # Extract symbols at this phase
-                num_symbols = (len(samples) - phase) // samples_per_symbol
-                if num_symbols <= 0:
-                    continue
-                    
-                indices = phase + np.arange(num_symbols) * samples_per_symbol
-                phase_samples = samples[indices]
-                
-                # Calculate average power for this phase
-                power = np.mean(np.abs(phase_samples)**2)
+            # Average power of every checked phase in one pass, over the symbol
+            # periods that fit entirely after it: all but the last whole period,
+            # plus that one for phases up to the leftover sample count
+            full_periods, remainder = divmod(len(samples), samples_per_symbol)
+            best_phase = 0
+            if full_periods > 0:
+                periods = samples[:full_periods * samples_per_symbol].reshape(full_periods, samples_per_symbol)
+                power = np.abs(periods[:, phases]) ** 2
+                in_last = phases <= remainder
+                sums = power[:-1].sum(axis=0)
+                sums[in_last] += power[-1, in_last]
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    phase_power = sums / (full_periods - 1 + in_last)
                 
-                if power > max_power:
-                    max_power = power
-                    best_phase = phase
+                # Phases without a whole period (or with NaN power) never win
+                phase_power[np.isnan(phase_power)] = -1
+                best_phase = int(phases[np.argmax(phase_power)])
             
             # Extract using the best phase
             num_symbols = (len(samples) - best_phase) // samples_per_symbol
-            indices = best_phase + np.arange(num_symbols) * samples_per_symbol
-            symbols = samples[indices]
+            stop = best_phase + num_symbols * samples_per_symbol
+            symbols = samples[best_phase:stop:samples_per_symbol].copy()
         else:
             symbols = samples
         
@@ -248,20 +583,18 @@ class SignalProcessor:
         if current_rate > target_rate * 2:
             decimation_factor = int(current_rate / target_rate)
             if decimation_factor > 1:
-                # Use scipy.signal.decimate which includes a low-pass filter to prevent aliasing
+                # Decimate with zero-phase FIR stages, low-pass filtering to prevent aliasing
                 # This is much more efficient than processing at full rate
                 try:
-                    samples = signal.decimate(samples, decimation_factor)
+                    samples = _decimate(samples, decimation_factor, self._scratch)
                     current_rate = current_rate / decimation_factor
                 except Exception as e:
                     logger.warning(f"Decimation failed: {e}")
         
-        # Apply frequency correction if needed
-        if freq_offset != 0:
-            samples = self.frequency_shift(samples, freq_offset, sample_rate=current_rate)
-        
-        # Filter signal to isolate TETRA channel (25 kHz bandwidth)
-        filtered = self.filter_signal(samples, bandwidth=25000, sample_rate=current_rate)
+        # Correct the frequency offset and filter to isolate the TETRA channel
+        # (25 kHz bandwidth) in one pass
+        filtered = self.filter_signal(samples, bandwidth=25000, sample_rate=current_rate,
+                                      freq_offset=freq_offset)
         
         # Extract symbols at symbol rate (18 kHz)
         symbols = self.extract_symbols(filtered, sample_rate=current_rate)
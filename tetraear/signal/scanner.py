@@ -52,7 +52,7 @@ class TetraSignalDetector:
         if samples.size == 0:
             return float(self.bottom_threshold)
         power = np.mean(np.abs(samples) ** 2)
-        return 10 * np.log10(power + 1e-10)  # Add small value to avoid log(0)
+        return float(10 * np.log10(power + 1e-10))  # Add small value to avoid log(0)
     
     def detect_tetra_modulation(self, samples: np.ndarray) -> Tuple[bool, float]:
         """
@@ -18,7 +18,7 @@ from pathlib import Path
 
 import numpy as np
 
-from tetraear.signal.capture import RTLCapture
+from tetraear.signal.capture import RingCapture
 from tetraear.signal.processor import SignalProcessor
 from tetraear.core.decoder import TetraDecoder
 from tetraear.audio.voice import VoiceProcessor
@@ -142,7 +142,9 @@ def main() -> int:
     frequency_hz = args.frequency * 1e6
     sample_rate_hz = args.sample_rate * 1e6
 
-    capture = RTLCapture(frequency=frequency_hz, sample_rate=sample_rate_hz, gain=args.gain)
+    capture = RingCapture(
+        frequency=frequency_hz, sample_rate=sample_rate_hz, gain=args.gain, num_samples=args.chunk
+    )
     if not capture.open():
         print("[FAIL] Could not open RTL-SDR device.")
         return 1
@@ -190,7 +190,7 @@ from scipy.signal import resample
 import subprocess
 import tempfile
 
-from tetraear.signal.capture import RTLCapture
+from tetraear.signal.capture import RTLCapture, VALID_SAMPLE_RATES
 from tetraear.signal.processor import SignalProcessor
 from tetraear.core.decoder import TetraDecoder
 from tetraear.core.crypto import TetraKeyManager
@@ -1836,9 +1836,7 @@ class CaptureThread(QThread):
     def set_sample_rate(self, rate):
         """Set sample rate."""
         # Validate sample rate - RTL-SDR has limited valid rates
-        # Valid rates: 0.225, 0.9, 1.024, 1.536, 1.8, 1.92, 2.048, 2.4, 2.56, 2.88, 3.2 MHz
-        valid_rates = [0.225e6, 0.9e6, 1.024e6, 1.536e6, 1.8e6, 1.92e6, 2.048e6, 2.4e6, 2.56e6, 2.88e6, 3.2e6]
-        closest_rate = min(valid_rates, key=lambda x: abs(x - rate))
+        closest_rate = min(VALID_SAMPLE_RATES, key=lambda x: abs(x - rate))
         if abs(closest_rate - rate) > 0.1e6:  # More than 100kHz difference
             self.error_occurred.emit(f"Sample rate {rate/1e6:.3f} MHz is not valid, using {closest_rate/1e6:.3f} MHz")
         rate = closest_rate
@@ -2119,11 +2117,9 @@ class CaptureThread(QThread):
                                                         voice_bits = np.array(bit_list, dtype=np.uint8)
                                                 
                                                 # Check if frame is encrypted and decrypted - OVERRIDE bits
-                                                if frame.get('decrypted') and 'decrypted_payload' in frame:
+                                                if frame.get('decrypted') and 'decrypted_bytes' in frame:
                                                     try:
-                                                        payload_str = frame['decrypted_payload']
-                                                        # Convert string '0101...' to list of ints
-                                                        voice_bits = np.array([int(b) for b in payload_str], dtype=np.uint8)
+                                                        voice_bits = TetraDecoder.payload_bits(frame['decrypted_bytes'])
                                                     except Exception as e:
                                                         logger.debug(f"Error using decrypted payload: {e}")
 